@@ -0,0 +1,227 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Generates synthetic sensor YAML files that follow config/sensor_schema.yaml.
+
+Usage:
+    python benchmarks/generate_catalog.py OUTPUT_DIR --count 10000 --seed 0
+"""
+
+import argparse
+import os
+
+import numpy as np
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
+
+# (value, relative frequency) pairs
+SENSOR_TYPES = [
+    ("Depth Camera", 0.25),
+    ("Stereo Camera", 0.2),
+    ("RGB Camera", 0.15),
+    ("Structured Light Camera", 0.15),
+    ("Time-of-Flight Camera", 0.1),
+    ("LiDAR", 0.08),
+    ("Infrared Camera", 0.04),
+    ("Thermal Camera", 0.03),
+]
+
+MANUFACTURERS = [
+    "Intel",
+    "StereoLabs",
+    "Mech-Mind",
+    "IDS",
+    "Zivid",
+    "Orbbec",
+    "Basler",
+    "Luxonis",
+    "Photoneo",
+    "Ouster",
+]
+
+RGB_RESOLUTIONS = [
+    ((640, 480), 0.1),
+    ((1280, 720), 0.2),
+    ((1280, 800), 0.1),
+    ((1920, 1080), 0.3),
+    ((1920, 1200), 0.1),
+    ((2448, 2048), 0.1),
+    ((3840, 2160), 0.1),
+]
+DEPTH_RESOLUTIONS = [
+    ((320, 240), 0.1),
+    ((640, 480), 0.35),
+    ((848, 480), 0.1),
+    ((1280, 720), 0.3),
+    ((2048, 1536), 0.15),
+]
+FRAME_RATES = [(5.0, 0.05), (10.0, 0.1), (15.0, 0.15), (30.0, 0.4), (60.0, 0.15)]
+FRAME_RATES += [(90.0, 0.1), (120.0, 0.05)]
+
+INTERFACES = ["USB 2.0", "USB 3.0", "Gigabit Ethernet", "Ethernet", "Wi-Fi", "CAN"]
+INTERFACE_WEIGHTS = [0.05, 0.45, 0.35, 0.1, 0.03, 0.02]
+RATINGS = ["None", "IP65", "IP66", "IP67", "IP68"]
+RATING_WEIGHTS = [0.5, 0.2, 0.1, 0.15, 0.05]
+PLATFORMS = ["Linux", "Windows", "macOS", "Other"]
+TAGS = ["indoor", "outdoor", "industrial", "mobile robotics", "rugged", "compact"]
+USE_CASES = ["SLAM", "Bin Picking", "Inspection", "Navigation", "3D Scanning"]
+
+
+def _choice(rng, weighted):
+    """Picks a value from a list of (value, relative frequency) pairs."""
+    values, weights = zip(*weighted)
+    weights = np.asarray(weights, dtype=float)
+    return values[rng.choice(len(values), p=weights / weights.sum())]
+
+
+def _sample(rng, values, max_count):
+    """Picks between 1 and `max_count` distinct values, in sorted order."""
+    count = rng.integers(1, max_count + 1)
+    return sorted(rng.choice(values, size=count, replace=False).tolist())
+
+
+def _maybe(rng, probability):
+    """Returns True with the given probability, used to leave fields out."""
+    return rng.random() < probability
+
+
+def make_sensor(rng, index):
+    """Builds one synthetic sensor entry as a dictionary."""
+    manufacturer = MANUFACTURERS[rng.integers(len(MANUFACTURERS))]
+    sensor_type = _choice(rng, SENSOR_TYPES)
+    sensor = {
+        "schema_version": "1.0",
+        "sensor_id": f"{manufacturer.lower().replace('-', '_')}_synthetic_{index:06d}",
+        "sensor_type": sensor_type,
+        "manufacturer": manufacturer,
+        "model": f"Synthetic {index:06d}",
+    }
+
+    resolution = {}
+    if sensor_type != "LiDAR" and _maybe(rng, 0.9):
+        width, height = _choice(rng, RGB_RESOLUTIONS)
+        resolution["rgb"] = {"width": width, "height": height}
+    if sensor_type not in ("RGB Camera", "Thermal Camera") and _maybe(rng, 0.85):
+        width, height = _choice(rng, DEPTH_RESOLUTIONS)
+        resolution["depth"] = {"width": width, "height": height}
+    if _maybe(rng, 0.3):
+        width, height = _choice(rng, DEPTH_RESOLUTIONS)
+        resolution["ir"] = {"width": width, "height": height}
+    if resolution:
+        sensor["resolution"] = resolution
+
+    if _maybe(rng, 0.9):
+        horizontal = float(np.clip(rng.normal(75.0, 20.0), 20.0, 360.0))
+        vertical = float(np.clip(horizontal * rng.uniform(0.55, 0.8), 10.0, 180.0))
+        fov = {"horizontal": round(horizontal, 1), "vertical": round(vertical, 1)}
+        if _maybe(rng, 0.6):
+            fov["diagonal"] = round(float(np.hypot(horizontal, vertical)), 1)
+        sensor["field_of_view"] = fov
+
+    min_range = float(rng.lognormal(np.log(0.3), 0.6))
+    if _maybe(rng, 0.9):
+        sensor["min_range"] = round(min_range, 2)
+    if _maybe(rng, 0.9):
+        sensor["max_range"] = round(
+            min_range * float(rng.lognormal(np.log(15), 0.8)), 2
+        )
+
+    if _maybe(rng, 0.95):
+        sensor["frame_rate"] = _choice(rng, FRAME_RATES)
+        sensor["frame_rate_unit"] = "FPS"
+    if _maybe(rng, 0.6):
+        sensor["latency"] = round(float(rng.gamma(4.0, 15.0)), 1)
+        sensor["latency_unit"] = "ms"
+
+    sensor["environmental_rating"] = RATINGS[rng.choice(len(RATINGS), p=RATING_WEIGHTS)]
+    sensor["communication_interface"] = INTERFACES[
+        rng.choice(len(INTERFACES), p=INTERFACE_WEIGHTS)
+    ]
+
+    ros = [version for version in ("ROS1", "ROS2") if _maybe(rng, 0.6)]
+    if ros:
+        sensor["ros_compatibility"] = ros
+
+    sensor["tags"] = _sample(rng, TAGS, 3)
+    sensor["use_cases"] = _sample(rng, USE_CASES, 3)
+    sensor["key_features"] = [f"Synthetic feature {i + 1}" for i in range(3)]
+
+    if _maybe(rng, 0.8):
+        price = float(rng.lognormal(np.log(1500), 0.9))
+        sensor["price_range"] = {
+            "min_price": round(price * 0.9, 2),
+            "max_price": round(price * 1.1, 2),
+            "currency": "USD",
+        }
+
+    sensor["supported_platforms"] = _sample(rng, PLATFORMS, 2)
+
+    if _maybe(rng, 0.75):
+        sensor["power_consumption"] = round(float(rng.lognormal(np.log(5), 0.7)), 2)
+        sensor["power_consumption_unit"] = "W"
+    if _maybe(rng, 0.7):
+        length = float(rng.uniform(40, 300))
+        sensor["size"] = {
+            "length": round(length, 1),
+            "width": round(length * float(rng.uniform(0.2, 0.6)), 1),
+            "height": round(length * float(rng.uniform(0.2, 0.6)), 1),
+            "unit": "mm",
+        }
+    if _maybe(rng, 0.8):
+        sensor["weight"] = round(float(rng.lognormal(np.log(400), 0.8)), 1)
+        sensor["weight_unit"] = "g"
+
+    sensor["notes"] = "Synthetic sensor generated for benchmarking."
+    return sensor
+
+
+def generate_catalog(output_dir, count, seed=0):
+    """Writes `count` synthetic sensor YAML files below `output_dir`.
+
+    Files are grouped by manufacturer like the real `sensors/cameras` tree.
+
+    Returns:
+        list: Paths of the written files.
+    """
+    rng = np.random.default_rng(seed)
+    paths = []
+    for index in range(count):
+        sensor = make_sensor(rng, index)
+        directory = os.path.join(
+            output_dir, "cameras", sensor["manufacturer"].lower().replace("-", "_")
+        )
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{sensor['sensor_id']}.yaml")
+        with open(path, "w") as f:
+            yaml.dump(sensor, f, Dumper=SafeDumper, sort_keys=False)
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output_dir", help="Directory to write the sensor files to")
+    parser.add_argument("--count", type=int, default=1000, help="Number of sensors")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    paths = generate_catalog(args.output_dir, args.count, args.seed)
+    print(f"Wrote {len(paths)} sensor files to {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Times the main pipeline stages on synthetic catalogs and checks for regressions.
+
+Usage:
+    python benchmarks/run_benchmarks.py --sizes 1000 10000
+    python benchmarks/run_benchmarks.py --update_baseline
+
+Each stage is timed on a generated catalog of every requested size and
+compared against benchmarks/baselines.json. A stage that is more than
+`--threshold` times slower than its baseline fails the run.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+from generate_catalog import generate_catalog  # noqa: E402
+from sensor_tool import utils  # noqa: E402
+from sensor_tool.catalog import SensorCatalog  # noqa: E402
+from sensor_tool.export_sensors import export_sensors  # noqa: E402
+from sensor_tool.visualize import plot_heatmap  # noqa: E402
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "baselines.json")
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+SCORE_ATTRIBUTES = ["resolution_rgb", "frame_rate", "latency", "max_range"]
+RENDER_ATTRIBUTES = SCORE_ATTRIBUTES + ["field_of_view", "price_avg", "weight"]
+PARETO_ATTRIBUTES = SCORE_ATTRIBUTES + [
+    "resolution_depth",
+    "min_range",
+    "field_of_view",
+    "price_avg",
+]
+
+# Stages that take longer than this are only run once
+SINGLE_RUN_SECONDS = 5.0
+
+
+def time_stage(function, repeat):
+    """Returns the best wall time of `function` over up to `repeat` runs."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        if elapsed > SINGLE_RUN_SECONDS:
+            break
+    return best
+
+
+def stage_validate(catalog):
+    """Validates every sensor file, or returns the reason it cannot run."""
+    import yamale
+    from sensor_tool.validate_sensors import get_schema_path, validate_sensor
+
+    try:
+        schema = yamale.make_schema(get_schema_path())
+    except Exception as e:
+        return f"schema could not be loaded: {e}"
+
+    def run():
+        for path in catalog.data_loader.iter_sensor_files():
+            validate_sensor(path, schema)
+
+    return run
+
+
+def stage_render(catalog):
+    data = catalog.data
+    names = data["sensor_id"].tolist()
+
+    def run():
+        normalized = utils.normalize_attributes(data, RENDER_ATTRIBUTES)
+        fig, ax = plt.subplots(figsize=(14, 8))
+        plot_heatmap(ax, names, RENDER_ATTRIBUTES, normalized)
+        fig.savefig(os.path.join(tempfile.gettempdir(), "benchmark_heatmap.png"))
+        plt.close(fig)
+
+    return run
+
+
+def benchmark_size(size, workdir, repeat):
+    """Times every stage on a catalog of `size` sensors."""
+    catalog_dir = os.path.join(workdir, str(size), "sensors")
+    if not os.path.isdir(catalog_dir):
+        start = time.perf_counter()
+        generate_catalog(catalog_dir, size)
+        print(f"  generated {size} sensors in {time.perf_counter() - start:.1f} s")
+
+    catalog = SensorCatalog(catalog_dir)
+    results = {}
+
+    def load():
+        catalog._snapshot = None
+        catalog._records.clear()
+        catalog.refresh()
+
+    results["load"] = time_stage(load, repeat)
+
+    validate = stage_validate(catalog)
+    if callable(validate):
+        results["validate"] = time_stage(validate, repeat)
+    else:
+        print(f"  skipping validate: {validate}")
+
+    results["filter"] = time_stage(
+        lambda: catalog.filter(
+            sensor_type="Depth Camera", min_frame_rate=30, max_price=2000
+        ),
+        repeat,
+    )
+    results["score"] = time_stage(
+        lambda: catalog.rank(SCORE_ATTRIBUTES, top=10), repeat
+    )
+    results["pareto"] = time_stage(lambda: catalog.pareto(PARETO_ATTRIBUTES), repeat)
+    results["render"] = time_stage(stage_render(catalog), repeat)
+
+    export_path = os.path.join(workdir, f"export_{size}.csv")
+    cwd = os.getcwd()
+    os.chdir(os.path.dirname(catalog_dir))
+    try:
+        results["export"] = time_stage(lambda: export_sensors(export_path), repeat)
+    finally:
+        os.chdir(cwd)
+
+    for stage, seconds in results.items():
+        print(f"  {stage:<10} {seconds * 1000:10.1f} ms")
+    return results
+
+
+def compare_to_baseline(results, baseline, threshold):
+    """Returns a list of regression messages for stages slower than allowed."""
+    regressions = []
+    for size, stages in results.items():
+        for stage, seconds in stages.items():
+            reference = baseline.get(size, {}).get(stage)
+            if reference is None:
+                continue
+            ratio = seconds / reference if reference > 0 else float("inf")
+            if ratio > threshold:
+                regressions.append(
+                    f"{stage} at {size} sensors: {seconds * 1000:.1f} ms vs "
+                    f"baseline {reference * 1000:.1f} ms ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=DEFAULT_SIZES,
+        help="Catalog sizes to benchmark (default: 1000 10000 100000)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per stage; the best is kept"
+    )
+    parser.add_argument(
+        "--workdir",
+        help="Directory for generated catalogs, reused between runs "
+        "(default: a temporary directory)",
+    )
+    parser.add_argument(
+        "--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.5,
+        help="Maximum allowed slowdown relative to the baseline (default: 1.5)",
+    )
+    parser.add_argument(
+        "--update_baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of comparing",
+    )
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workdir = args.workdir or tmpdir
+        results = {}
+        for size in args.sizes:
+            print(f"Benchmarking {size} sensors")
+            results[str(size)] = benchmark_size(size, workdir, args.repeat)
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.setdefault("results", {}).update(results)
+        baseline.update(python=report["python"], machine=report["machine"])
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2)
+            f.write("\n")
+        print(f"Baseline updated: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update_baseline first.")
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare_to_baseline(results, baseline["results"], args.threshold)
+    if regressions:
+        print("Performance regressions:")
+        for message in regressions:
+            print(f"  {message}")
+        sys.exit(1)
+    print(f"No stage is more than {args.threshold}x slower than the baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,20 +12,52 @@
 
 # sensor_tool/__init__.py
 
-from .gui import main as gui_main
-from .cli import main as cli_main
-from .data_loader import DataLoader
-from .filter_sensors import filter_sensors
-from .validate_sensors import validate_sensors_main
-from .visualize import visualize_comparison
-from . import utils
-
-__all__ = [
-    "gui_main",
-    "cli_main",
-    "DataLoader",
-    "filter_sensors",
-    "validate_sensors_main",
-    "visualize_comparison",
-    "utils",
-]
+import importlib
+import sys
+import types
+
+# Submodules are imported on first attribute access so that importing the
+# package (e.g. for the CLI) does not pull in pandas, matplotlib or Tk.
+_LAZY_ATTRIBUTES = {
+    "gui_main": (".gui", "main"),
+    "cli_main": (".cli", "main"),
+    "DataLoader": (".data_loader", "DataLoader"),
+    "filter_sensors": (".filter_sensors", "filter_sensors"),
+    "export_sensors": (".export_sensors", "export_sensors"),
+    "validate_sensors_main": (".validate_sensors", "validate_sensors_main"),
+    "visualize_comparison": (".visualize", "visualize_comparison"),
+    "utils": (".utils", None),
+    "profiling": (".profiling", None),
+    "CompactCatalog": (".compact", "CompactCatalog"),
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+# Functions named after the submodule they live in.
+_SHADOWED_SUBMODULES = ("filter_sensors", "export_sensors")
+
+
+class _Package(types.ModuleType):
+    def __setattr__(self, name, value):
+        # Importing a submodule binds it onto the package, which would hide
+        # the function of the same name from `__getattr__` from then on.
+        if name in _SHADOWED_SUBMODULES and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    module = importlib.import_module(module_name, __name__)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,91 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+from .catalog import SensorCatalog, error_message, run_query
+
+
+def run_job(catalog, line_number, line):
+    """Runs one JSON job line and returns its result record.
+
+    A job is an object with a `command` from `catalog.QUERY_COMMANDS`, an
+    optional `id` (defaults to the line number) and the command's arguments,
+    e.g. {"id": "d435", "command": "filter", "manufacturer": "Intel"}.
+    Errors are captured in the result instead of being raised.
+    """
+    job_id = line_number
+    start = time.perf_counter()
+    try:
+        job = json.loads(line)
+        if not isinstance(job, dict):
+            raise ValueError("A job must be a JSON object.")
+        job_id = job.pop("id", line_number)
+        command = job.pop("command", None)
+        if command is None:
+            raise ValueError("Missing 'command'.")
+        result = {"id": job_id, "ok": True, "result": run_query(catalog, command, job)}
+    except Exception as e:
+        result = {"id": job_id, "ok": False, "error": error_message(e)}
+    result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return result
+
+
+def iter_jobs(jobs_file):
+    for line_number, line in enumerate(jobs_file, start=1):
+        if line.strip():
+            yield line_number, line
+
+
+def run_batch(jobs_path, output_path=None, workers=4, sensors_directory="sensors"):
+    """Runs every job of a JSON Lines file against a catalog loaded once.
+
+    Args:
+        jobs_path (str): JSON Lines file of jobs, or '-' for stdin.
+        output_path (str, optional): File for the JSON Lines results, written
+            in job order. Defaults to stdout.
+        workers (int, optional): Number of worker threads.
+        sensors_directory (str, optional): Directory with the sensor YAML files.
+
+    Returns:
+        tuple: The number of succeeded and failed jobs.
+    """
+    catalog = SensorCatalog(sensors_directory)
+    catalog.refresh()
+
+    succeeded = failed = 0
+    jobs_context = open(jobs_path) if jobs_path != "-" else nullcontext(sys.stdin)
+    output_context = (
+        open(output_path, "w")
+        if output_path and output_path != "-"
+        else nullcontext(sys.stdout)
+    )
+    with jobs_context as jobs_file, output_context as output_file:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda job: run_job(catalog, *job), iter_jobs(jobs_file)
+            )
+            for result in results:
+                if result["ok"]:
+                    succeeded += 1
+                else:
+                    failed += 1
+                    logging.warning(f"Job {result['id']} failed: {result['error']}")
+                output_file.write(json.dumps(result) + "\n")
+
+    logging.info(f"Batch finished: {succeeded} succeeded, {failed} failed")
+    return succeeded, failed
@@ -0,0 +1,707 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import threading
+import time
+import yaml
+import numpy as np
+import pandas as pd
+
+from .coverage import (
+    SPEC_KEYS,
+    blind_spots,
+    parse_workspace,
+    rotation_matrix,
+    visibility_counts,
+)
+from .data_loader import DataLoader
+from .filter_sensors import apply_filters
+from .optimizer import MAX_NODES, optimize
+from .rig import bus_loads, evaluate_rigs, stream_rates
+from .search_index import SensorIdIndex
+from .similarity import SIMILARITY_FEATURES, KDTree, feature_matrix
+from .skyline import pareto_front
+from .spatial import image_sizes, range_grid, spatial_resolution
+from .units import ORIGINAL_COLUMNS
+from . import utils
+
+# All numeric attributes that are precomputed when the catalog is built.
+CATALOG_ATTRIBUTES = utils.NUMERIC_ATTRIBUTES + utils.COMPUTED_ATTRIBUTES
+
+# Columns that queries rely on, even if no sensor file defines them.
+REQUIRED_COLUMNS = [
+    "sensor_id",
+    "sensor_type",
+    "manufacturer",
+    "model",
+    "resolution",
+    "field_of_view",
+    "price_range",
+    "ros_compatibility",
+    "communication_interface",
+] + utils.NUMERIC_ATTRIBUTES
+
+QUERY_COMMANDS = [
+    "filter",
+    "search",
+    "suggest",
+    "score",
+    "compare",
+    "rank",
+    "pareto",
+    "similar",
+    "spatial",
+    "rig",
+    "rigs",
+    "coverage",
+    "optimize",
+]
+
+
+def frame_to_records(df):
+    """Converts a DataFrame to JSON-safe records, with NaN mapped to None."""
+    return json.loads(df.to_json(orient="records"))
+
+
+def error_message(error):
+    """Returns a readable message, without the quotes `str` adds to KeyErrors."""
+    if isinstance(error, KeyError) and error.args:
+        return str(error.args[0])
+    return str(error)
+
+
+def run_query(catalog, command, payload):
+    """Runs a JSON-style query against the catalog.
+
+    Args:
+        catalog (SensorCatalog): The catalog to query.
+        command (str): One of `QUERY_COMMANDS`.
+        payload (dict): Keyword arguments of the matching catalog method.
+            `filter` also accepts a `columns` list.
+
+    Returns:
+        dict: A JSON-serializable result.
+
+    Raises:
+        KeyError, ValueError, TypeError: If the query is invalid.
+    """
+    payload = dict(payload)
+    if command == "filter":
+        columns = payload.pop("columns", None)
+        df = catalog.filter(**payload)
+        return {"sensors": frame_to_records(df[columns] if columns else df)}
+    elif command == "search":
+        return {"sensors": frame_to_records(catalog.search(**payload))}
+    elif command == "suggest":
+        return {"sensor_ids": catalog.suggest(**payload)}
+    elif command == "score":
+        return {"scores": catalog.score(**payload)}
+    elif command == "compare":
+        return {"sensors": frame_to_records(catalog.compare(**payload))}
+    elif command == "rank":
+        return {"sensors": frame_to_records(catalog.rank(**payload))}
+    elif command == "pareto":
+        return {"sensors": frame_to_records(catalog.pareto(**payload))}
+    elif command == "similar":
+        return {"sensors": frame_to_records(catalog.similar(**payload))}
+    elif command == "spatial":
+        return {"sensors": frame_to_records(catalog.spatial(**payload))}
+    elif command == "rig":
+        rates, buses = catalog.rig(**payload)
+        return {"sensors": frame_to_records(rates), "buses": frame_to_records(buses)}
+    elif command == "rigs":
+        rigs, feasible, total = catalog.rigs(**payload)
+        return {"rigs": frame_to_records(rigs), "feasible": feasible, "total": total}
+    elif command == "coverage":
+        summary, sensors, spots = catalog.coverage(**payload)
+        return {
+            "summary": summary,
+            "sensors": frame_to_records(sensors),
+            "blind_spots": frame_to_records(spots),
+        }
+    elif command == "optimize":
+        rigs, summary = catalog.optimize(**payload)
+        return {"rigs": frame_to_records(rigs), "summary": summary}
+    raise ValueError(
+        f"Unknown command '{command}'. Choose from {', '.join(QUERY_COMMANDS)}."
+    )
+
+
+class CatalogSnapshot:
+    """
+    One version of the preprocessed data and the indexes built from it.
+
+    `SensorCatalog.refresh` publishes a new snapshot with a single
+    assignment and never modifies an old one. A query that reads the
+    snapshot once therefore never mixes data and indexes of different
+    versions, even while another thread refreshes. The ID index and the
+    similarity indexes are built on first use and cached per snapshot.
+    """
+
+    def __init__(self, df, version):
+        self.df = df
+        self.version = version
+        self.by_id = df.set_index("sensor_id", drop=False)
+        self.search_text = (
+            df["sensor_id"].fillna("")
+            + " "
+            + df["manufacturer"].fillna("")
+            + " "
+            + df["model"].fillna("")
+        ).str.lower()
+        self._id_index = None
+        self._similarity = {}
+        self._lock = threading.Lock()
+
+    @property
+    def id_index(self):
+        """The `SensorIdIndex` of the data, built on first use."""
+        with self._lock:
+            if self._id_index is None:
+                self._id_index = SensorIdIndex(self.df)
+            return self._id_index
+
+    def similarity_index(self, attributes):
+        """Returns the feature matrix and KD-tree of `attributes`."""
+        key = tuple(attributes)
+        with self._lock:
+            if key not in self._similarity:
+                points = feature_matrix(self.df, attributes)
+                self._similarity[key] = (points, KDTree(points))
+            return self._similarity[key]
+
+
+class SensorCatalog:
+    """
+    Keeps the preprocessed sensor data in memory for repeated queries.
+
+    Files are tracked by modification time, so `refresh` only re-parses the
+    YAML files that were added or changed since the last load.
+    """
+
+    def __init__(self, sensors_directory="sensors", refresh_interval=2.0):
+        self.data_loader = DataLoader(sensors_directory)
+        self.refresh_interval = refresh_interval
+        self.version = 0
+        self._records = {}
+        self._snapshot = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def snapshot(self):
+        """The current `CatalogSnapshot`, loading the data on first access.
+
+        Queries read it once and use only that snapshot, so a concurrent
+        `refresh` cannot pair the data with indexes of another version.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            self.refresh()
+            snapshot = self._snapshot
+        return snapshot
+
+    @property
+    def data(self):
+        """The preprocessed DataFrame of the current snapshot.
+
+        Use `snapshot` instead when the data and its indexes are needed
+        together, since the two reads may see different versions.
+        """
+        return self.snapshot.df
+
+    def refresh(self):
+        """Re-parses new or modified sensor files.
+
+        Returns:
+            bool: True if the catalog contents changed.
+        """
+        with self._lock:
+            self._last_check = time.monotonic()
+            seen = set()
+            changed = False
+            for path in self.data_loader.iter_sensor_files():
+                seen.add(path)
+                mtime = os.stat(path).st_mtime_ns
+                cached = self._records.get(path)
+                if cached is not None and cached[0] == mtime:
+                    continue
+                with open(path, "r") as f:
+                    self._records[path] = (mtime, yaml.safe_load(f))
+                changed = True
+            for path in set(self._records) - seen:
+                del self._records[path]
+                changed = True
+
+            if changed or self._snapshot is None:
+                df = pd.DataFrame([sensor for _, sensor in self._records.values()])
+                for column in REQUIRED_COLUMNS:
+                    if column not in df.columns:
+                        df[column] = pd.Series(dtype=object)
+                df = utils.preprocess_attributes(df, CATALOG_ATTRIBUTES)
+                self._snapshot = CatalogSnapshot(df, self.version + 1)
+                self.version = self._snapshot.version
+            return changed
+
+    def refresh_if_stale(self):
+        """Calls `refresh` at most once per `refresh_interval` seconds."""
+        if time.monotonic() - self._last_check >= self.refresh_interval:
+            return self.refresh()
+        return False
+
+    @property
+    def sensor_ids(self):
+        return self.data["sensor_id"].tolist()
+
+    @property
+    def id_index(self):
+        """The `SensorIdIndex` of the current snapshot, built on first use."""
+        return self.snapshot.id_index
+
+    @property
+    def attributes(self):
+        """Names of the numeric attributes available for scoring."""
+        return list(CATALOG_ATTRIBUTES)
+
+    def filter(self, **criteria):
+        """Returns the sensors matching the `apply_filters` criteria."""
+        return apply_filters(self.data, **criteria)
+
+    def search(self, query, limit=10):
+        """Finds sensors whose ID, manufacturer or model contain `query`.
+
+        Exact ID matches rank first, then prefix matches, then other matches.
+        """
+        query = query.strip().lower()
+        snapshot = self.snapshot
+        df = snapshot.df
+        matches = df[snapshot.search_text.str.contains(query, regex=False)]
+        sensor_ids = matches["sensor_id"].str.lower()
+        rank = (sensor_ids != query).astype(int) + (
+            ~sensor_ids.str.startswith(query)
+        ).astype(int)
+        ranked = matches.assign(_rank=rank).sort_values(["_rank", "sensor_id"])
+        return ranked.head(limit).drop(columns="_rank")
+
+    def suggest(self, query, limit=5):
+        """Returns sensor IDs for a possibly misspelled or partial `query`.
+
+        See `SensorIdIndex.suggest`.
+        """
+        return self.id_index.suggest(query, limit)
+
+    def resolve(self, sensor_ids, snapshot=None):
+        """Returns the catalog IDs of possibly inexact `sensor_ids`, in order.
+
+        IDs that are not in the catalog go through `SensorIdIndex.resolve`,
+        so an ID in another case or with other separators is accepted.
+
+        Raises:
+            KeyError: If any of the sensor IDs is unknown, with suggestions.
+        """
+        snapshot = snapshot or self.snapshot
+        if all(sid in snapshot.by_id.index for sid in sensor_ids):
+            return list(sensor_ids)
+        return snapshot.id_index.resolve_all(sensor_ids)
+
+    def select(self, sensor_ids, snapshot=None):
+        """Returns the rows for `sensor_ids`, in the given order.
+
+        Raises:
+            KeyError: If any of the sensor IDs is unknown, see `resolve`.
+        """
+        snapshot = snapshot or self.snapshot
+        sensor_ids = self.resolve(sensor_ids, snapshot)
+        return snapshot.by_id.loc[sensor_ids].reset_index(drop=True)
+
+    def score(self, sensor_ids, attributes, weights=None):
+        """Scores the given sensors against each other like `calculate_score`.
+
+        Returns:
+            dict: Sensor ID to score out of 10.
+        """
+        return self._score(self.select(sensor_ids), attributes, weights)
+
+    @staticmethod
+    def _score(selected, attributes, weights):
+        if weights is None:
+            weights = [1.0] * len(attributes)
+        if len(weights) != len(attributes):
+            raise ValueError("Number of weights must match the number of attributes.")
+        unknown = [attr for attr in attributes if attr not in selected.columns]
+        if unknown:
+            raise KeyError(f"Attribute {', '.join(unknown)} not found in data.")
+        normalized = utils.normalize_attributes(selected, attributes)
+        scores = utils.calculate_scores_vectorized(normalized, weights)
+        return dict(zip(selected["sensor_id"], scores.tolist()))
+
+    def compare(self, sensor_ids, attributes, weights=None):
+        """Returns the attribute values and scores of the given sensors.
+
+        Each converted attribute is followed by its value and unit as given,
+        see `units.ORIGINAL_COLUMNS`.
+        """
+        selected = self.select(sensor_ids)
+        scores = self._score(selected, attributes, weights)
+        columns = ["sensor_id"]
+        for attr in attributes:
+            columns += [attr, *ORIGINAL_COLUMNS.get(attr, ())]
+        comparison = selected[columns]
+        return comparison.assign(score=comparison["sensor_id"].map(scores))
+
+    def rank(self, attributes, weights=None, top=10, breakdown=False, **criteria):
+        """Scores every sensor matching `criteria` and returns the best `top`.
+
+        Scores are normalized over the matching sensors, like `calculate_score`.
+        With `breakdown`, a `<attribute>_contribution` column per attribute
+        shows how many of the score's points it contributed.
+        """
+        candidates = self.filter(**criteria)
+        if weights is None:
+            weights = [1.0] * len(attributes)
+        if len(weights) != len(attributes):
+            raise ValueError("Number of weights must match the number of attributes.")
+        unknown = [attr for attr in attributes if attr not in candidates.columns]
+        if unknown:
+            raise KeyError(f"Attribute {', '.join(unknown)} not found in data.")
+        normalized = utils.normalize_attributes(candidates, attributes)
+        scores = utils.calculate_scores_vectorized(normalized, weights)
+        best = utils.top_k_indices(scores, top)
+        ranked = candidates.iloc[best][["sensor_id"] + list(attributes)]
+        ranked = ranked.assign(score=scores[best])
+        if breakdown:
+            contributions = utils.score_contributions(normalized[best], weights)
+            for j, attr in enumerate(attributes):
+                ranked[f"{attr}_contribution"] = contributions[:, j]
+        return ranked
+
+    def pareto(self, attributes, drop_missing=False, **criteria):
+        """Returns the sensors matching `criteria` that no other one dominates.
+
+        See `skyline.pareto_front` for how directions and missing values are
+        handled. The front is sorted by the first attribute, best first.
+        """
+        candidates = self.filter(**criteria)
+        mask = pareto_front(candidates, attributes, drop_missing)
+        front = candidates.loc[mask, ["sensor_id"] + list(attributes)]
+        return front.sort_values(
+            list(attributes),
+            ascending=[not utils.is_higher_better(attr) for attr in attributes],
+            na_position="last",
+            kind="stable",
+        )
+
+    def similar(self, sensor_id, k=5, attributes=None, weights=None, **criteria):
+        """Returns the `k` sensors whose specs are closest to `sensor_id`'s.
+
+        Attributes are scaled to [0, 1] over the whole catalog, see
+        `similarity.feature_matrix`, and compared with `masked_distances`,
+        so missing values are skipped. Only sensors matching `criteria` are
+        returned, nearest first.
+
+        Raises:
+            KeyError: If the sensor or an attribute is unknown.
+            ValueError: If the number of weights does not match.
+        """
+        attributes = list(attributes or SIMILARITY_FEATURES)
+        if weights is None:
+            weights = [1.0] * len(attributes)
+        if len(weights) != len(attributes):
+            raise ValueError("Number of weights must match the number of attributes.")
+        snapshot = self.snapshot
+        (sensor_id,) = self.resolve([sensor_id], snapshot)
+        df = snapshot.df
+        unknown = [attr for attr in attributes if attr not in df.columns]
+        if unknown:
+            raise KeyError(f"Attribute {', '.join(unknown)} not found in data.")
+
+        points, tree = snapshot.similarity_index(attributes)
+        positions = np.arange(len(df))[snapshot.by_id.index.get_loc(sensor_id)]
+        allowed = df.index.isin(apply_filters(df, **criteria).index)
+        allowed[positions] = False
+        query = points[np.atleast_1d(positions)[0]]
+        rows, distances = tree.query(query, k, weights, allowed)
+        columns = df.columns.get_indexer(["sensor_id"] + attributes)
+        return df.iloc[rows, columns].assign(distance=distances)
+
+    def spatial(self, sensor_ids, distances=None, steps=5):
+        """Evaluates the spatial resolution of sensors at several distances.
+
+        By default each sensor is evaluated at `steps` distances from its
+        minimum to its maximum range, see `spatial.range_grid`. Given
+        `distances` are used for every sensor instead.
+
+        Returns:
+            pandas.DataFrame: One row per sensor and distance, with
+            `sensor_id`, `distance_m`, `in_range`, `pixels_per_degree`,
+            `mm_per_pixel` and `points_per_m2`.
+
+        Raises:
+            KeyError: If a sensor is unknown.
+            ValueError: If there are fewer than 2 steps or a distance is not
+                positive.
+        """
+        selected = self.select(sensor_ids)
+        min_range = selected["min_range"].to_numpy(dtype=float)
+        max_range = selected["max_range"].to_numpy(dtype=float)
+        if distances is None:
+            if steps < 2:
+                raise ValueError("Use at least 2 steps.")
+            grid = range_grid(min_range, max_range, steps)
+        else:
+            if not distances or any(distance <= 0 for distance in distances):
+                raise ValueError("Distances must be positive.")
+            grid = np.tile(np.asarray(distances, dtype=float), (len(selected), 1))
+        width, height = image_sizes(selected["resolution"].tolist())
+        metrics = spatial_resolution(
+            width,
+            height,
+            selected["horizontal_fov"].to_numpy(dtype=float),
+            selected["vertical_fov"].to_numpy(dtype=float),
+            grid,
+        )
+        count = grid.shape[1]
+        with np.errstate(invalid="ignore"):
+            in_range = (grid >= min_range[:, None]) & (grid <= max_range[:, None])
+        return pd.DataFrame(
+            {
+                "sensor_id": np.repeat(selected["sensor_id"].to_numpy(), count),
+                "distance_m": grid.ravel(),
+                "in_range": in_range.ravel(),
+                "pixels_per_degree": np.repeat(metrics["pixels_per_degree"], count),
+                "mm_per_pixel": metrics["mm_per_pixel"].ravel(),
+                "points_per_m2": metrics["points_per_m2"].ravel(),
+            }
+        )
+
+    def rig(
+        self,
+        sensor_ids,
+        bit_depth=None,
+        compression=None,
+        ports=None,
+        max_utilization=1.0,
+    ):
+        """Estimates the data rates of a rig and the load on each bus.
+
+        A sensor ID may be given several times for several identical cameras.
+        See `rig.stream_settings` and `rig.bus_capacities` for the options.
+
+        Returns:
+            tuple: Per-sensor stream rates and per-bus loads, as DataFrames.
+        """
+        rates = stream_rates(self.select(sensor_ids), bit_depth, compression)
+        return rates, bus_loads(rates, ports, max_utilization)
+
+    def rigs(
+        self,
+        k,
+        top=20,
+        bit_depth=None,
+        compression=None,
+        ports=None,
+        max_utilization=1.0,
+        repeat=False,
+        **criteria,
+    ):
+        """Evaluates every rig of `k` sensors matching `criteria`.
+
+        Returns:
+            tuple: The `top` cheapest rigs that fit the buses, as a DataFrame,
+            the number of rigs that fit and the number evaluated.
+
+        Raises:
+            ValueError: If an option is invalid or there are too many rigs.
+        """
+        if k <= 0:
+            raise ValueError("Rig size must be positive.")
+        if max_utilization <= 0:
+            raise ValueError("Maximum utilization must be positive.")
+        candidates = self.filter(**criteria)
+        rates = stream_rates(candidates, bit_depth, compression)
+        return evaluate_rigs(
+            rates,
+            k,
+            ports,
+            max_utilization,
+            repeat,
+            prices=candidates["price_avg"],
+            top=top,
+        )
+
+    def optimize(
+        self,
+        attributes,
+        weights=None,
+        budgets=None,
+        max_sensors=None,
+        top=5,
+        workers=1,
+        max_nodes=MAX_NODES,
+        **criteria,
+    ):
+        """Finds the sets of sensors with the highest total score in budget.
+
+        Sensors matching `criteria` are scored like in `rank`, and a rig is
+        worth the sum of its sensors' scores. See `optimizer.optimize` for
+        the search.
+
+        Args:
+            attributes (list): Attributes to score the sensors on.
+            weights (list, optional): Weight of each attribute.
+            budgets (dict, optional): Limit on the rig total of numeric
+                attributes, e.g. {"price_avg": 3000, "weight": 1500}.
+                Sensors missing a budgeted attribute are left out.
+            max_sensors (int, optional): Largest number of sensors in a rig.
+            top (int): Number of rigs to return.
+            workers (int): Number of processes searching in parallel.
+            max_nodes (int): Search nodes to expand before stopping.
+
+        Returns:
+            tuple: The best rigs as a DataFrame, and a summary dict with the
+            `upper_bound` on the best total score and the `gap` to it, 0
+            when the best rig is proven optimal.
+
+        Raises:
+            KeyError: If an attribute is unknown.
+            ValueError: If no limit is given or a limit is not positive.
+        """
+        budgets = dict(budgets or {})
+        if not budgets and not max_sensors:
+            raise ValueError("Give at least one budget or a maximum rig size.")
+        if any(limit <= 0 for limit in budgets.values()):
+            raise ValueError("Budgets must be positive.")
+        if max_sensors is not None and max_sensors <= 0:
+            raise ValueError("Maximum rig size must be positive.")
+        if top <= 0 or workers <= 0:
+            raise ValueError("Top and workers must be positive.")
+        candidates = self.filter(**criteria)
+        if weights is None:
+            weights = [1.0] * len(attributes)
+        if len(weights) != len(attributes):
+            raise ValueError("Number of weights must match the number of attributes.")
+        unknown = [
+            attr
+            for attr in list(attributes) + list(budgets)
+            if attr not in candidates.columns
+        ]
+        if unknown:
+            raise KeyError(f"Attribute {', '.join(unknown)} not found in data.")
+        normalized = utils.normalize_attributes(candidates, attributes)
+        scores = utils.calculate_scores_vectorized(normalized, weights)
+
+        costs = candidates[list(budgets)].astype(float).to_numpy()
+        limits = list(budgets.values())
+        if max_sensors:
+            costs = np.column_stack([costs, np.ones(len(candidates))])
+            limits.append(max_sensors)
+        priced = ~np.isnan(costs).any(axis=1)
+        found, stats = optimize(
+            scores[priced],
+            costs[priced],
+            limits,
+            top=top,
+            workers=workers,
+            max_nodes=max_nodes,
+        )
+        rows = np.flatnonzero(priced)
+        sensor_ids = candidates["sensor_id"].to_numpy()
+        rigs = pd.DataFrame(
+            {
+                "sensors": [list(sensor_ids[rows[items]]) for _, items in found],
+                "score": [value for value, _ in found],
+            }
+        )
+        for j, attr in enumerate(budgets):
+            rigs[attr] = [costs[rows[items], j].sum() for _, items in found]
+        summary = {
+            "candidates": int(priced.sum()),
+            "nodes": stats["nodes"],
+            "upper_bound": stats["upper_bound"],
+            "gap": stats["gap"],
+            "optimal": stats["gap"] <= 1e-6,
+        }
+        return rigs, summary
+
+    def coverage(self, sensors, workspace, min_count=1, top=5):
+        """Simulates which voxels of a box workspace the sensors can see.
+
+        Args:
+            sensors (list): One dict per mounted sensor, with 'sensor_id',
+                'position' as [x, y, z] in metres and optional 'roll',
+                'pitch' and 'yaw' in degrees. The keys of
+                `coverage.SPEC_KEYS` override the catalog's specs.
+            workspace (dict): 'min' and 'max' corners and 'voxel_size'.
+            min_count (int): Number of sensors a voxel needs to be covered.
+            top (int): Number of blind spots to describe.
+
+        Returns:
+            tuple: A summary dict, per-sensor visibility and the largest
+            blind spots, as DataFrames.
+
+        Raises:
+            KeyError: If a sensor is unknown.
+            ValueError: If a pose, the workspace or a needed spec is missing.
+        """
+        if min_count < 1:
+            raise ValueError("Minimum count must be at least 1.")
+        axes, voxel_size = parse_workspace(workspace)
+        if not sensors:
+            raise ValueError("Give at least one sensor.")
+        if any("sensor_id" not in sensor for sensor in sensors):
+            raise ValueError("Every sensor entry needs a 'sensor_id'.")
+        snapshot = self.snapshot
+        sensor_ids = self.resolve([sensor["sensor_id"] for sensor in sensors], snapshot)
+        specs = snapshot.by_id
+        mounted = []
+        for sensor_id, sensor in zip(sensor_ids, sensors):
+            position = np.asarray(sensor.get("position", ()), dtype=float)
+            if position.shape != (3,):
+                raise ValueError(f"Position of {sensor_id} must be an [x, y, z] list.")
+            values = {
+                key: float(sensor.get(key, specs.at[sensor_id, key]))
+                for key in SPEC_KEYS
+            }
+            values["min_range"] = np.nan_to_num(values["min_range"])
+            missing = [key for key, value in values.items() if np.isnan(value)]
+            if missing:
+                raise ValueError(
+                    f"{sensor_id} has no {', '.join(missing)}. "
+                    "Give it in the sensor entry."
+                )
+            rotation = rotation_matrix(
+                *(float(sensor.get(angle, 0.0)) for angle in ["roll", "pitch", "yaw"])
+            )
+            mounted.append({"position": position, "rotation": rotation, **values})
+
+        counts, seen, alone = visibility_counts(axes, mounted)
+        total = counts.size
+        summary = {
+            "voxels": total,
+            "voxel_size": voxel_size,
+            "min_count": min_count,
+            "covered_percent": 100.0 * np.count_nonzero(counts) / total,
+            "min_count_percent": 100.0 * np.count_nonzero(counts >= min_count) / total,
+            "max_count": int(counts.max()),
+        }
+        per_sensor = pd.DataFrame(
+            {
+                "sensor_id": sensor_ids,
+                "position": [list(sensor["position"]) for sensor in mounted],
+                "visible_percent": 100.0 * seen / total,
+                "only_sensor_percent": 100.0 * alone / total,
+            }
+        )
+        spots = blind_spots(counts, axes, voxel_size, min_count, top)
+        return summary, per_sensor, spots
@@ -11,14 +11,294 @@
 # limitations under the License.
 
 import argparse
+import logging
+import sqlite3
+import sys
 
-from sensor_tool.visualize import visualize_comparison
-from sensor_tool.filter_sensors import filter_sensors
-from sensor_tool.validate_sensors import validate_sensors_main
+# The subcommand modules are imported inside `main` so that lightweight
+# commands such as `validate` and `filter` never pay for matplotlib or Tk.
+# These mirror `visualize.LARGE_VIEWS` and `export_sensors.EXPORT_FORMATS`.
+VISUALIZE_VIEWS = ["bars", "heatmap", "parallel", "strip"]
+EXPORT_FORMATS = ["csv", "parquet", "jsonl", "sqlite"]
 
+FILTER_COLUMNS = [
+    "sensor_id",
+    "sensor_type",
+    "manufacturer",
+    "model",
+    "ros_compatibility",
+    "resolution_rgb",
+    "frame_rate",
+    "price_avg",
+    "field_of_view",
+]
 
-def main():
+
+def add_filter_arguments(parser):
+    """Adds the sensor filter criteria shared by several subcommands."""
+    parser.add_argument(
+        "--sensor_type", help="Type of sensor (e.g., 'RGB Camera', 'LiDAR')"
+    )
+    parser.add_argument(
+        "--manufacturer", help="Name of the manufacturer (e.g., 'Intel')"
+    )
+    parser.add_argument(
+        "--min_resolution", type=int, help="Minimum resolution in pixels"
+    )
+    parser.add_argument(
+        "--max_resolution", type=int, help="Maximum resolution in pixels"
+    )
+    parser.add_argument(
+        "--min_frame_rate", type=float, help="Minimum frame rate in FPS"
+    )
+    parser.add_argument(
+        "--max_frame_rate", type=float, help="Maximum frame rate in FPS"
+    )
+    parser.add_argument("--min_price", type=float, help="Minimum price in USD")
+    parser.add_argument("--max_price", type=float, help="Maximum price in USD")
+    parser.add_argument(
+        "--min_fov", type=float, help="Minimum field of view in degrees"
+    )
+    parser.add_argument(
+        "--max_fov", type=float, help="Maximum field of view in degrees"
+    )
+    parser.add_argument(
+        "--min_pixels_per_degree",
+        type=float,
+        help="Minimum horizontal pixels per degree of field of view",
+    )
+    parser.add_argument(
+        "--max_mm_per_pixel",
+        type=float,
+        help="Maximum size of a pixel in mm on a target at the maximum range",
+    )
+    parser.add_argument(
+        "--ros_compatibility", help="ROS compatibility version (e.g., 'ROS1', 'ROS2')"
+    )
+
+
+def filter_kwargs(args):
+    """Collects the filter criteria added by `add_filter_arguments`."""
+    return dict(
+        sensor_type=args.sensor_type,
+        manufacturer=args.manufacturer,
+        ros_compatibility=args.ros_compatibility,
+        min_resolution=args.min_resolution,
+        max_resolution=args.max_resolution,
+        min_frame_rate=args.min_frame_rate,
+        max_frame_rate=args.max_frame_rate,
+        min_price=args.min_price,
+        max_price=args.max_price,
+        min_fov=args.min_fov,
+        max_fov=args.max_fov,
+        min_pixels_per_degree=args.min_pixels_per_degree,
+        max_mm_per_pixel=args.max_mm_per_pixel,
+    )
+
+
+def assignments(convert):
+    """Returns an argparse type for NAME=VALUE arguments."""
+
+    def parse(text):
+        name, separator, value = text.rpartition("=")
+        if not separator or not name:
+            raise argparse.ArgumentTypeError(f"expected NAME=VALUE, got '{text}'")
+        try:
+            return name.strip(), convert(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid value in '{text}'")
+
+    return parse
+
+
+def add_rig_arguments(parser):
+    """Adds the rig planning options shared by the CLI and the shell."""
+    parser.add_argument(
+        "sensor_ids",
+        nargs="*",
+        help="Sensors of the rig, repeated for identical cameras",
+    )
+    parser.add_argument(
+        "--combinations",
+        type=int,
+        metavar="K",
+        help="Evaluate every rig of K sensors matching the filters instead",
+    )
+    parser.add_argument(
+        "--repeat",
+        action="store_true",
+        help="Allow the same sensor more than once in --combinations rigs",
+    )
+    parser.add_argument(
+        "--top", type=int, default=20, help="Number of --combinations rigs to list"
+    )
+    parser.add_argument(
+        "--bit_depth",
+        nargs="+",
+        type=assignments(int),
+        metavar="STREAM=BITS",
+        help="Bits per pixel of the rgb, depth or ir stream (0 turns it off)",
+    )
+    parser.add_argument(
+        "--compression",
+        nargs="+",
+        type=assignments(float),
+        metavar="STREAM=RATIO",
+        help="Compression ratio of a stream (e.g., rgb=10 for MJPEG)",
+    )
+    parser.add_argument(
+        "--ports",
+        nargs="+",
+        type=assignments(int),
+        metavar="BUS=COUNT",
+        help="Independent buses of a type on the host (e.g., 'USB 3.0=2')",
+    )
+    parser.add_argument(
+        "--max_utilization",
+        type=float,
+        default=1.0,
+        help="Highest allowed load as a share of a bus (default 1.0)",
+    )
+    add_filter_arguments(parser)
+
+
+def rig_kwargs(args):
+    """Collects the options added by `add_rig_arguments`, except the sensors."""
+    return dict(
+        bit_depth=dict(args.bit_depth or []),
+        compression=dict(args.compression or []),
+        ports=dict(args.ports or []),
+        max_utilization=args.max_utilization,
+    )
+
+
+def print_rig(rates, buses):
+    """Prints the stream rates of a rig and the load on each bus."""
+    print(rates.to_string(index=False, float_format="{:.1f}".format))
+    print()
+    print(buses.to_string(index=False, float_format="{:.2f}".format))
+    for bus in buses.loc[buses["oversubscribed"], "bus"]:
+        print(f"Oversubscribed: {bus}")
+
+
+def print_rigs(rigs, feasible, total):
+    """Prints the best rigs found by `SensorCatalog.rigs`."""
+    print(f"{feasible} of {total} rigs fit the buses.")
+    if not rigs.empty:
+        print(rigs.to_string(index=False, float_format="{:.2f}".format))
+
+
+def add_optimize_arguments(parser):
+    """Adds the rig optimizer options shared by the CLI and the shell."""
+    parser.add_argument(
+        "--attributes", nargs="+", required=True, help="Attributes to score on"
+    )
+    parser.add_argument(
+        "--weights",
+        nargs="+",
+        type=float,
+        help="Weights for each attribute (optional, default is equal weights)",
+    )
+    parser.add_argument(
+        "--budget",
+        nargs="+",
+        type=assignments(float),
+        metavar="ATTRIBUTE=LIMIT",
+        help="Limit on a rig total (e.g., price_avg=3000 power_consumption=20)",
+    )
+    parser.add_argument(
+        "--max_sensors", type=int, help="Largest number of sensors in a rig"
+    )
+    parser.add_argument("--top", type=int, default=5, help="Number of rigs to list")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Processes searching in parallel"
+    )
+    parser.add_argument(
+        "--max_nodes",
+        type=int,
+        default=1_000_000,
+        help="Search nodes to expand before reporting the best rigs found",
+    )
+    add_filter_arguments(parser)
+
+
+def optimize_kwargs(args):
+    """Collects the options added by `add_optimize_arguments`."""
+    return dict(
+        attributes=args.attributes,
+        weights=args.weights,
+        budgets=dict(args.budget or []),
+        max_sensors=args.max_sensors,
+        top=args.top,
+        workers=args.workers,
+        max_nodes=args.max_nodes,
+        **filter_kwargs(args),
+    )
+
+
+def print_optimized(rigs, summary):
+    """Prints the result of `SensorCatalog.optimize`."""
+    if rigs.empty:
+        print("No rig fits the budgets.")
+    else:
+        print(rigs.to_string(index=False, float_format="{:.2f}".format))
+    if summary["optimal"]:
+        print(f"Best rig is optimal ({summary['nodes']} nodes searched).")
+    else:
+        print(
+            f"Search stopped after {summary['nodes']} nodes. No rig scores more "
+            f"than {summary['upper_bound']:.2f} (gap {summary['gap']:.2f})."
+        )
+
+
+def print_coverage(summary, sensors, blind_spots):
+    """Prints the result of `SensorCatalog.coverage`."""
+    print(
+        f"{summary['covered_percent']:.1f}% of {summary['voxels']} voxels are "
+        f"seen by a sensor, {summary['min_count_percent']:.1f}% by at least "
+        f"{summary['min_count']}."
+    )
+    print(sensors.to_string(index=False, float_format="{:.1f}".format))
+    if not blind_spots.empty:
+        print()
+        print("Largest blind spots:")
+        print(blind_spots.to_string(index=False, float_format="{:.3f}".format))
+
+
+def forward_query(server, endpoint, payload):
+    """Sends a query to a running 'serve' daemon, exiting on failure."""
+    from sensor_tool.server import query_server
+
+    try:
+        return query_server(server, endpoint, payload)
+    except (RuntimeError, OSError) as e:
+        logging.error(f"Query to {server} failed: {e}")
+        sys.exit(1)
+
+
+def build_parser():
+    """Builds the argument parser for all subcommands."""
     parser = argparse.ArgumentParser(description="Sensor Comparison Tool CLI")
+    parser.add_argument(
+        "--server",
+        help="Forward filter and search queries to a running 'serve' daemon "
+        "(e.g., 'http://127.0.0.1:8765' or 'unix:/tmp/sensor-tool.sock')",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print a per-stage timing breakdown when the command finishes",
+    )
+    parser.add_argument(
+        "--profile_stats",
+        metavar="PATH",
+        help="Run the command under cProfile and write the pstats output to PATH",
+    )
+    parser.add_argument(
+        "--profile_json",
+        metavar="PATH",
+        help="Write the recorded timing spans to PATH as JSON",
+    )
     subparsers = parser.add_subparsers(dest="command")
 
     visualize_parser = subparsers.add_parser(
@@ -28,8 +308,10 @@ def main():
     visualize_parser.add_argument(
         "--sensor_ids",
         nargs="+",
-        required=True,
-        help="List of sensor IDs to compare (at least two)",
+        help="List of sensor IDs to compare (at least two). An ID may be given "
+        "in any case, with spaces, hyphens or underscores as separators. "
+        "May be omitted with the heatmap, parallel and strip views to compare "
+        "the whole catalog",
     )
     visualize_parser.add_argument(
         "--attributes",
@@ -49,6 +331,13 @@ def main():
         type=float,
         help="Custom benchmark values for each attribute (optional)",
     )
+    visualize_parser.add_argument(
+        "--view",
+        choices=VISUALIZE_VIEWS,
+        default="bars",
+        help="Plot layout: per-attribute bars for a few sensors, or a heatmap, "
+        "parallel coordinates or ranked strip for hundreds of sensors",
+    )
     visualize_parser.add_argument(
         "--save_plot",
         action="store_true",
@@ -64,34 +353,215 @@ def main():
     filter_parser = subparsers.add_parser(
         "filter", help="Filter sensors based on criteria"
     )
+    add_filter_arguments(filter_parser)
     filter_parser.add_argument(
-        "--sensor_type", help="Type of sensor (e.g., 'RGB Camera', 'LiDAR')"
+        "--compact",
+        action="store_true",
+        help="Load the catalog in the low-memory compact layout",
     )
     filter_parser.add_argument(
-        "--manufacturer", help="Name of the manufacturer (e.g., 'Intel')"
+        "--sqlite",
+        metavar="DATABASE",
+        help="Query a SQLite catalog written by 'export' instead of the YAML files",
     )
-    filter_parser.add_argument(
-        "--min_resolution", type=int, help="Minimum resolution in pixels"
+
+    export_parser = subparsers.add_parser(
+        "export", help="Export the full normalized catalog to a file"
     )
-    filter_parser.add_argument(
-        "--max_resolution", type=int, help="Maximum resolution in pixels"
+    export_parser.add_argument(
+        "output", help="Output file path (.csv, .parquet, .jsonl or .sqlite)"
     )
-    filter_parser.add_argument(
-        "--min_frame_rate", type=float, help="Minimum frame rate in FPS"
+    export_parser.add_argument(
+        "--format",
+        choices=EXPORT_FORMATS,
+        help="Output format (default: inferred from the file extension)",
     )
-    filter_parser.add_argument(
-        "--max_frame_rate", type=float, help="Maximum frame rate in FPS"
+    export_parser.add_argument(
+        "--columns",
+        nargs="+",
+        help="Columns to export (default: all schema and derived columns)",
     )
-    filter_parser.add_argument("--min_price", type=float, help="Minimum price in USD")
-    filter_parser.add_argument("--max_price", type=float, help="Maximum price in USD")
-    filter_parser.add_argument(
-        "--min_fov", type=float, help="Minimum field of view in degrees"
+    export_parser.add_argument(
+        "--chunk_size",
+        type=int,
+        default=500,
+        help="Number of sensors processed per chunk (default: 500)",
     )
-    filter_parser.add_argument(
-        "--max_fov", type=float, help="Maximum field of view in degrees"
+    add_filter_arguments(export_parser)
+
+    search_parser = subparsers.add_parser(
+        "search", help="Search sensors by ID, manufacturer or model"
     )
-    filter_parser.add_argument(
-        "--ros_compatibility", help="ROS compatibility version (e.g., 'ROS1', 'ROS2')"
+    search_parser.add_argument("query", help="Text to search for")
+    search_parser.add_argument(
+        "--limit", type=int, default=10, help="Maximum number of results"
+    )
+
+    rank_parser = subparsers.add_parser(
+        "rank", help="Rank all sensors matching the filters by weighted score"
+    )
+    rank_parser.add_argument(
+        "--attributes",
+        nargs="+",
+        required=True,
+        help="Attributes to score (e.g., resolution_rgb frame_rate latency)",
+    )
+    rank_parser.add_argument(
+        "--weights",
+        nargs="+",
+        type=float,
+        help="Weights for each attribute (optional, default is equal weights)",
+    )
+    rank_parser.add_argument(
+        "--top", type=int, default=10, help="Number of sensors to list"
+    )
+    rank_parser.add_argument(
+        "--breakdown",
+        action="store_true",
+        help="Show how many points each attribute contributed to the score",
+    )
+    rank_parser.add_argument("--output", help="Also write the ranking to a CSV file")
+    add_filter_arguments(rank_parser)
+
+    pareto_parser = subparsers.add_parser(
+        "pareto",
+        help="List the sensors that no other sensor beats on every attribute",
+    )
+    pareto_parser.add_argument(
+        "--attributes",
+        nargs="+",
+        required=True,
+        help="Attributes to trade off (e.g., frame_rate latency price_avg)",
+    )
+    pareto_parser.add_argument(
+        "--drop_missing",
+        action="store_true",
+        help="Exclude sensors missing any of the attributes instead of "
+        "treating the missing values as the worst",
+    )
+    add_filter_arguments(pareto_parser)
+
+    similar_parser = subparsers.add_parser(
+        "similar", help="Find the sensors with the closest specs to a given one"
+    )
+    similar_parser.add_argument("sensor_id", help="Sensor to find replacements for")
+    similar_parser.add_argument(
+        "--top", type=int, default=5, help="Number of sensors to list"
+    )
+    similar_parser.add_argument(
+        "--attributes",
+        nargs="+",
+        help="Attributes to compare (optional, default is all numeric specs)",
+    )
+    similar_parser.add_argument(
+        "--weights",
+        nargs="+",
+        type=float,
+        help="Weights for each attribute (optional, default is equal weights)",
+    )
+    add_filter_arguments(similar_parser)
+
+    spatial_parser = subparsers.add_parser(
+        "spatial",
+        help="Show the pixel and point density of sensors across their range",
+    )
+    spatial_parser.add_argument("sensor_ids", nargs="+", help="Sensors to evaluate")
+    spatial_parser.add_argument(
+        "--distances",
+        nargs="+",
+        type=float,
+        help="Distances in metres (optional, default is a grid over each "
+        "sensor's range)",
+    )
+    spatial_parser.add_argument(
+        "--steps",
+        type=int,
+        default=5,
+        help="Number of distances from the minimum to the maximum range",
+    )
+
+    rig_parser = subparsers.add_parser(
+        "rig",
+        help="Estimate the data rates of a camera rig and flag oversubscribed buses",
+    )
+    add_rig_arguments(rig_parser)
+
+    optimize_parser = subparsers.add_parser(
+        "optimize",
+        help="Find the sets of sensors with the highest total score within budgets",
+    )
+    add_optimize_arguments(optimize_parser)
+
+    coverage_parser = subparsers.add_parser(
+        "coverage",
+        help="Simulate which parts of a workspace a sensor layout can see",
+    )
+    coverage_parser.add_argument(
+        "layout", help="YAML file with the workspace box and the sensor poses"
+    )
+    coverage_parser.add_argument(
+        "--min_count",
+        type=int,
+        default=1,
+        help="Number of sensors that must see a voxel for it to be covered",
+    )
+    coverage_parser.add_argument(
+        "--top", type=int, default=5, help="Number of blind spots to list"
+    )
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="Run filter, search, score and compare jobs from a JSONL file"
+    )
+    batch_parser.add_argument(
+        "jobs", help="JSON Lines file with one job per line ('-' for stdin)"
+    )
+    batch_parser.add_argument(
+        "--output", help="File for the JSON Lines results (default: stdout)"
+    )
+    batch_parser.add_argument(
+        "--workers", type=int, default=4, help="Number of worker threads"
+    )
+
+    subparsers.add_parser(
+        "shell", help="Start an interactive shell with the catalog kept in memory"
+    )
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Keep the catalog in memory and serve queries over HTTP"
+    )
+    serve_parser.add_argument(
+        "--host", default="127.0.0.1", help="Address to listen on"
+    )
+    serve_parser.add_argument(
+        "--port", type=int, default=8765, help="TCP port to listen on"
+    )
+    serve_parser.add_argument(
+        "--socket", help="Listen on this Unix socket path instead of TCP"
+    )
+    serve_parser.add_argument(
+        "--sensors_dir", default="sensors", help="Directory of sensor YAML files"
+    )
+    serve_parser.add_argument(
+        "--refresh_interval",
+        type=float,
+        default=2.0,
+        help="Minimum seconds between checks for modified sensor files",
+    )
+
+    memory_parser = subparsers.add_parser(
+        "memory", help="Report how much memory loading the catalog takes"
+    )
+    memory_parser.add_argument(
+        "--mode",
+        choices=["standard", "compact", "both"],
+        default="both",
+        help="Catalog layout to measure (default: both)",
+    )
+    memory_parser.add_argument(
+        "--sensors_dir", default="sensors", help="Directory of sensor YAML files"
+    )
+    memory_parser.add_argument(
+        "--top", type=int, default=10, help="Number of allocation sites to list"
     )
 
     validate_parser = subparsers.add_parser(
@@ -101,11 +571,97 @@ def main():
         "files", nargs="*", help="Sensor YAML files to validate"
     )
 
-    gui_parser = subparsers.add_parser("gui", help="Launch the GUI application")
+    subparsers.add_parser("gui", help="Launch the GUI application")
+
+    return parser
+
+
+def print_memory_report(args):
+    """Measures and prints the memory retained by the requested layouts."""
+    from sensor_tool.compact import catalog_memory_report
+
+    modes = ["standard", "compact"] if args.mode == "both" else [args.mode]
+    reports = {}
+    for mode in modes:
+        report = catalog_memory_report(
+            args.sensors_dir, compact=mode == "compact", top=args.top
+        )
+        reports[mode] = report
+        print(f"{mode.capitalize()} catalog: {report['sensors']} sensors")
+        print(
+            f"  retained: {report['current_bytes'] / 2**20:.2f} MiB "
+            f"({report['per_sensor_bytes'] / 1024:.2f} KiB per sensor)"
+        )
+        print(f"  peak while loading: {report['peak_bytes'] / 2**20:.2f} MiB")
+        print("  largest allocation sites:")
+        for entry in report["top"]:
+            print(f"    {entry['size_bytes'] / 1024:10.1f} KiB  {entry['location']}")
+
+    if len(reports) == 2 and reports["compact"]["per_sensor_bytes"]:
+        ratio = (
+            reports["standard"]["per_sensor_bytes"]
+            / reports["compact"]["per_sensor_bytes"]
+        )
+        print(f"Compact mode uses {ratio:.1f}x less memory per sensor.")
+
+
+def run_profiled(parser, args):
+    """Runs the command with timing spans, and cProfile if requested."""
+    from sensor_tool.profiling import SpanRecorder
+
+    profiler = None
+    if args.profile_stats:
+        import cProfile
 
+        profiler = cProfile.Profile()
+
+    with SpanRecorder() as recorder:
+        try:
+            if profiler:
+                profiler.enable()
+            run_command(parser, args)
+        finally:
+            if profiler:
+                profiler.disable()
+                profiler.dump_stats(args.profile_stats)
+            if args.profile:
+                print(f"\n{recorder.format_report()}", file=sys.stderr)
+                if profiler:
+                    import pstats
+
+                    stats = pstats.Stats(profiler, stream=sys.stderr)
+                    stats.sort_stats("cumulative").print_stats(15)
+            if args.profile_json:
+                recorder.dump_json(args.profile_json)
+
+
+def main():
+    parser = build_parser()
     args = parser.parse_args()
 
-    if args.command == "visualize":
+    if args.profile or args.profile_stats or args.profile_json:
+        run_profiled(parser, args)
+    else:
+        run_command(parser, args)
+
+
+def run_command(parser, args):
+    """Dispatches the parsed arguments to the selected subcommand."""
+    if args.command == "visualize" and args.view != "bars":
+        from sensor_tool.visualize import visualize_large_comparison
+
+        visualize_large_comparison(
+            attributes=args.attributes,
+            sensor_ids=args.sensor_ids,
+            view=args.view,
+            weights=args.weights,
+            save_plot=f"sensor_comparison_{args.view}.png" if args.save_plot else None,
+        )
+    elif args.command == "visualize":
+        if not args.sensor_ids:
+            parser.error("--sensor_ids is required for the bars view")
+        from sensor_tool.visualize import visualize_comparison
+
         visualize_comparison(
             sensor_ids=args.sensor_ids,
             attributes=args.attributes,
@@ -115,37 +671,291 @@ def main():
             export_csv=args.export_csv,
             export_excel=args.export_excel,
         )
+    elif args.command == "filter" and args.server:
+        import pandas as pd
+
+        response = forward_query(args.server, "filter", filter_kwargs(args))
+        print(pd.DataFrame(response["sensors"], columns=FILTER_COLUMNS))
+
+    elif args.command == "filter" and args.compact:
+        from sensor_tool.compact import CompactCatalog
+
+        filtered_df = CompactCatalog().filter(**filter_kwargs(args))
+        print(filtered_df[FILTER_COLUMNS])
+
     elif args.command == "filter":
-        filtered_df = filter_sensors(
-            sensor_type=args.sensor_type,
-            manufacturer=args.manufacturer,
-            ros_compatibility=args.ros_compatibility,
-            min_resolution=args.min_resolution,
-            max_resolution=args.max_resolution,
-            min_frame_rate=args.min_frame_rate,
-            max_frame_rate=args.max_frame_rate,
-            min_price=args.min_price,
-            max_price=args.max_price,
-            min_fov=args.min_fov,
-            max_fov=args.max_fov,
+        from sensor_tool.filter_sensors import filter_sensors
+
+        try:
+            filtered_df = filter_sensors(database=args.sqlite, **filter_kwargs(args))
+        except (OSError, sqlite3.Error) as e:
+            logging.error(e)
+            sys.exit(1)
+        print(filtered_df[FILTER_COLUMNS])
+
+    elif args.command == "memory":
+        print_memory_report(args)
+
+    elif args.command == "search":
+        import pandas as pd
+
+        if args.server:
+            payload = {"query": args.query, "limit": args.limit}
+            response = forward_query(args.server, "search", payload)
+            results = pd.DataFrame(response["sensors"])
+        else:
+            from sensor_tool.catalog import SensorCatalog
+
+            results = SensorCatalog().search(args.query, args.limit)
+        if results.empty:
+            print(f"No sensors match '{args.query}'.")
+        else:
+            print(
+                results[["sensor_id", "manufacturer", "model"]].to_string(index=False)
+            )
+
+    elif args.command == "rank":
+        import pandas as pd
+        from sensor_tool.catalog import error_message
+
+        payload = dict(
+            attributes=args.attributes,
+            weights=args.weights,
+            top=args.top,
+            breakdown=args.breakdown,
+            **filter_kwargs(args),
         )
-        print(
-            filtered_df[
-                [
-                    "sensor_id",
-                    "sensor_type",
-                    "manufacturer",
-                    "model",
-                    "ros_compatibility",
-                    "resolution_rgb",
-                    "frame_rate",
-                    "price_avg",
-                    "field_of_view",
-                ]
-            ]
+        if args.server:
+            response = forward_query(args.server, "rank", payload)
+            ranked = pd.DataFrame(response["sensors"])
+        else:
+            from sensor_tool.catalog import SensorCatalog
+
+            try:
+                ranked = SensorCatalog().rank(**payload)
+            except (KeyError, ValueError) as e:
+                logging.error(error_message(e))
+                sys.exit(1)
+        if ranked.empty:
+            print("No sensors match the filters.")
+        else:
+            print(ranked.to_string(index=False, float_format="{:.2f}".format))
+        if args.output:
+            ranked.to_csv(args.output, index=False)
+            print(f"Ranking written to {args.output}")
+
+    elif args.command == "pareto":
+        import pandas as pd
+        from sensor_tool.catalog import error_message
+
+        payload = dict(
+            attributes=args.attributes,
+            drop_missing=args.drop_missing,
+            **filter_kwargs(args),
         )
+        if args.server:
+            response = forward_query(args.server, "pareto", payload)
+            front = pd.DataFrame(
+                response["sensors"], columns=["sensor_id"] + args.attributes
+            )
+        else:
+            from sensor_tool.catalog import SensorCatalog
+
+            try:
+                front = SensorCatalog().pareto(**payload)
+            except (KeyError, ValueError) as e:
+                logging.error(error_message(e))
+                sys.exit(1)
+        print(f"{len(front)} sensors on the Pareto front:")
+        print(front.to_string(index=False))
+
+    elif args.command == "similar":
+        import pandas as pd
+        from sensor_tool.catalog import error_message
+
+        payload = dict(
+            sensor_id=args.sensor_id,
+            k=args.top,
+            attributes=args.attributes,
+            weights=args.weights,
+            **filter_kwargs(args),
+        )
+        if args.server:
+            response = forward_query(args.server, "similar", payload)
+            nearest = pd.DataFrame(response["sensors"])
+        else:
+            from sensor_tool.catalog import SensorCatalog
+
+            try:
+                nearest = SensorCatalog().similar(**payload)
+            except (KeyError, ValueError) as e:
+                logging.error(error_message(e))
+                sys.exit(1)
+        if nearest.empty:
+            print(f"No sensors similar to '{args.sensor_id}' match the filters.")
+        else:
+            print(nearest.to_string(index=False))
+
+    elif args.command == "spatial":
+        import pandas as pd
+        from sensor_tool.catalog import error_message
+
+        payload = dict(
+            sensor_ids=args.sensor_ids, distances=args.distances, steps=args.steps
+        )
+        if args.server:
+            response = forward_query(args.server, "spatial", payload)
+            metrics = pd.DataFrame(response["sensors"])
+        else:
+            from sensor_tool.catalog import SensorCatalog
+
+            try:
+                metrics = SensorCatalog().spatial(**payload)
+            except (KeyError, ValueError) as e:
+                logging.error(error_message(e))
+                sys.exit(1)
+        print(metrics.to_string(index=False, float_format="{:.2f}".format))
+
+    elif args.command == "rig":
+        import pandas as pd
+        from sensor_tool.catalog import error_message
+
+        if bool(args.sensor_ids) == (args.combinations is not None):
+            logging.error("Give either sensor IDs or --combinations.")
+            sys.exit(1)
+        if args.sensor_ids:
+            payload = dict(sensor_ids=args.sensor_ids, **rig_kwargs(args))
+            command = "rig"
+        else:
+            payload = dict(
+                k=args.combinations,
+                top=args.top,
+                repeat=args.repeat,
+                **rig_kwargs(args),
+                **filter_kwargs(args),
+            )
+            command = "rigs"
+        if args.server:
+            response = forward_query(args.server, command, payload)
+            if command == "rig":
+                result = (
+                    pd.DataFrame(response["sensors"]),
+                    pd.DataFrame(response["buses"]),
+                )
+            else:
+                result = (
+                    pd.DataFrame(response["rigs"]),
+                    response["feasible"],
+                    response["total"],
+                )
+        else:
+            from sensor_tool.catalog import SensorCatalog
+
+            catalog = SensorCatalog()
+            try:
+                if command == "rig":
+                    result = catalog.rig(**payload)
+                else:
+                    result = catalog.rigs(**payload)
+            except (KeyError, ValueError) as e:
+                logging.error(error_message(e))
+                sys.exit(1)
+        if command == "rig":
+            print_rig(*result)
+        else:
+            print_rigs(*result)
+
+    elif args.command == "optimize":
+        import pandas as pd
+        from sensor_tool.catalog import error_message
+
+        payload = optimize_kwargs(args)
+        if args.server:
+            response = forward_query(args.server, "optimize", payload)
+            result = (pd.DataFrame(response["rigs"]), response["summary"])
+        else:
+            from sensor_tool.catalog import SensorCatalog
+
+            try:
+                result = SensorCatalog().optimize(**payload)
+            except (KeyError, ValueError) as e:
+                logging.error(error_message(e))
+                sys.exit(1)
+        print_optimized(*result)
+
+    elif args.command == "coverage":
+        import pandas as pd
+        from sensor_tool.catalog import error_message
+        from sensor_tool.coverage import load_layout
+
+        try:
+            sensors, workspace = load_layout(args.layout)
+        except (OSError, ValueError) as e:
+            logging.error(e)
+            sys.exit(1)
+        payload = dict(
+            sensors=sensors, workspace=workspace, min_count=args.min_count, top=args.top
+        )
+        if args.server:
+            response = forward_query(args.server, "coverage", payload)
+            result = (
+                response["summary"],
+                pd.DataFrame(response["sensors"]),
+                pd.DataFrame(response["blind_spots"]),
+            )
+        else:
+            from sensor_tool.catalog import SensorCatalog
+
+            try:
+                result = SensorCatalog().coverage(**payload)
+            except (KeyError, ValueError) as e:
+                logging.error(error_message(e))
+                sys.exit(1)
+        print_coverage(*result)
+
+    elif args.command == "batch":
+        from sensor_tool.batch import run_batch
+
+        logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+        _, failed = run_batch(args.jobs, args.output, workers=args.workers)
+        if failed:
+            sys.exit(1)
+
+    elif args.command == "shell":
+        from sensor_tool.shell import run_shell
+
+        run_shell()
+
+    elif args.command == "serve":
+        from sensor_tool.server import serve
+
+        logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+        serve(
+            host=args.host,
+            port=args.port,
+            socket_path=args.socket,
+            sensors_directory=args.sensors_dir,
+            refresh_interval=args.refresh_interval,
+        )
+
+    elif args.command == "export":
+        from sensor_tool.export_sensors import export_sensors
+
+        try:
+            export_sensors(
+                args.output,
+                export_format=args.format,
+                columns=args.columns,
+                chunk_size=args.chunk_size,
+                **filter_kwargs(args),
+            )
+        except (ValueError, ImportError) as e:
+            logging.error(e)
+            sys.exit(1)
 
     elif args.command == "validate":
+        from sensor_tool.validate_sensors import validate_sensors_main
+
         validate_sensors_main(args.files)
 
     elif args.command == "gui":
@@ -0,0 +1,300 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import sys
+import yaml
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from .data_loader import DataLoader
+from .export_sensors import get_export_columns, normalize_chunk
+from .filter_sensors import apply_filters
+from .profiling import span, trace_memory
+from . import utils
+
+# Long or rarely compared fields that stay in the YAML files and are read
+# back on demand with `CompactCatalog.sensor` or `CompactCatalog.text`.
+FREE_TEXT_COLUMNS = [
+    "driver_link_ros1",
+    "driver_link_ros2",
+    "datasheet_link",
+    "github_repo",
+    "key_features",
+    "sensor_image",
+    "notes",
+]
+
+
+# Columns `apply_filters` compares with thresholds. They stay float64, as in
+# the standard catalog, so both agree on values at a threshold.
+THRESHOLD_COLUMNS = [
+    "resolution_rgb",
+    "frame_rate",
+    "price_avg",
+    "field_of_view",
+    "pixels_per_degree",
+    "mm_per_pixel_at_max_range",
+]
+
+
+class PackedList:
+    """
+    A column of string lists stored as one offsets array and one codes array.
+
+    The values of row `i` are `categories[codes[offsets[i]:offsets[i + 1]]]`.
+    """
+
+    def __init__(self, lists):
+        lengths = np.fromiter(
+            (len(x) if isinstance(x, list) else 0 for x in lists),
+            dtype=np.int64,
+            count=len(lists),
+        )
+        values = [
+            sys.intern(str(value)) for x in lists if isinstance(x, list) for value in x
+        ]
+        codes, categories = pd.factorize(pd.Series(values, dtype=object))
+        self._set_arrays(codes, list(categories), np.cumsum(lengths))
+
+    def _set_arrays(self, codes, categories, ends):
+        self.categories = categories
+        self.codes = codes.astype(np.min_scalar_type(max(len(categories) - 1, 0)))
+        self.offsets = np.concatenate([[0], ends]).astype(np.int32)
+
+    @classmethod
+    def concat(cls, parts):
+        """Joins packed lists built from consecutive chunks."""
+        packed = cls([])
+        positions = {}
+        codes, ends, base = [], [], 0
+        for part in parts:
+            mapping = np.array(
+                [positions.setdefault(c, len(positions)) for c in part.categories],
+                dtype=np.int64,
+            )
+            codes.append(mapping[part.codes] if len(mapping) else part.codes)
+            ends.append(part.offsets[1:].astype(np.int64) + base)
+            base += int(part.offsets[-1])
+        if parts:
+            packed._set_arrays(
+                np.concatenate(codes), list(positions), np.concatenate(ends)
+            )
+        return packed
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return [self.categories[code] for code in self.codes[start:end]]
+
+    def tolist(self, indices=None):
+        """Returns the lists of all rows, or of the rows in `indices`."""
+        if indices is None:
+            indices = range(len(self))
+        return [self[i] for i in indices]
+
+    def contains(self, value):
+        """Returns a boolean mask of the rows whose list contains `value`."""
+        mask = np.zeros(len(self), dtype=bool)
+        if value not in self.categories:
+            return mask
+        code = self.categories.index(value)
+        rows = np.repeat(np.arange(len(self)), np.diff(self.offsets))
+        mask[rows[self.codes == code]] = True
+        return mask
+
+    @property
+    def nbytes(self):
+        strings = sum(sys.getsizeof(value) for value in self.categories)
+        return self.codes.nbytes + self.offsets.nbytes + strings
+
+
+class CompactCatalog:
+    """
+    A low-memory catalog for very large sensor collections.
+
+    Strings with few distinct values are stored as categoricals, numbers
+    other than the `THRESHOLD_COLUMNS` as float32 and list fields as
+    `PackedList`s. The fields in `FREE_TEXT_COLUMNS` are not kept in memory
+    at all.
+    """
+
+    def __init__(self, sensors_directory="sensors", chunk_size=500):
+        self.data_loader = DataLoader(sensors_directory)
+        self.chunk_size = chunk_size
+        self.data = None
+        self.lists = {}
+        self._paths = None
+
+    @span("load_compact_catalog")
+    def load(self):
+        """Parses all sensor files chunk by chunk into the compact layout.
+
+        Returns:
+            CompactCatalog: self, to allow `CompactCatalog().load()`.
+        """
+        column_types = {
+            column: column_type
+            for column, column_type in get_export_columns().items()
+            if column not in FREE_TEXT_COLUMNS
+        }
+        frames, lists, paths = [], {}, []
+        for chunk_paths, raw_chunk in self._iter_chunks():
+            flat = normalize_chunk(raw_chunk, column_types)
+            frames.append(self._compact_frame(flat, column_types))
+            for column, column_type in column_types.items():
+                if column_type == "list":
+                    lists.setdefault(column, []).append(
+                        PackedList(flat[column].tolist())
+                    )
+            paths.extend(chunk_paths)
+            del flat, raw_chunk
+
+        with span("concat_chunks"):
+            self.data = self._concat_frames(frames, column_types)
+            self.lists = {
+                column: PackedList.concat(parts) for column, parts in lists.items()
+            }
+            self._paths = np.array(paths, dtype=np.bytes_)
+        return self
+
+    def _iter_chunks(self):
+        """Yields (paths, raw DataFrame) pairs of at most `chunk_size` files."""
+        paths, records = [], []
+        for path in self.data_loader.iter_sensor_files():
+            with open(path, "r") as f:
+                records.append(yaml.safe_load(f))
+            paths.append(path.encode("utf-8"))
+            if len(records) >= self.chunk_size:
+                yield paths, pd.DataFrame(records)
+                paths, records = [], []
+        if records:
+            yield paths, pd.DataFrame(records)
+
+    @staticmethod
+    def _compact_frame(flat, column_types):
+        columns = {}
+        for column, column_type in column_types.items():
+            if column_type in ("float", "integer"):
+                dtype = np.float64 if column in THRESHOLD_COLUMNS else np.float32
+                columns[column] = pd.to_numeric(flat[column], errors="coerce").astype(
+                    dtype
+                )
+            elif column_type != "list":
+                columns[column] = pd.Categorical(
+                    [
+                        sys.intern(x) if isinstance(x, str) else None
+                        for x in flat[column]
+                    ]
+                )
+        return pd.DataFrame(columns)
+
+    @staticmethod
+    def _concat_frames(frames, column_types):
+        if not frames:
+            return CompactCatalog._compact_frame(
+                pd.DataFrame(columns=list(column_types)), column_types
+            )
+        columns = {}
+        for column in frames[0].columns:
+            parts = [frame[column] for frame in frames]
+            if isinstance(parts[0].dtype, pd.CategoricalDtype):
+                columns[column] = union_categoricals(parts)
+            else:
+                columns[column] = np.concatenate([part.to_numpy() for part in parts])
+        return pd.DataFrame(columns)
+
+    def _ensure_loaded(self):
+        if self.data is None:
+            self.load()
+
+    def __len__(self):
+        self._ensure_loaded()
+        return len(self.data)
+
+    def memory_usage(self):
+        """Returns the approximate number of bytes held by the catalog."""
+        self._ensure_loaded()
+        return (
+            int(self.data.memory_usage(deep=True).sum())
+            + sum(packed.nbytes for packed in self.lists.values())
+            + self._paths.nbytes
+        )
+
+    def index_of(self, sensor_id):
+        """Returns the row index of `sensor_id`.
+
+        Raises:
+            KeyError: If the sensor ID is unknown.
+        """
+        self._ensure_loaded()
+        matches = np.flatnonzero(self.data["sensor_id"] == sensor_id)
+        if len(matches) == 0:
+            raise KeyError(f"Unknown sensor IDs: {sensor_id}")
+        return int(matches[0])
+
+    def sensor(self, sensor_id):
+        """Reads the full, original entry of a sensor from its YAML file."""
+        path = self._paths[self.index_of(sensor_id)].decode("utf-8")
+        with open(path, "r") as f:
+            return yaml.safe_load(f)
+
+    def text(self, sensor_id, field):
+        """Returns a free-text field of a sensor, read from disk."""
+        return self.sensor(sensor_id).get(field)
+
+    def filter(self, **criteria):
+        """Returns the sensors matching the `apply_filters` criteria.
+
+        List columns are unpacked for the matching rows only.
+        """
+        self._ensure_loaded()
+        ros_compatibility = criteria.pop("ros_compatibility", None)
+        df = self.data
+        if ros_compatibility:
+            df = df[self.lists["ros_compatibility"].contains(ros_compatibility)]
+        df = apply_filters(df, **criteria)
+        return df.assign(
+            **{column: packed.tolist(df.index) for column, packed in self.lists.items()}
+        )
+
+
+def catalog_memory_report(sensors_directory="sensors", compact=False, top=10):
+    """Measures the memory retained by loading the catalog.
+
+    Args:
+        sensors_directory (str, optional): Directory with the sensor YAML files.
+        compact (bool, optional): Measure `CompactCatalog` instead of the
+            preprocessed DataFrame used by the comparison commands.
+        top (int, optional): Number of largest allocation sites to report.
+
+    Returns:
+        dict: The `trace_memory` report plus `sensors` and `per_sensor_bytes`.
+    """
+
+    def load_standard():
+        df = DataLoader(sensors_directory).load_sensor_data()
+        return utils.preprocess_attributes(df, utils.COMPUTED_ATTRIBUTES)
+
+    def load_compact():
+        return CompactCatalog(sensors_directory).load()
+
+    # Import and cache everything the loaders touch before measuring
+    get_export_columns()
+    gc.collect()
+    catalog, report = trace_memory(load_compact if compact else load_standard, top)
+    report["sensors"] = len(catalog)
+    report["per_sensor_bytes"] = report["current_bytes"] / max(len(catalog), 1)
+    return report
@@ -0,0 +1,268 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+import yaml
+
+# Refuse workspaces with more voxels than this.
+MAX_VOXELS = 50_000_000
+
+# Voxels are tested this many at a time, to bound the memory of a query.
+CHUNK_VOXELS = 1_000_000
+
+# Keys of a sensor entry that override the catalog's specs.
+SPEC_KEYS = ["horizontal_fov", "vertical_fov", "min_range", "max_range"]
+
+
+def rotation_matrix(roll=0.0, pitch=0.0, yaw=0.0):
+    """Rotation from the sensor frame to the world frame.
+
+    Both frames follow REP 103: x forward, y left, z up. Angles are in
+    degrees and applied as roll about x, then pitch about y, then yaw about
+    z, so a positive pitch tilts the sensor down.
+    """
+    roll, pitch, yaw = np.radians([roll, pitch, yaw])
+    cr, sr = np.cos(roll), np.sin(roll)
+    cp, sp = np.cos(pitch), np.sin(pitch)
+    cy, sy = np.cos(yaw), np.sin(yaw)
+    return np.array(
+        [
+            [cy * cp, cy * sp * sr - sy * cr, cy * sp * cr + sy * sr],
+            [sy * cp, sy * sp * sr + cy * cr, sy * sp * cr - cy * sr],
+            [-sp, cp * sr, cp * cr],
+        ]
+    )
+
+
+def grid_axes(low, high, voxel_size):
+    """Returns the voxel centers along x, y and z of a box workspace.
+
+    Raises:
+        ValueError: If the box is empty or has more than `MAX_VOXELS` voxels.
+    """
+    low = np.asarray(low, dtype=float)
+    high = np.asarray(high, dtype=float)
+    if low.shape != (3,) or high.shape != (3,):
+        raise ValueError("Workspace 'min' and 'max' must be [x, y, z] lists.")
+    if not voxel_size > 0:
+        raise ValueError("Voxel size must be positive.")
+    if np.any(high <= low):
+        raise ValueError("Workspace 'max' must be above 'min' on every axis.")
+    counts = np.ceil((high - low) / voxel_size - 1e-9).astype(int)
+    if np.prod(counts, dtype=float) > MAX_VOXELS:
+        raise ValueError(
+            f"Workspace has {np.prod(counts, dtype=float):.0f} voxels, more than "
+            f"{MAX_VOXELS}. Use a larger voxel size."
+        )
+    return [
+        low[axis] + (np.arange(counts[axis]) + 0.5) * voxel_size for axis in range(3)
+    ]
+
+
+def parse_workspace(workspace):
+    """Returns the voxel axes and size of a {'min', 'max', 'voxel_size'} dict."""
+    if not isinstance(workspace, dict):
+        raise ValueError("Workspace must map 'min', 'max' and 'voxel_size'.")
+    missing = [key for key in ["min", "max", "voxel_size"] if key not in workspace]
+    if missing:
+        raise ValueError(f"Workspace is missing {', '.join(missing)}.")
+    voxel_size = float(workspace["voxel_size"])
+    return grid_axes(workspace["min"], workspace["max"], voxel_size), voxel_size
+
+
+def load_layout(path):
+    """Reads the sensors and workspace of a coverage layout YAML file.
+
+    The file maps 'workspace' to the dict taken by `parse_workspace` and
+    'sensors' to a list of sensor entries, see `SensorCatalog.coverage`.
+
+    Raises:
+        ValueError: If either key is missing.
+    """
+    with open(path, "r") as file:
+        layout = yaml.safe_load(file) or {}
+    if not isinstance(layout, dict) or not {"sensors", "workspace"} <= set(layout):
+        raise ValueError(f"{path} must define 'sensors' and 'workspace'.")
+    return layout["sensors"], layout["workspace"]
+
+
+def visible(
+    axes, position, rotation, horizontal_fov, vertical_fov, min_range, max_range
+):
+    """Tests which voxel centers lie inside a sensor's viewing frustum.
+
+    Sensors with both angles below 180° are modelled as pinhole cameras,
+    with a rectangular pyramid as frustum. Wider sensors, such as spinning
+    lidars, are modelled by azimuth and elevation, and 360° sees all around.
+    Occlusion is not modelled.
+
+    Args:
+        axes (list): Voxel centers along x, y and z, see `grid_axes`.
+        position (array): Sensor position in the world frame.
+        rotation (array): Sensor to world rotation, see `rotation_matrix`.
+        horizontal_fov, vertical_fov (float): Opening angles in degrees.
+        min_range, max_range (float): Distance limits in metres.
+
+    Returns:
+        array: A boolean grid of shape (len(x), len(y), len(z)).
+    """
+    # World offsets per axis, broadcast to the grid only when combined
+    offsets = [
+        (axes[axis] - position[axis]).reshape(
+            [-1 if a == axis else 1 for a in range(3)]
+        )
+        for axis in range(3)
+    ]
+    # Coordinates in the sensor frame: local = rotation.T @ offset
+    local = [
+        sum(rotation[axis, i] * offsets[axis] for axis in range(3)) for i in range(3)
+    ]
+    forward, left, up = local
+    distance_squared = sum(offset**2 for offset in offsets)
+    mask = distance_squared <= max_range**2
+    if min_range > 0:
+        mask &= distance_squared >= min_range**2
+
+    half_h, half_v = np.radians(horizontal_fov) / 2, np.radians(vertical_fov) / 2
+    if horizontal_fov < 180 and vertical_fov < 180:
+        mask &= forward > 0
+        mask &= np.abs(left) <= forward * np.tan(half_h)
+        mask &= np.abs(up) <= forward * np.tan(half_v)
+        return mask
+    if horizontal_fov < 360:
+        mask &= np.abs(np.arctan2(left, forward)) <= half_h
+    if vertical_fov < 180:
+        mask &= np.abs(np.arctan2(up, np.hypot(forward, left))) <= half_v
+    return mask
+
+
+def visibility_counts(axes, sensors):
+    """Counts how many sensors see each voxel.
+
+    Args:
+        axes (list): Voxel centers along x, y and z, see `grid_axes`.
+        sensors (list): Dicts with 'position', 'rotation' and the keys of
+            `SPEC_KEYS`.
+
+    Returns:
+        tuple: The uint16 count grid, and the number of voxels each sensor
+        sees and sees alone.
+    """
+    shape = tuple(len(axis) for axis in axes)
+    counts = np.zeros(shape, dtype=np.uint16)
+    seen = np.zeros(len(sensors), dtype=np.int64)
+    alone = np.zeros(len(sensors), dtype=np.int64)
+    # Whole x slices at a time, so temporaries stay near `CHUNK_VOXELS`
+    step = max(1, CHUNK_VOXELS // max(1, shape[1] * shape[2]))
+    for start in range(0, shape[0], step):
+        chunk = [axes[0][start : start + step], axes[1], axes[2]]
+        masks = [
+            visible(
+                chunk,
+                sensor["position"],
+                sensor["rotation"],
+                *(sensor[key] for key in SPEC_KEYS),
+            )
+            for sensor in sensors
+        ]
+        chunk_counts = counts[start : start + step]
+        for mask in masks:
+            chunk_counts += mask
+        single = chunk_counts == 1
+        for i, mask in enumerate(masks):
+            seen[i] += np.count_nonzero(mask)
+            alone[i] += np.count_nonzero(mask & single)
+    return counts, seen, alone
+
+
+def _run_minimum(labels, blind, axis):
+    """Sets each run of blind voxels along `axis` to its smallest label."""
+    labels = np.moveaxis(labels, axis, -1)
+    blind = np.moveaxis(blind, axis, -1)
+    flat_labels = labels.reshape(-1)
+    flat_blind = blind.reshape(-1)
+    # A run starts at a blind voxel with no blind voxel before it in its row
+    starts = blind.copy()
+    starts[..., 1:] &= ~blind[..., :-1]
+    starts = starts.reshape(-1)[flat_blind]
+    values = flat_labels[flat_blind]
+    minimums = np.minimum.reduceat(values, np.flatnonzero(starts))
+    flat_labels[flat_blind] = minimums[np.cumsum(starts) - 1]
+    return np.moveaxis(flat_labels.reshape(labels.shape), -1, axis)
+
+
+def label_regions(blind):
+    """Labels the face-connected regions of a boolean grid.
+
+    Each voxel starts with its own flat index as label. Runs along each
+    axis take their smallest label and labels are then replaced by the
+    label of the voxel they point to, until nothing changes.
+
+    Returns:
+        array: The flat index of each blind voxel's region, -1 elsewhere.
+    """
+    labels = np.where(blind, np.arange(blind.size).reshape(blind.shape), -1)
+    while True:
+        previous = labels
+        for axis in range(blind.ndim):
+            labels = _run_minimum(labels.copy(), blind, axis)
+        # Follow the labels, which are flat indexes of voxels in the region
+        flat = labels.reshape(-1)
+        while True:
+            jumped = np.where(flat >= 0, flat[np.maximum(flat, 0)], -1)
+            if np.array_equal(jumped, flat):
+                break
+            flat = jumped
+        labels = flat.reshape(blind.shape)
+        if np.array_equal(labels, previous):
+            return labels
+
+
+def blind_spots(counts, axes, voxel_size, min_count=1, top=5):
+    """Describes the largest regions seen by fewer than `min_count` sensors.
+
+    Returns:
+        DataFrame: Voxel count, volume in m³, center and bounding box of the
+        `top` largest regions, largest first.
+    """
+    columns = ["voxels", "volume_m3", "center", "min", "max"]
+    blind = counts < min_count
+    if top <= 0 or not blind.any():
+        return pd.DataFrame(columns=columns)
+    labels = label_regions(blind).reshape(-1)
+    flat = np.flatnonzero(blind.reshape(-1))
+    regions, inverse, sizes = np.unique(
+        labels[flat], return_inverse=True, return_counts=True
+    )
+    largest = np.lexsort((regions, -sizes))[:top]
+
+    order = np.argsort(inverse, kind="stable")
+    bounds = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    indexes = np.unravel_index(flat[order], counts.shape)
+    rows = []
+    for region in largest:
+        low, high = [], []
+        for axis, index in enumerate(indexes):
+            run = index[bounds[region] : bounds[region] + sizes[region]]
+            low.append(axes[axis][run.min()] - voxel_size / 2)
+            high.append(axes[axis][run.max()] + voxel_size / 2)
+        rows.append(
+            {
+                "voxels": int(sizes[region]),
+                "volume_m3": sizes[region] * voxel_size**3,
+                "center": [round((a + b) / 2, 6) for a, b in zip(low, high)],
+                "min": [round(value, 6) for value in low],
+                "max": [round(value, 6) for value in high],
+            }
+        )
+    return pd.DataFrame(rows, columns=columns)
@@ -14,17 +14,42 @@ import os
 import yaml
 import pandas as pd
 
+from .profiling import span
+
 
 class DataLoader:
     def __init__(self, sensors_directory="sensors"):
         self.sensors_directory = sensors_directory
 
-    def load_sensor_data(self):
-        sensor_data = []
+    def iter_sensor_files(self):
+        """Yields the paths of all sensor YAML files in the sensors directory."""
         for root, _, files in os.walk(self.sensors_directory):
             for file in files:
                 if file.endswith(".yaml"):
-                    with open(os.path.join(root, file), "r") as f:
-                        sensor = yaml.safe_load(f)
-                        sensor_data.append(sensor)
-        return pd.DataFrame(sensor_data)
+                    yield os.path.join(root, file)
+
+    @span("load_sensor_data")
+    def load_sensor_data(self):
+        sensor_data = []
+        with span("parse_yaml"):
+            for path in self.iter_sensor_files():
+                with open(path, "r") as f:
+                    sensor = yaml.safe_load(f)
+                    sensor_data.append(sensor)
+        with span("build_dataframe"):
+            return pd.DataFrame(sensor_data)
+
+    def iter_sensor_data(self, chunk_size=500):
+        """Yields the sensor data as DataFrames of at most `chunk_size` rows.
+
+        Only one chunk of parsed YAML is held in memory at a time.
+        """
+        sensor_data = []
+        for path in self.iter_sensor_files():
+            with open(path, "r") as f:
+                sensor_data.append(yaml.safe_load(f))
+            if len(sensor_data) >= chunk_size:
+                yield pd.DataFrame(sensor_data)
+                sensor_data = []
+        if sensor_data:
+            yield pd.DataFrame(sensor_data)
@@ -0,0 +1,246 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import logging
+import yaml
+import pandas as pd
+
+from .data_loader import DataLoader
+from .filter_sensors import apply_filters
+from .sqlite_store import export_sqlite
+from .units import ORIGINAL_COLUMNS, UNIT_COLUMNS
+from .validate_sensors import get_schema_path
+from . import utils
+
+EXPORT_FORMATS = ["csv", "parquet", "jsonl", "sqlite"]
+
+# File extensions that name a format differently.
+FORMAT_EXTENSIONS = {"db": "sqlite", "sqlite3": "sqlite"}
+
+DERIVED_COLUMNS = utils.NUMERIC_ATTRIBUTES + utils.COMPUTED_ATTRIBUTES
+
+
+def _flatten_schema(schema, prefix=""):
+    """Yields (column, yamale type) pairs with nested dicts joined by dots."""
+    for key, spec in schema.items():
+        if not isinstance(spec, dict):
+            continue
+        if spec.get("type") == "dict" and "schema" in spec:
+            yield from _flatten_schema(spec["schema"], f"{prefix}{key}.")
+        else:
+            yield f"{prefix}{key}", spec.get("type", "string")
+
+
+def get_export_columns():
+    """Returns the ordered export columns mapped to their yamale types.
+
+    The columns are the flattened schema fields followed by the derived
+    comparison columns and the values and units they were converted from,
+    so every chunk of an export shares the same layout.
+    """
+    schema_path = get_schema_path()
+    if schema_path is None:
+        raise FileNotFoundError("Sensor schema file not found.")
+    with open(schema_path, "r") as f:
+        schema = yaml.safe_load(f)
+
+    columns = dict(_flatten_schema(schema))
+    for column in utils.COMPUTED_ATTRIBUTES:
+        columns[column] = "float"
+    for value_column, unit_column in ORIGINAL_COLUMNS.values():
+        columns[value_column] = "float"
+        columns[unit_column] = "string"
+    return columns
+
+
+def normalize_chunk(df, column_types):
+    """Flattens a raw chunk of sensor data and adds the derived columns.
+
+    Args:
+        df (DataFrame): Raw sensor data as returned by `DataLoader`.
+        column_types (dict): Output of `get_export_columns`.
+
+    Returns:
+        DataFrame: A chunk with exactly the columns of `column_types`.
+    """
+    top_level = {column.split(".")[0] for column in column_types}
+    df = df.reindex(columns=sorted(top_level | set(df.columns)))
+    df = df.astype(object).where(df.notna(), None)
+
+    flat = pd.json_normalize(df.to_dict("records"))
+    derived = utils.preprocess_attributes(df.copy(), DERIVED_COLUMNS)
+    for column in DERIVED_COLUMNS:
+        flat[column] = derived[column].to_numpy()
+    # The converted values come with their canonical units
+    for column in UNIT_COLUMNS.values():
+        flat[column] = derived[column].to_numpy()
+    for columns in ORIGINAL_COLUMNS.values():
+        for column in columns:
+            flat[column] = derived[column].to_numpy()
+
+    flat = flat.reindex(columns=list(column_types))
+    for column, column_type in column_types.items():
+        if column_type == "float":
+            flat[column] = pd.to_numeric(flat[column], errors="coerce").astype(float)
+        elif column_type == "integer":
+            flat[column] = pd.to_numeric(flat[column], errors="coerce").astype("Int64")
+        else:
+            flat[column] = flat[column].astype(object).where(flat[column].notna(), None)
+    return flat
+
+
+def _check_columns(columns, column_types):
+    unknown = [column for column in columns or [] if column not in column_types]
+    if unknown:
+        raise ValueError(f"Unknown export columns: {', '.join(unknown)}")
+
+
+def iter_export_chunks(columns=None, chunk_size=500, **filters):
+    """Yields normalized, filtered and projected chunks of the full catalog.
+
+    Args:
+        columns (list, optional): Columns to keep. Defaults to all columns.
+        chunk_size (int, optional): Number of sensor files parsed per chunk.
+        **filters: Keyword arguments accepted by `apply_filters`.
+
+    Raises:
+        ValueError: If an unknown column is requested.
+    """
+    column_types = get_export_columns()
+    _check_columns(columns, column_types)
+
+    data_loader = DataLoader()
+    for raw_chunk in data_loader.iter_sensor_data(chunk_size=chunk_size):
+        chunk = apply_filters(normalize_chunk(raw_chunk, column_types), **filters)
+        if columns:
+            chunk = chunk[columns]
+        if not chunk.empty:
+            yield chunk
+
+
+def _join_lists(chunk, column_types):
+    """Joins list columns with '; ' for flat text formats."""
+    chunk = chunk.copy()
+    for column in chunk.columns:
+        if column_types[column] == "list":
+            chunk[column] = chunk[column].apply(
+                lambda x: "; ".join(map(str, x)) if isinstance(x, list) else None
+            )
+    return chunk
+
+
+def _parquet_schema(columns, column_types):
+    import pyarrow as pa
+
+    arrow_types = {
+        "float": pa.float64(),
+        "integer": pa.int64(),
+        "list": pa.list_(pa.string()),
+    }
+    return pa.schema(
+        [
+            (column, arrow_types.get(column_types[column], pa.string()))
+            for column in columns
+        ]
+    )
+
+
+def export_sensors(
+    output_path,
+    export_format=None,
+    columns=None,
+    chunk_size=500,
+    **filters,
+):
+    """Streams the full normalized catalog to a CSV, Parquet, JSON Lines or
+    SQLite file.
+
+    SQLite exports always hold every column, split into normalized tables,
+    see `sqlite_store.export_sqlite`.
+
+    Args:
+        output_path (str): Path of the file to write.
+        export_format (str, optional): One of `EXPORT_FORMATS`. Inferred from
+            the file extension if omitted.
+        columns (list, optional): Columns to export. Defaults to all columns.
+            Not supported for SQLite.
+        chunk_size (int, optional): Number of sensors processed per chunk.
+        **filters: Keyword arguments accepted by `apply_filters`.
+
+    Returns:
+        int: The number of exported sensors.
+    """
+    if export_format is None:
+        export_format = os.path.splitext(output_path)[1].lstrip(".").lower()
+        export_format = FORMAT_EXTENSIONS.get(export_format, export_format)
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Unsupported export format '{export_format}'. "
+            f"Choose from {', '.join(EXPORT_FORMATS)}."
+        )
+
+    if export_format == "parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "Parquet export requires pyarrow. Install it with "
+                "'pip install robotics-sensor-compare[parquet]'."
+            )
+
+    column_types = get_export_columns()
+    _check_columns(columns, column_types)
+    if export_format == "sqlite":
+        if columns:
+            raise ValueError("SQLite exports always hold every column.")
+        row_count = export_sqlite(
+            output_path, iter_export_chunks(None, chunk_size, **filters), column_types
+        )
+        logging.info(f"Exported {row_count} sensors to {output_path}")
+        return row_count
+
+    columns = columns or list(column_types)
+    parquet_writer = None
+    row_count = 0
+    # Truncate the output up front so appended chunks never mix with old data.
+    # The CSV header is written first, so exports matching nothing still have it.
+    with open(output_path, "w", newline="") as f:
+        if export_format == "csv":
+            pd.DataFrame(columns=columns).to_csv(f, index=False)
+    try:
+        for chunk in iter_export_chunks(columns, chunk_size, **filters):
+            if export_format == "csv":
+                _join_lists(chunk, column_types).to_csv(
+                    output_path, mode="a", header=False, index=False
+                )
+            elif export_format == "jsonl":
+                with open(output_path, "a") as f:
+                    chunk.to_json(f, orient="records", lines=True)
+            else:
+                schema = _parquet_schema(columns, column_types)
+                if parquet_writer is None:
+                    parquet_writer = pq.ParquetWriter(output_path, schema)
+                table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+                parquet_writer.write_table(table)
+            row_count += len(chunk)
+        if export_format == "parquet" and parquet_writer is None:
+            # Still write a valid, empty file when nothing matched the filters
+            schema = _parquet_schema(columns, column_types)
+            parquet_writer = pq.ParquetWriter(output_path, schema)
+    finally:
+        if parquet_writer is not None:
+            parquet_writer.close()
+
+    logging.info(f"Exported {row_count} sensors to {output_path}")
+    return row_count
@@ -10,11 +10,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
+import pandas as pd
 
 from .data_loader import DataLoader
-from .utils import extract_numeric, extract_resolution
+from .profiling import span
+from .utils import preprocess_attributes
 
 
+@span("filter_sensors")
 def filter_sensors(
     sensor_type=None,
     manufacturer=None,
@@ -27,47 +31,112 @@ def filter_sensors(
     max_price=None,
     min_fov=None,
     max_fov=None,
+    min_pixels_per_degree=None,
+    max_mm_per_pixel=None,
+    database=None,
 ):
+    """Loads the catalog and returns the sensors matching the criteria.
+
+    With `database`, the path of a SQLite catalog written by `export`, the
+    criteria are evaluated in SQL and only the matching rows are loaded.
+    """
+    criteria = dict(
+        sensor_type=sensor_type,
+        manufacturer=manufacturer,
+        ros_compatibility=ros_compatibility,
+        min_resolution=min_resolution,
+        max_resolution=max_resolution,
+        min_frame_rate=min_frame_rate,
+        max_frame_rate=max_frame_rate,
+        min_price=min_price,
+        max_price=max_price,
+        min_fov=min_fov,
+        max_fov=max_fov,
+        min_pixels_per_degree=min_pixels_per_degree,
+        max_mm_per_pixel=max_mm_per_pixel,
+    )
+    if database:
+        from .sqlite_store import SQLiteCatalog
+
+        with span("sqlite_filter"):
+            return SQLiteCatalog(database).filter(**criteria)
 
     data_loader = DataLoader()
     df = data_loader.load_sensor_data()
 
     # Extract and preprocess necessary data
-    df["resolution_rgb"] = df["resolution"].apply(
-        lambda x: extract_resolution(x, "rgb")
-    )
-    df["field_of_view"] = df["field_of_view"].apply(extract_numeric)
-    df["frame_rate"] = df["frame_rate"].apply(extract_numeric)
-    df["price_avg"] = df["price_range"].apply(
-        lambda x: x.get("avg") if isinstance(x, dict) else None
-    )
+    with span("preprocess"):
+        df = preprocess_attributes(
+            df,
+            [
+                "resolution_rgb",
+                "field_of_view",
+                "frame_rate",
+                "price_avg",
+                "pixels_per_degree",
+                "mm_per_pixel_at_max_range",
+            ],
+        )
+
+    with span("apply_filters"):
+        return apply_filters(df, **criteria)
+
+
+def apply_filters(
+    df,
+    sensor_type=None,
+    manufacturer=None,
+    ros_compatibility=None,
+    min_resolution=None,
+    max_resolution=None,
+    min_frame_rate=None,
+    max_frame_rate=None,
+    min_price=None,
+    max_price=None,
+    min_fov=None,
+    max_fov=None,
+    min_pixels_per_degree=None,
+    max_mm_per_pixel=None,
+):
+    """Applies the filter criteria to an already preprocessed sensor DataFrame.
 
-    # Apply filters
+    The DataFrame must provide numeric `resolution_rgb`, `frame_rate`,
+    `price_avg` and `field_of_view` columns, plus `pixels_per_degree` and
+    `mm_per_pixel_at_max_range` when filtering on them. The criteria are
+    combined into one mask, so the DataFrame is only copied once.
+    """
+    mask = np.ones(len(df), dtype=bool)
     if sensor_type:
-        df = df[df["sensor_type"].str.contains(sensor_type, case=False, na=False)]
+        mask &= contains_mask(df["sensor_type"], sensor_type)
     if manufacturer:
-        df = df[df["manufacturer"].str.contains(manufacturer, case=False, na=False)]
-    if min_resolution:
-        df = df[df["resolution_rgb"] >= min_resolution]
-    if max_resolution:
-        df = df[df["resolution_rgb"] <= max_resolution]
-    if min_frame_rate:
-        df = df[df["frame_rate"] >= min_frame_rate]
-    if max_frame_rate:
-        df = df[df["frame_rate"] <= max_frame_rate]
-    if min_price:
-        df = df[df["price_avg"] >= min_price]
-    if max_price:
-        df = df[df["price_avg"] <= max_price]
-    if min_fov:
-        df = df[df["field_of_view"] >= min_fov]
-    if max_fov:
-        df = df[df["field_of_view"] <= max_fov]
+        mask &= contains_mask(df["manufacturer"], manufacturer)
+    bounds = [
+        ("resolution_rgb", min_resolution, max_resolution),
+        ("frame_rate", min_frame_rate, max_frame_rate),
+        ("price_avg", min_price, max_price),
+        ("field_of_view", min_fov, max_fov),
+        ("pixels_per_degree", min_pixels_per_degree, None),
+        ("mm_per_pixel_at_max_range", None, max_mm_per_pixel),
+    ]
+    for column, low, high in bounds:
+        if low:
+            mask &= (df[column] >= low).to_numpy()
+        if high:
+            mask &= (df[column] <= high).to_numpy()
     if ros_compatibility:
-        df = df[
-            df["ros_compatibility"].apply(
-                lambda x: ros_compatibility in x if isinstance(x, list) else False
-            )
-        ]
+        mask &= np.array(
+            [
+                isinstance(x, list) and ros_compatibility in x
+                for x in df["ros_compatibility"]
+            ],
+            dtype=bool,
+        )
+
+    return df if mask.all() else df[mask]
+
 
-    return df
+def contains_mask(series, text):
+    """Case-insensitive `str.contains`, evaluated once per distinct value."""
+    values = pd.Series(series.unique())
+    matching = values[values.str.contains(text, case=False, na=False)]
+    return series.isin(matching).to_numpy()
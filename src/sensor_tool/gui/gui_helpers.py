@@ -13,52 +13,46 @@
 # gui_helpers.py
 
 import customtkinter as ctk
+import numpy as np
 import os
 import re
 import matplotlib
 import openpyxl
-import threading
+import time
 from tkinter import messagebox, filedialog
 import yaml
 
 matplotlib.use("TkAgg")
-from sensor_tool.visualize import visualize_comparison
-from sensor_tool.data_loader import DataLoader
+from sensor_tool.gui.gui_sensor_picker import SensorPicker, SensorPickerModel
+from sensor_tool.validate_sensors import get_schema_path
 from sensor_tool import utils
 
+# How often the Tk main loop checks whether the background load finished
+CATALOG_POLL_MS = 100
+# Wait for a pause in typing before recomputing the live ranking
+PREVIEW_DELAY_MS = 300
+PREVIEW_POLL_MS = 50
+PREVIEW_TOP = 10
 
-class GUIHelpers:
-    def adjust_layout(self, event):
-        """
-        Adjusts the font size and layout based on window resizing.
 
-        Args:
-            event (Event): The resize event.
-        """
+def meets_benchmarks(df, attributes, benchmarks):
+    """
+    Returns a mask of the sensors that reach every benchmark.
+
+    Attributes without a known better direction are not checked.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for attribute, benchmark in zip(attributes, benchmarks):
+        higher_better = utils.is_higher_better(attribute)
+        if higher_better is None:
+            continue
+        values = df[attribute].to_numpy(dtype=float)
+        # NaN compares False, so sensors without a value never pass
+        mask &= values >= benchmark if higher_better else values <= benchmark
+    return mask
 
-        new_font_size = min(
-            18, max(self.base_font_size, int(self.root.winfo_width() / 80))
-        )
-        font = ("Helvetica", new_font_size, "bold")
-        for widget in self.main_frame.winfo_children():
-            if isinstance(widget, ctk.CTkLabel) or isinstance(widget, ctk.CTkCheckBox):
-                widget.configure(font=font)
-            elif isinstance(widget, ctk.CTkEntry):
-                widget.configure(font=("Helvetica", new_font_size))
-
-        # Adjust font size for checkboxes in export_frame
-        for widget in self.export_frame.winfo_children():
-            if isinstance(widget, ctk.CTkCheckBox):
-                widget.configure(font=font)
-
-        # Adjust font size for buttons
-        self.compare_button.configure(font=("Helvetica", new_font_size + 2, "bold"))
-        self.quit_button.configure(font=("Helvetica", new_font_size + 2, "bold"))
-        self.view_sensors_button.configure(font=("Helvetica", new_font_size))
-        self.view_attributes_button.configure(font=("Helvetica", new_font_size))
-        self.clear_fields_button.configure(font=("Helvetica", new_font_size))
-        self.appearance_mode_switch.configure(font=("Helvetica", new_font_size))
 
+class GUIHelpers:
     def fade_in(self):
         """
         Creates a fade-in effect when the application starts.
@@ -120,38 +114,227 @@ class GUIHelpers:
 
             # Disable the 'Start Comparison' button when fields are cleared
             self.compare_button.configure(state="disabled")
+        self.schedule_score_preview()
+
+    def start_catalog_load(self):
+        """
+        Loads the sensor catalog and schema on a background thread.
+
+        The first call parses every sensor file. Later calls, e.g. from the
+        'Refresh Catalog' button, only re-read files that changed on disk.
+        """
+        if self.catalog_future is not None and not self.catalog_future.done():
+            return
+        self.catalog_refreshing = self.catalog.version > 0
+        self.set_catalog_state(loading=True)
+        self.catalog_future = self.loader.submit(self.load_catalog_resources)
+        self.root.after(CATALOG_POLL_MS, self.poll_catalog_load)
+
+    def load_catalog_resources(self):
+        """
+        Refreshes the catalog and reads the schema. Runs on the loader thread.
+
+        Returns:
+            tuple: Whether the catalog changed and the elapsed seconds.
+        """
+        start = time.perf_counter()
+        changed = self.catalog.refresh()
+        # Build the search index here rather than on the first keystroke
+        self.catalog.id_index.index
+        if self.schema is None:
+            self.schema = self.load_schema()
+        return changed, time.perf_counter() - start
+
+    def load_schema(self):
+        """
+        Reads the sensor schema from the package's config directory.
+        """
+        schema_path = get_schema_path()
+        if schema_path is None:
+            raise FileNotFoundError("Sensor schema file not found.")
+        with open(schema_path, "r") as f:
+            return yaml.safe_load(f)
+
+    def poll_catalog_load(self):
+        """
+        Updates the loading state once the background load has finished.
+        """
+        if not self.catalog_future.done():
+            self.root.after(CATALOG_POLL_MS, self.poll_catalog_load)
+            return
+        try:
+            changed, elapsed = self.catalog_future.result()
+        except Exception as e:
+            self.set_catalog_state(error=f"Failed to load the sensor catalog: {e}")
+            return
+        self.schedule_score_preview()
+        count = len(self.catalog.data)
+        message = f"{count} sensors loaded in {elapsed:.1f} s"
+        if self.catalog_refreshing:
+            message = f"{count} sensors, " + (
+                "catalog updated" if changed else "catalog is up to date"
+            )
+        self.set_catalog_state(message=message)
+
+    def set_catalog_state(self, loading=False, message="", error=None):
+        """
+        Shows the catalog loading state and enables the dialogs that need it.
+        """
+        ready = self.catalog.version > 0 and not error
+        if loading:
+            message = (
+                "Refreshing sensor catalog..." if ready else "Loading sensor catalog..."
+            )
+        self.catalog_status_label.configure(
+            text=error or message, text_color="red" if error else "gray"
+        )
+        # Dialogs keep working on the previous data while a refresh runs
+        dialog_state = "normal" if ready else "disabled"
+        self.view_sensors_button.configure(state=dialog_state)
+        self.view_attributes_button.configure(state=dialog_state)
+        self.refresh_catalog_button.configure(state="disabled" if loading else "normal")
+
+    def schedule_score_preview(self, event=None):
+        """
+        Recomputes the live ranking once the user stops typing.
+        """
+        if self.preview_after_id is not None:
+            self.root.after_cancel(self.preview_after_id)
+        self.preview_after_id = self.root.after(
+            PREVIEW_DELAY_MS, self.start_score_preview
+        )
+
+    def start_score_preview(self):
+        """
+        Submits a ranking of the whole catalog for the current inputs.
+
+        Runs on the loader thread so it never overlaps a catalog refresh. A
+        newer preview cancels a pending one, and results of superseded
+        previews are dropped.
+        """
+        self.preview_after_id = None
+        if self.catalog.version == 0:
+            return
+        attributes = [
+            attr.strip()
+            for attr in self.attributes_entry.get().split(",")
+            if attr.strip()
+        ]
+        if not attributes:
+            self.show_score_preview("Enter attributes to rank the catalog.")
+            return
+        try:
+            weights, _ = self.parse_optional_input(
+                self.weights_entry.get(), len(attributes), "weights"
+            )
+            benchmarks, _ = self.parse_optional_input(
+                self.benchmarks_entry.get(),
+                len(attributes),
+                "benchmarks",
+                parse_resolution=True,
+            )
+        except ValueError as e:
+            self.show_score_preview(str(e), error=True)
+            return
+
+        if self.preview_future is not None:
+            self.preview_future.cancel()
+        self.preview_generation += 1
+        self.preview_future = self.loader.submit(
+            self.compute_score_preview, attributes, weights, benchmarks
+        )
+        self.root.after(
+            PREVIEW_POLL_MS, self.poll_score_preview, self.preview_generation
+        )
+
+    def compute_score_preview(self, attributes, weights, benchmarks):
+        """
+        Ranks every sensor in the catalog. Runs on the loader thread.
+
+        Returns:
+            str: The ranking text shown in the preview panel.
+        """
+        ranked = self.catalog.rank(attributes, weights, top=PREVIEW_TOP)
+        lines = [
+            f"{rank:>2}. {sensor_id:<36} {score:5.2f}"
+            for rank, (sensor_id, score) in enumerate(
+                zip(ranked["sensor_id"], ranked["score"]), start=1
+            )
+        ]
+        total = len(self.catalog.data)
+        if benchmarks:
+            passed = meets_benchmarks(ranked, attributes, benchmarks)
+            lines = [
+                line + ("  meets benchmarks" if ok else "")
+                for line, ok in zip(lines, passed)
+            ]
+            count = meets_benchmarks(self.catalog.data, attributes, benchmarks).sum()
+            lines.append(f"\n{count} of {total} sensors meet all benchmarks")
+        else:
+            lines.append(f"\nTop {len(ranked)} of {total} sensors")
+        return "\n".join(lines)
+
+    def poll_score_preview(self, generation):
+        """
+        Shows the preview result once it is ready, unless it is outdated.
+        """
+        if generation != self.preview_generation:
+            return
+        if not self.preview_future.done():
+            self.root.after(PREVIEW_POLL_MS, self.poll_score_preview, generation)
+            return
+        try:
+            self.show_score_preview(self.preview_future.result())
+        except (KeyError, ValueError) as e:
+            self.show_score_preview(str(e).strip("'\""), error=True)
+
+    def show_score_preview(self, text, error=False):
+        self.preview_textbox.configure(state="normal")
+        self.preview_textbox.delete("1.0", "end")
+        self.preview_textbox.insert("1.0", text)
+        self.preview_textbox.configure(
+            state="disabled", text_color="red" if error else ("gray10", "gray90")
+        )
+
+    def get_sensor_picker_model(self):
+        """
+        Returns the sensor picker data, rebuilt only when the catalog changed.
+        """
+        snapshot = self.catalog.snapshot
+        cached = self.sensor_picker_model
+        if cached is None or cached[0] != snapshot.version:
+            model = SensorPickerModel(snapshot.df, snapshot.id_index)
+            cached = (snapshot.version, model)
+            self.sensor_picker_model = cached
+        return cached[1]
+
+    def get_sensor_id_index(self):
+        """
+        Returns the catalog's sensor ID index, or None until the catalog is loaded.
+        """
+        if self.catalog.version == 0:
+            return None
+        return self.catalog.id_index
 
     def show_available_sensors(self):
         """
-        Displays the list of available sensors in a new window.
+        Displays a searchable list of the available sensors in a new window.
         """
         # Create a new Toplevel window
         self.sensor_window = ctk.CTkToplevel(self.root)
         self.sensor_window.title("Available Sensors")
-        self.sensor_window.geometry("600x400")
-
-        # Get the list of sensor IDs
-        data_loader = DataLoader()
-        df = data_loader.load_sensor_data()
-        sensor_ids = df["sensor_id"].tolist()
+        self.sensor_window.geometry("700x600")
 
-        # Create a scrollable frame
-        scroll_frame = ctk.CTkScrollableFrame(self.sensor_window)
-        scroll_frame.pack(fill="both", expand=True)
-
-        # Create checkboxes for each sensor
-        self.sensor_vars = {}
-        for idx, sid in enumerate(sensor_ids):
-            var = ctk.BooleanVar()
-            chk = ctk.CTkCheckBox(
-                scroll_frame,
-                text=sid,
-                variable=var,
-                font=("Helvetica", self.base_font_size - 1),
-                command=self.update_sensor_checkbox_states,
-            )
-            chk.pack(anchor="w", pady=2)
-            self.sensor_vars[sid] = {"var": var, "chk": chk}
+        current_ids = [
+            sid.strip() for sid in self.sensor_ids_entry.get().split(",") if sid.strip()
+        ]
+        self.sensor_picker = SensorPicker(
+            self.sensor_window,
+            self.get_sensor_picker_model(),
+            selected=current_ids,
+            font_size=self.layout.size,
+        )
+        self.sensor_picker.pack(fill="both", expand=True)
 
         # Confirm Selection Button
         confirm_button = ctk.CTkButton(
@@ -170,31 +353,13 @@ class GUIHelpers:
             font=("Helvetica", self.base_font_size),
         )
         back_button.pack(pady=5)
-
-    def update_sensor_checkbox_states(self):
-        """
-        Updates the state of sensor checkboxes based on the selection limit.
-        """
-        selected_count = sum(
-            1 for sid in self.sensor_vars if self.sensor_vars[sid]["var"].get()
-        )
-        if selected_count >= 4:
-            # Disable unselected checkboxes
-            for sid in self.sensor_vars:
-                if not self.sensor_vars[sid]["var"].get():
-                    self.sensor_vars[sid]["chk"].configure(state="disabled")
-        else:
-            # Enable all checkboxes
-            for sid in self.sensor_vars:
-                self.sensor_vars[sid]["chk"].configure(state="normal")
+        self.layout.register_tree(self.sensor_window, offset=-1)
 
     def confirm_sensor_selection(self):
         """
         Confirms the selected sensors and updates the sensor IDs entry field.
         """
-        selected_sensors = [
-            sid for sid in self.sensor_vars if self.sensor_vars[sid]["var"].get()
-        ]
+        selected_sensors = self.sensor_picker.selected
         if selected_sensors:
             self.sensor_ids_entry.delete(0, "end")
             self.sensor_ids_entry.insert(0, ", ".join(selected_sensors))
@@ -208,10 +373,10 @@ class GUIHelpers:
         Returns:
             list: A list of attribute display names with units.
         """
-        # Load sensor schema to get the list of attributes
-        schema_path = os.path.join("config", "sensor_schema.yaml")
-        with open(schema_path, "r") as f:
-            schema = yaml.safe_load(f)
+        # Use the schema loaded at startup
+        if self.schema is None:
+            self.schema = self.load_schema()
+        schema = self.schema
 
         exclude_keys = [
             "schema_version",
@@ -252,7 +417,6 @@ class GUIHelpers:
         for attr in attributes:
             unit = utils.get_unit(attr)
             display_name = f"{attr} ({unit})" if unit else attr
-            # display_name = f"{utils.format_label(attr)} ({unit})" if unit else utils.format_label(attr)
             attribute_list.append(display_name)
         return attribute_list
 
@@ -306,6 +470,7 @@ class GUIHelpers:
             font=("Helvetica", self.base_font_size),
         )
         back_button.pack(pady=5)
+        self.layout.register_tree(self.attribute_window, offset=-1)
 
     def update_attribute_checkbox_states(self):
         """
@@ -367,11 +532,11 @@ class GUIHelpers:
         self.export_excel_var.set(False)
         self.save_plot_var.set(False)
 
-    def process_optional_input(
+    def parse_optional_input(
         self, input_str, expected_length, input_name, parse_resolution=False
     ):
         """
-        Helper function to process weights or benchmarks, with optional resolution parsing.
+        Parses weights or benchmarks, with optional resolution parsing.
 
         Args:
             input_str (str): The input string.
@@ -380,47 +545,57 @@ class GUIHelpers:
             parse_resolution (bool): Whether to parse resolution formats.
 
         Returns:
-            tuple: A tuple of values and labels.
-        """
-
-        if input_str:
-            try:
-                values = []
-                labels = []
-                for x in input_str.split(","):
-                    x = x.strip()
-                    labels.append(x)
-                    if parse_resolution and re.match(r"^\d+x\d+$", x):
-                        width, height = map(int, x.lower().split("x"))
-                        values.append(width * height)
-                    elif parse_resolution and re.match(
-                        r"^\d+\.?\d*\s*mp$", x, re.IGNORECASE
-                    ):
-                        mp_value = (
-                            float(re.findall(r"\d+\.?\d*", x)[0]) * 1_000_000
-                        )  # Convert MP to pixels
-                        values.append(mp_value)
-                    else:
-                        try:
-                            values.append(float(x))
-                        except ValueError:
-                            messagebox.showerror(
-                                "Input Error",
-                                f"{input_name} must be numeric or a valid resolution format.",
-                            )
-                            return None, None
-                if len(values) != expected_length:
+            tuple: A tuple of values and labels, or (None, None) if empty.
+
+        Raises:
+            ValueError: If a value is invalid or the count does not match.
+        """
+        if not input_str:
+            return None, None
+        values = []
+        labels = []
+        for x in input_str.split(","):
+            x = x.strip()
+            labels.append(x)
+            if parse_resolution and re.match(r"^\d+x\d+$", x):
+                width, height = map(int, x.lower().split("x"))
+                values.append(width * height)
+            elif parse_resolution and re.match(r"^\d+\.?\d*\s*mp$", x, re.IGNORECASE):
+                mp_value = (
+                    float(re.findall(r"\d+\.?\d*", x)[0]) * 1_000_000
+                )  # Convert MP to pixels
+                values.append(mp_value)
+            else:
+                try:
+                    values.append(float(x))
+                except ValueError:
                     raise ValueError(
-                        f"Number of {input_name} must match the number of attributes."
+                        f"{input_name} must be numeric or a valid resolution format."
                     )
-                return values, labels
-            except ValueError as e:
-                messagebox.showerror(
-                    "Input Error",
-                    f"{input_name.capitalize()} must be numeric or a valid resolution and match the attribute count.",
-                )
-                return None, None
-        return None, None
+        if len(values) != expected_length:
+            raise ValueError(
+                f"{input_name.capitalize()} must be numeric or a valid resolution and match the attribute count."
+            )
+        return values, labels
+
+    def process_optional_input(
+        self, input_str, expected_length, input_name, parse_resolution=False
+    ):
+        """
+        Helper function to process weights or benchmarks, with optional resolution parsing.
+
+        Shows an error dialog and returns (None, None) for invalid input.
+
+        Returns:
+            tuple: A tuple of values and labels.
+        """
+        try:
+            return self.parse_optional_input(
+                input_str, expected_length, input_name, parse_resolution
+            )
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            return None, None
 
     def execute_comparison(
         self,
@@ -434,7 +609,7 @@ class GUIHelpers:
         save_plot,
     ):
         """
-        Executes the sensor comparison in a separate thread.
+        Starts the sensor comparison as a cancellable background job.
 
         Args:
             sensor_ids (list): List of sensor IDs.
@@ -446,35 +621,90 @@ class GUIHelpers:
             export_excel (bool): Whether to export to Excel.
             save_plot (bool): Whether to save the plot.
         """
-        try:
-            # Call the visualization function
-            visualize_comparison(
-                sensor_ids=sensor_ids,
-                attributes=attributes,
-                weights=weights,
-                benchmarks=benchmarks,
-                benchmark_labels=benchmark_labels,
-                save_plot=self.save_plot_path,
-                export_csv=export_csv,
-                export_csv_path=self.save_csv_path,
-                export_excel=export_excel,
-                export_excel_path=self.save_excel_path,
-            )
+        job = self.jobs.start(
+            self.comparison_job,
+            sensor_ids,
+            attributes,
+            weights,
+            export_csv,
+            export_excel,
+            on_progress=self.show_job_progress,
+            on_done=lambda comparison: self.finish_comparison(
+                comparison,
+                attributes,
+                benchmarks,
+                benchmark_labels,
+                export_csv,
+                export_excel,
+                save_plot,
+            ),
+            on_error=self.fail_comparison,
+            on_cancelled=lambda: self.end_comparison_job("Comparison cancelled."),
+        )
+        if job is None:
+            return
+        self.compare_button.configure(state="disabled")
+        self.cancel_button.configure(state="normal")
+        self.cancel_button.grid()
+        self.progress_bar.grid()
+        self.progress_label.grid()
+        self.show_job_progress(0.0, "Waiting for the sensor catalog...")
 
-            # Update progress bar to indicate completion
-            self.root.after(0, self.progress_bar.set, 1.0)
+    def comparison_job(
+        self, job, sensor_ids, attributes, weights, export_csv, export_excel
+    ):
+        """
+        Loads, preprocesses, scores and exports a comparison. Runs on the
+        loader thread; the plot is rendered afterwards on the Tk thread.
+
+        Returns:
+            DataFrame: The attribute values and scores of the sensors.
+        """
+        job.progress(0.1, "Loading sensor catalog...")
+        self.catalog.refresh()
 
-            # Re-enable the "Start Comparison" button and hide progress bar
-            self.root.after(0, self.compare_button.configure, {"state": "normal"})
-            self.root.after(0, self.progress_bar.grid_remove)
+        job.progress(0.3, "Preprocessing sensor data...")
+        selected = self.catalog.select(sensor_ids)
+        unknown = [attr for attr in attributes if attr not in selected.columns]
+        if unknown:
+            raise KeyError(f"Attribute {', '.join(unknown)} not found in data.")
 
-            messagebox.showinfo("Success", "Comparison completed successfully.")
+        job.progress(0.5, "Scoring sensors...")
+        comparison = self.catalog.compare(sensor_ids, attributes, weights)
 
-            # Show status messages
-            messages = [
-                "Comparison completed successfully. You can start a new comparison."
-            ]
+        if (export_csv and self.save_csv_path) or (
+            export_excel and self.save_excel_path
+        ):
+            job.progress(0.7, "Exporting comparison data...")
+            export_data = comparison[["sensor_id"] + attributes]
+            if export_csv and self.save_csv_path:
+                export_data.to_csv(self.save_csv_path, index=False)
+            if export_excel and self.save_excel_path:
+                export_data.to_excel(self.save_excel_path, index=False)
+
+        job.progress(0.9, "Rendering plot...")
+        return comparison
+
+    def finish_comparison(
+        self,
+        comparison,
+        attributes,
+        benchmarks,
+        benchmark_labels,
+        export_csv,
+        export_excel,
+        save_plot,
+    ):
+        """
+        Renders a finished comparison job and reports the written files.
+        """
+        try:
+            self.plot_canvas.show_comparison(
+                comparison, attributes, benchmarks, benchmark_labels
+            )
+            messages = ["Comparison updated. Change the inputs to compare again."]
             if save_plot and self.save_plot_path:
+                self.plot_canvas.save(self.save_plot_path)
                 rel_path = os.path.relpath(self.save_plot_path)
                 messages.append(f"Plot saved at '{rel_path}'")
             if export_csv and self.save_csv_path:
@@ -483,15 +713,41 @@ class GUIHelpers:
             if export_excel and self.save_excel_path:
                 rel_path = os.path.relpath(self.save_excel_path)
                 messages.append(f"Comparison data exported to '{rel_path}'")
+        except Exception as e:
+            self.fail_comparison(e)
+            return
+        self.end_comparison_job()
+        self.show_status_messages(messages)
+
+    def fail_comparison(self, error):
+        self.end_comparison_job()
+        if isinstance(error, (KeyError, ValueError)):
+            messagebox.showerror("Input Error", str(error).strip("'\""))
+        else:
+            messagebox.showerror("Error", f"An error occurred: {error}")
 
-            self.root.after(0, self.show_status_messages, messages)
+    def show_job_progress(self, fraction, message):
+        self.progress_bar.set(fraction)
+        self.progress_label.configure(text=message)
 
-        except Exception as e:
-            self.root.after(0, self.compare_button.configure, {"state": "normal"})
-            self.root.after(0, self.progress_bar.grid_remove)
-            self.root.after(
-                0, lambda e=e: messagebox.showerror("Error", f"An error occurred: {e}")
-            )
+    def cancel_comparison(self):
+        """
+        Asks the running comparison to stop at its next stage.
+        """
+        self.jobs.cancel()
+        self.cancel_button.configure(state="disabled")
+        self.progress_label.configure(text="Cancelling...")
+
+    def end_comparison_job(self, message=None):
+        """
+        Hides the progress widgets and re-enables the 'Start Comparison' button.
+        """
+        self.progress_bar.grid_remove()
+        self.progress_label.grid_remove()
+        self.cancel_button.grid_remove()
+        self.validate_mandatory_fields()
+        if message:
+            self.show_status_messages([message])
 
     def run_comparison(self):
         """
@@ -560,26 +816,16 @@ class GUIHelpers:
             if not self.save_excel_path:
                 return
 
-        # Disable the "Start Comparison" button and show progress bar
-        self.compare_button.configure(state="disabled")
-        self.progress_bar.grid()
-        self.progress_bar.set(0.3)
-
-        # Run the comparison in a separate thread
-        threading.Thread(
-            target=self.execute_comparison,
-            args=(
-                sensor_ids,
-                attributes,
-                weights,
-                benchmarks,
-                benchmark_labels,
-                export_csv,
-                export_excel,
-                save_plot,
-            ),
-            daemon=True,
-        ).start()
+        self.execute_comparison(
+            sensor_ids,
+            attributes,
+            weights,
+            benchmarks,
+            benchmark_labels,
+            export_csv,
+            export_excel,
+            save_plot,
+        )
 
     def show_status_messages(self, messages):
         """
@@ -594,7 +840,7 @@ class GUIHelpers:
             status_label = ctk.CTkLabel(
                 self.main_frame,
                 text=message,
-                font=("Helvetica", self.base_font_size),
+                font=self.layout.font(),
                 text_color="green",
             )
             status_label.grid(row=10 + idx, column=0, columnspan=2, padx=20, pady=5)
@@ -624,6 +870,7 @@ class GUIHelpers:
             self.compare_button.configure(state="normal")
         else:
             self.compare_button.configure(state="disabled")
+        self.schedule_score_preview()
 
     def fade_out(self):
         """
@@ -643,4 +890,5 @@ class GUIHelpers:
         """
         result = messagebox.askyesno("Confirm Exit", "Are you sure you want to exit?")
         if result:
+            self.jobs.cancel()
             self.fade_out()
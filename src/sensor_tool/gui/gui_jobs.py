@@ -0,0 +1,138 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# gui_jobs.py
+
+import queue
+import threading
+
+JOB_POLL_MS = 50
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when the user cancelled it."""
+
+
+class Job:
+    """
+    Handle passed to a running job for reporting progress.
+
+    Cancellation is cooperative: the job stops the next time it reports
+    progress or calls `check_cancelled`, i.e. at a stage boundary.
+    """
+
+    def __init__(self, events):
+        self.events = events
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def check_cancelled(self):
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+
+    def progress(self, fraction, message):
+        """Starts a new stage. Runs on the worker thread."""
+        self.check_cancelled()
+        self.events.put(("progress", (fraction, message)))
+
+
+class JobRunner:
+    """
+    Runs one GUI job at a time on a shared executor.
+
+    Progress and results travel through a thread-safe queue that the Tk
+    loop drains with `root.after`, so the callbacks run on the main thread.
+    """
+
+    def __init__(self, root, executor):
+        self.root = root
+        self.executor = executor
+        self.events = queue.Queue()
+        self.job = None
+        self.future = None
+        self.callbacks = {}
+
+    @property
+    def busy(self):
+        return self.job is not None
+
+    def start(
+        self,
+        function,
+        *args,
+        on_progress=None,
+        on_done=None,
+        on_error=None,
+        on_cancelled=None,
+    ):
+        """
+        Submits `function(job, *args)` unless another job is still running.
+
+        Returns:
+            Job: The started job, or None if the runner was busy.
+        """
+        if self.busy:
+            return None
+        self.job = Job(self.events)
+        self.callbacks = {
+            "progress": on_progress,
+            "done": on_done,
+            "error": on_error,
+            "cancelled": on_cancelled,
+        }
+        self.future = self.executor.submit(self.run, self.job, function, args)
+        self.root.after(JOB_POLL_MS, self.poll)
+        return self.job
+
+    def run(self, job, function, args):
+        """Runs the job on the executor thread and queues its outcome."""
+        try:
+            result = function(job, *args)
+            job.check_cancelled()
+        except JobCancelled:
+            self.events.put(("cancelled", None))
+        except Exception as e:
+            self.events.put(("error", e))
+        else:
+            self.events.put(("done", result))
+
+    def cancel(self):
+        if not self.busy:
+            return
+        self.job.cancel()
+        # A job still waiting in the executor queue never reaches `run`
+        if self.future.cancel():
+            self.events.put(("cancelled", None))
+
+    def poll(self):
+        """Dispatches the queued events on the Tk thread."""
+        while True:
+            try:
+                kind, value = self.events.get_nowait()
+            except queue.Empty:
+                self.root.after(JOB_POLL_MS, self.poll)
+                return
+            callback = self.callbacks.get(kind)
+            if kind != "progress":
+                self.job = None
+                self.future = None
+            if callback is not None:
+                if kind == "progress":
+                    callback(*value)
+                elif kind == "cancelled":
+                    callback()
+                else:
+                    callback(value)
+            if kind != "progress":
+                return
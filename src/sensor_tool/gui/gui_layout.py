@@ -0,0 +1,101 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# gui_layout.py
+
+import customtkinter as ctk
+
+# Widgets whose font follows the window size
+SCALABLE_WIDGETS = (
+    ctk.CTkLabel,
+    ctk.CTkCheckBox,
+    ctk.CTkEntry,
+    ctk.CTkButton,
+    ctk.CTkSwitch,
+    ctk.CTkOptionMenu,
+)
+
+
+class LayoutManager:
+    """
+    Scales the fonts of registered widgets with the window width.
+
+    Resize events are debounced, and the font size only takes whole-point
+    steps, so a drag that stays within one size touches no widgets. Fonts
+    are cached per size and weight and shared by every widget using them.
+    """
+
+    def __init__(
+        self, root, base_size=14, max_size=18, pixels_per_point=80, delay_ms=100
+    ):
+        self.root = root
+        self.base_size = base_size
+        self.max_size = max_size
+        self.pixels_per_point = pixels_per_point
+        self.delay_ms = delay_ms
+        self.size = base_size
+        self.fonts = {}
+        self.widgets = []
+        self.after_id = None
+
+    def font(self, offset=0, weight="normal"):
+        """Returns the shared font for the current size plus `offset`."""
+        key = (self.size + offset, weight)
+        font = self.fonts.get(key)
+        if font is None:
+            font = ctk.CTkFont(family="Helvetica", size=key[0], weight=weight)
+            self.fonts[key] = font
+        return font
+
+    def register(self, widget, offset=0, weight="normal"):
+        """Applies the current font to `widget` and keeps it updated."""
+        widget.configure(font=self.font(offset, weight))
+        self.widgets.append((widget, offset, weight))
+        return widget
+
+    def register_tree(self, widget, offset=0, weight="normal"):
+        """Registers every scalable widget inside `widget`, e.g. a dialog."""
+        self.forget_destroyed()
+        self._register_tree(widget, offset, weight)
+
+    def _register_tree(self, widget, offset, weight):
+        for child in widget.winfo_children():
+            if isinstance(child, SCALABLE_WIDGETS):
+                self.register(child, offset, weight)
+            else:
+                self._register_tree(child, offset, weight)
+
+    def forget_destroyed(self):
+        """Drops the widgets of dialogs that have been closed."""
+        self.widgets = [entry for entry in self.widgets if entry[0].winfo_exists()]
+
+    def on_configure(self, event):
+        """Schedules a font update once resizing pauses."""
+        # <Configure> bound on the root is also delivered for every child
+        if event.widget is not self.root:
+            return
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+        self.after_id = self.root.after(self.delay_ms, self.apply)
+
+    def apply(self):
+        self.after_id = None
+        size = min(
+            self.max_size,
+            max(self.base_size, self.root.winfo_width() // self.pixels_per_point),
+        )
+        if size == self.size:
+            return
+        self.size = size
+        self.forget_destroyed()
+        for widget, offset, weight in self.widgets:
+            widget.configure(font=self.font(offset, weight))
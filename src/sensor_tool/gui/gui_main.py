@@ -14,7 +14,11 @@
 
 import customtkinter as ctk
 import signal
+from concurrent.futures import ThreadPoolExecutor
 
+from sensor_tool.catalog import SensorCatalog
+from sensor_tool.gui.gui_jobs import JobRunner
+from sensor_tool.gui.gui_layout import LayoutManager
 from sensor_tool.gui.gui_widgets import GUIWidgets
 from sensor_tool.gui.gui_helpers import GUIHelpers
 
@@ -27,8 +31,8 @@ class SensorComparisonGUI(GUIWidgets, GUIHelpers):
     def __init__(self, root):
         self.root = root
         self.root.title("Robotics Sensor Compare Tool")
-        self.root.geometry("1000x700")
-        self.root.minsize(1000, 700)
+        self.root.geometry("1600x800")
+        self.root.minsize(1300, 700)
         ctk.set_appearance_mode("Dark")
         ctk.set_default_color_theme("dark-blue")
 
@@ -39,12 +43,25 @@ class SensorComparisonGUI(GUIWidgets, GUIHelpers):
 
         # Initialize base font size
         self.base_font_size = 14
+        self.layout = LayoutManager(self.root, base_size=self.base_font_size)
+
+        # The catalog and schema are shared by all dialogs and comparisons
+        self.catalog = SensorCatalog()
+        self.schema = None
+        self.catalog_future = None
+        self.sensor_picker_model = None
+        self.loader = ThreadPoolExecutor(max_workers=1)
+        self.jobs = JobRunner(self.root, self.loader)
+        self.preview_future = None
+        self.preview_generation = 0
+        self.preview_after_id = None
 
         self.root.attributes("-alpha", 0.0)
         self.create_widgets()
+        self.start_catalog_load()
 
         # Bind events
-        self.root.bind("<Configure>", self.adjust_layout)
+        self.root.bind("<Configure>", self.layout.on_configure)
         self.root.protocol("WM_DELETE_WINDOW", self.quit_application)
         signal.signal(signal.SIGINT, self.handle_ctrl_c)
 
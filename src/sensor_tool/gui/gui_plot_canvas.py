@@ -0,0 +1,248 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# gui_plot_canvas.py
+
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+
+from sensor_tool import utils
+from sensor_tool.units import original_labels
+from sensor_tool.visualize import DARK_BLUE, comparison_colors, comparison_legend
+
+BAR_WIDTH = 0.4
+
+
+class BarPanel:
+    """
+    One axes of the comparison with its bar and value label artists.
+
+    The bars and labels are animated artists, so changing their heights,
+    colours or text only needs a blit instead of a full redraw.
+    """
+
+    def __init__(self, ax, num_sensors):
+        self.ax = ax
+        x_positions = np.arange(num_sensors)
+        self.bars = ax.bar(
+            x_positions,
+            np.zeros(num_sensors),
+            edgecolor="black",
+            alpha=0.7,
+            width=BAR_WIDTH,
+            animated=True,
+        )
+        self.labels = [
+            ax.text(x, 0, "", ha="center", va="bottom", fontsize=10, animated=True)
+            for x in x_positions
+        ]
+        ax.set_xticks(x_positions)
+        ax.set_xlabel("Sensor", fontsize=12)
+        ax.grid(axis="y", linestyle="--", alpha=0.7)
+        self.y_max = None
+        self.tick_labels = None
+        self.benchmark = None
+        self.benchmark_artists = []
+
+    @property
+    def artists(self):
+        return list(self.bars) + self.labels
+
+    def set_values(self, values, colors, y_max, notes=None):
+        """Updates the bars in place.
+
+        `notes` are shown below the value labels, e.g. the values as given
+        by `units.original_labels`.
+
+        Returns:
+            bool: True if the axes limits changed and need a full redraw.
+        """
+        notes = notes or [""] * len(values)
+        for bar, label, value, color, note in zip(
+            self.bars, self.labels, values, colors, notes
+        ):
+            x = bar.get_x() + bar.get_width() / 2
+            if pd.notna(value):
+                bar.set_height(value)
+                bar.set_facecolor(color)
+                label.set_text(f"{value:.2f}\n({note})" if note else f"{value:.2f}")
+                label.set_position((x, value + y_max * 0.02))
+                label.set_fontsize(10)
+            else:
+                bar.set_height(y_max * 0.05)
+                bar.set_facecolor("gray")
+                label.set_text("N/A")
+                label.set_position((x, y_max * 0.05))
+                label.set_fontsize(11)
+
+        if y_max == self.y_max:
+            return False
+        self.ax.set_ylim(0, y_max)
+        self.y_max = y_max
+        return True
+
+    def set_tick_labels(self, tick_labels):
+        """Returns True if the labels changed and need a full redraw."""
+        if tick_labels == self.tick_labels:
+            return False
+        self.ax.set_xticklabels(tick_labels, rotation=0)
+        self.tick_labels = tick_labels
+        return True
+
+    def set_benchmark(self, attribute, y_max, value=None, label=None):
+        """Returns True if the benchmark line changed and needs a full redraw."""
+        benchmark = (attribute, y_max, value, label)
+        if benchmark == self.benchmark:
+            return False
+        for artist in self.benchmark_artists:
+            artist.remove()
+        self.benchmark_artists = utils.add_benchmark_line(
+            self.ax, attribute, y_max, value, label
+        )
+        self.benchmark = benchmark
+        return True
+
+
+class ComparisonCanvas:
+    """
+    A persistent comparison plot embedded in the main window.
+
+    The figure is only rebuilt when the attributes or the number of sensors
+    change. Otherwise the existing bars are updated in place and, when the
+    axes did not change, redrawn with blitting.
+    """
+
+    def __init__(self, master):
+        self.figure = Figure(figsize=(7, 6), dpi=100)
+        self.canvas = FigureCanvasTkAgg(self.figure, master=master)
+        self.widget = self.canvas.get_tk_widget()
+        self.layout = None
+        self.panels = []
+        self.score_panel = None
+        self.dark_blue_used = None
+        self.background = None
+        self.canvas.mpl_connect("draw_event", self.on_draw)
+
+    @property
+    def animated_artists(self):
+        panels = self.panels + ([self.score_panel] if self.score_panel else [])
+        return [artist for panel in panels for artist in panel.artists]
+
+    def on_draw(self, event):
+        """Caches the static background after every full redraw."""
+        # savefig draws on a temporary canvas, which has nothing to cache
+        if event is not None and event.canvas is not self.canvas:
+            return
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.draw_animated()
+
+    def draw_animated(self):
+        for artist in self.animated_artists:
+            self.figure.draw_artist(artist)
+
+    def build_layout(self, attributes, num_sensors):
+        """Creates one panel per attribute plus an overall score panel."""
+        self.figure.clear()
+        num_panels = len(attributes) + 1
+        cols = 2
+        rows = (num_panels + cols - 1) // cols
+        self.panels = []
+        for i, attribute in enumerate(attributes):
+            ax = self.figure.add_subplot(rows, cols, i + 1)
+            ax.set_title(f"Comparison of {utils.format_label(attribute)}", fontsize=14)
+            unit = utils.get_unit(attribute)
+            ylabel = (
+                f"{utils.format_label(attribute)} ({unit})"
+                if unit
+                else utils.format_label(attribute)
+            )
+            ax.set_ylabel(ylabel, fontsize=12)
+            self.panels.append(BarPanel(ax, num_sensors))
+
+        ax = self.figure.add_subplot(rows, cols, num_panels)
+        ax.set_title("Overall Score", fontsize=14)
+        ax.set_ylabel("Score (0-10)", fontsize=12)
+        self.score_panel = BarPanel(ax, num_sensors)
+        self.score_panel.set_values([0] * num_sensors, ["gray"] * num_sensors, 10.5)
+
+        self.layout = (tuple(attributes), num_sensors)
+        self.dark_blue_used = None
+
+    def show_comparison(
+        self, comparison, attributes, benchmarks=None, benchmark_labels=None
+    ):
+        """Shows a comparison, reusing the existing artists when possible.
+
+        Args:
+            comparison (DataFrame): Output of `SensorCatalog.compare`, with a
+                `sensor_id` column, one column per attribute and `score`.
+            attributes (list): Attributes to plot.
+            benchmarks (list, optional): Benchmark values for each attribute.
+            benchmark_labels (list, optional): Labels for benchmark values.
+        """
+        num_sensors = len(comparison)
+        full_redraw = self.layout != (tuple(attributes), num_sensors)
+        if full_redraw:
+            self.build_layout(attributes, num_sensors)
+
+        tick_labels = [
+            utils.format_label(sensor_id) for sensor_id in comparison["sensor_id"]
+        ]
+        dark_blue_used = False
+        for i, (attribute, panel) in enumerate(zip(attributes, self.panels)):
+            values = comparison[attribute]
+            max_value = values.max()
+            y_max = max_value * 1.2 if pd.notna(max_value) else 1
+            colors = comparison_colors(values, utils.is_higher_better(attribute))
+            dark_blue_used = dark_blue_used or DARK_BLUE in colors
+
+            notes = original_labels(comparison, attribute)
+            full_redraw |= panel.set_values(values, colors, y_max, notes)
+            full_redraw |= panel.set_tick_labels(tick_labels)
+            if benchmarks and i < len(benchmarks):
+                full_redraw |= panel.set_benchmark(
+                    attribute, y_max, benchmarks[i], benchmark_labels[i]
+                )
+            else:
+                full_redraw |= panel.set_benchmark(attribute, y_max)
+
+        scores = comparison["score"]
+        self.score_panel.set_values(scores, comparison_colors(scores, True), 10.5)
+        full_redraw |= self.score_panel.set_tick_labels(tick_labels)
+
+        if dark_blue_used != self.dark_blue_used:
+            self.panels[0].ax.legend(
+                handles=comparison_legend(dark_blue_used), loc="upper right"
+            )
+            self.dark_blue_used = dark_blue_used
+            full_redraw = True
+
+        if full_redraw or self.background is None:
+            self.figure.tight_layout()
+            self.canvas.draw_idle()
+        else:
+            self.canvas.restore_region(self.background)
+            self.draw_animated()
+            self.canvas.blit(self.figure.bbox)
+
+    def save(self, path):
+        """Saves the current comparison, including the animated artists."""
+        artists = self.animated_artists
+        for artist in artists:
+            artist.set_animated(False)
+        try:
+            self.figure.savefig(path)
+        finally:
+            for artist in artists:
+                artist.set_animated(True)
@@ -0,0 +1,312 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# gui_sensor_picker.py
+
+import tkinter as tk
+
+import customtkinter as ctk
+
+from sensor_tool.search_index import SensorIdIndex
+
+ALL_SENSOR_TYPES = "All sensor types"
+
+
+class SensorPickerModel:
+    """
+    The sensors shown by a `SensorPicker`, with their search index.
+
+    Built once per catalog version and shared by every picker window.
+    """
+
+    def __init__(self, df, id_index=None):
+        self.sensor_ids = df["sensor_id"].tolist()
+        self.labels = [
+            f"{sid}  ({manufacturer} {model})"
+            for sid, manufacturer, model in zip(
+                self.sensor_ids,
+                df["manufacturer"].fillna(""),
+                df["model"].fillna(""),
+            )
+        ]
+        self.sensor_types = df["sensor_type"].fillna("").tolist()
+        self.type_choices = [ALL_SENSOR_TYPES] + sorted(
+            {sensor_type for sensor_type in self.sensor_types if sensor_type}
+        )
+        # Reuse the catalog's index when it was built from the same sensors
+        if id_index is None or id_index.sensor_ids != self.sensor_ids:
+            id_index = SensorIdIndex(df)
+        self.index = id_index.index
+
+    def matching_rows(self, query, sensor_type=ALL_SENSOR_TYPES):
+        """Returns the row numbers matching the search text and type facet."""
+        rows = self.index.search(query)
+        if sensor_type != ALL_SENSOR_TYPES:
+            rows = [row for row in rows if self.sensor_types[row] == sensor_type]
+        return list(rows)
+
+
+class SensorPicker(ctk.CTkFrame):
+    """
+    A searchable sensor list that only creates widgets for the visible rows.
+
+    A fixed pool of checkboxes is reused while scrolling, so building and
+    scrolling cost the same for ten sensors as for ten thousand. Selections
+    are kept by sensor ID, independently of the row widgets.
+    """
+
+    def __init__(
+        self,
+        master,
+        model,
+        selected=(),
+        max_selection=4,
+        visible_rows=14,
+        font_size=13,
+        **kwargs,
+    ):
+        super().__init__(master, **kwargs)
+        self.model = model
+        self.max_selection = max_selection
+        self.visible_rows = visible_rows
+        known = set(model.sensor_ids)
+        self.selected = [sid for sid in selected if sid in known]
+        self.rows = list(range(len(model.sensor_ids)))
+        self.first_row = 0
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        controls = ctk.CTkFrame(self, fg_color="transparent")
+        controls.grid(row=0, column=0, columnspan=2, sticky="we", padx=5, pady=5)
+        controls.grid_columnconfigure(0, weight=1)
+
+        self.search_var = ctk.StringVar()
+        self.search_var.trace_add("write", lambda *args: self.apply_search())
+        search_entry = ctk.CTkEntry(
+            controls,
+            textvariable=self.search_var,
+            placeholder_text="Search by ID, manufacturer or model",
+            font=("Helvetica", font_size),
+        )
+        search_entry.grid(row=0, column=0, sticky="we", padx=(0, 5))
+        search_entry.focus_set()
+
+        self.type_var = ctk.StringVar(value=ALL_SENSOR_TYPES)
+        ctk.CTkOptionMenu(
+            controls,
+            values=model.type_choices,
+            variable=self.type_var,
+            command=lambda choice: self.apply_search(),
+            font=("Helvetica", font_size),
+        ).grid(row=0, column=1)
+
+        self.count_label = ctk.CTkLabel(
+            controls, text="", font=("Helvetica", font_size - 2), text_color="gray"
+        )
+        self.count_label.grid(row=1, column=0, columnspan=2, sticky="w")
+
+        rows_frame = ctk.CTkFrame(self)
+        rows_frame.grid(row=1, column=0, sticky="nsew", padx=(5, 0), pady=5)
+        rows_frame.grid_columnconfigure(0, weight=1)
+
+        self.row_vars = []
+        self.row_widgets = []
+        for i in range(visible_rows):
+            var = ctk.BooleanVar()
+            chk = ctk.CTkCheckBox(
+                rows_frame,
+                text="",
+                variable=var,
+                font=("Helvetica", font_size - 1),
+                command=lambda i=i: self.toggle_row(i),
+            )
+            chk.grid(row=i, column=0, sticky="w", padx=5, pady=2)
+            self.bind_mouse_wheel(chk)
+            self.row_vars.append(var)
+            self.row_widgets.append(chk)
+        self.bind_mouse_wheel(rows_frame)
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.on_scrollbar)
+        self.scrollbar.grid(row=1, column=1, sticky="ns", padx=(0, 5), pady=5)
+
+        self.render()
+
+    def bind_mouse_wheel(self, widget):
+        widget.bind("<MouseWheel>", self.on_mouse_wheel, add="+")
+        # X11 reports the wheel as buttons 4 and 5
+        widget.bind("<Button-4>", lambda event: self.scroll_to(self.first_row - 3))
+        widget.bind("<Button-5>", lambda event: self.scroll_to(self.first_row + 3))
+
+    def apply_search(self):
+        """Re-filters the rows after the search text or type facet changed."""
+        self.rows = self.model.matching_rows(self.search_var.get(), self.type_var.get())
+        self.first_row = 0
+        self.render()
+
+    def scroll_to(self, first_row):
+        last_start = max(0, len(self.rows) - self.visible_rows)
+        first_row = min(max(0, int(first_row)), last_start)
+        if first_row != self.first_row:
+            self.first_row = first_row
+            self.render()
+
+    def on_mouse_wheel(self, event):
+        self.scroll_to(self.first_row - (3 if event.delta > 0 else -3))
+
+    def on_scrollbar(self, action, value, unit=None):
+        """Handles the Tk scrollbar protocol ('moveto' or 'scroll')."""
+        if action == "moveto":
+            self.scroll_to(round(float(value) * len(self.rows)))
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self.scroll_to(self.first_row + int(value) * step)
+
+    def render(self):
+        """Points the pooled row widgets at the currently visible sensors."""
+        limit_reached = len(self.selected) >= self.max_selection
+        selected = set(self.selected)
+        for i, (var, chk) in enumerate(zip(self.row_vars, self.row_widgets)):
+            position = self.first_row + i
+            if position >= len(self.rows):
+                chk.grid_remove()
+                continue
+            row = self.rows[position]
+            is_selected = self.model.sensor_ids[row] in selected
+            var.set(is_selected)
+            chk.configure(
+                text=self.model.labels[row],
+                state="disabled" if limit_reached and not is_selected else "normal",
+            )
+            chk.grid()
+
+        total = max(len(self.rows), 1)
+        self.scrollbar.set(
+            self.first_row / total,
+            min(1.0, (self.first_row + self.visible_rows) / total),
+        )
+        self.count_label.configure(
+            text=f"{len(self.rows)} of {len(self.model.sensor_ids)} sensors shown, "
+            f"{len(self.selected)}/{self.max_selection} selected"
+        )
+
+    def toggle_row(self, i):
+        sensor_id = self.model.sensor_ids[self.rows[self.first_row + i]]
+        if self.row_vars[i].get():
+            if sensor_id not in self.selected:
+                self.selected.append(sensor_id)
+        elif sensor_id in self.selected:
+            self.selected.remove(sensor_id)
+        self.render()
+
+
+class SensorIdCompleter:
+    """
+    Suggests sensor IDs in a list below a comma-separated entry field.
+
+    The text after the last comma is looked up with `SensorIdIndex.suggest`
+    on every key release, so typos get corrections as well as completions.
+    Tab takes the first suggestion, Down moves into the list, where Return
+    or a click takes the highlighted one, and Escape closes the list.
+    """
+
+    def __init__(self, entry, get_index, on_accept=None, limit=6, font_size=13):
+        self.entry = entry
+        self.get_index = get_index
+        self.on_accept = on_accept
+        self.limit = limit
+        self.listbox = tk.Listbox(
+            entry.master,
+            height=limit,
+            font=("Helvetica", font_size),
+            exportselection=False,
+        )
+        self.listbox.bind("<Return>", self.accept_selection)
+        self.listbox.bind("<ButtonRelease-1>", self.accept_selection)
+        self.listbox.bind("<Escape>", self.hide)
+        self.listbox.bind("<Up>", self.on_list_up)
+        entry.bind("<KeyRelease>", self.update)
+        entry.bind("<Tab>", self.accept_first)
+        entry.bind("<Down>", self.focus_list)
+        entry.bind("<Escape>", self.hide)
+        entry.bind("<FocusOut>", lambda event: entry.after(150, self.hide_if_idle))
+
+    def current_word(self):
+        return self.entry.get().rsplit(",", 1)[-1].strip()
+
+    def update(self, event=None):
+        """Refreshes the suggestions for the word being typed."""
+        if event is not None and event.keysym in ("Tab", "Down", "Up", "Escape"):
+            return
+        index = self.get_index()
+        word = self.current_word()
+        suggestions = index.suggest(word, self.limit) if index and word else []
+        if not suggestions or suggestions == [word]:
+            self.hide()
+            return
+        self.listbox.delete(0, "end")
+        for sensor_id in suggestions:
+            self.listbox.insert("end", sensor_id)
+        self.listbox.configure(height=len(suggestions))
+        self.listbox.place(in_=self.entry, relx=0, rely=1, relwidth=1)
+        self.listbox.lift()
+
+    def visible(self):
+        return bool(self.listbox.winfo_ismapped())
+
+    def hide(self, event=None):
+        self.listbox.place_forget()
+
+    def hide_if_idle(self):
+        """Closes the list unless the focus moved into it."""
+        if self.listbox.focus_get() is not self.listbox:
+            self.hide()
+
+    def focus_list(self, event=None):
+        if not self.visible():
+            return None
+        self.listbox.focus_set()
+        self.listbox.selection_clear(0, "end")
+        self.listbox.selection_set(0)
+        self.listbox.activate(0)
+        return "break"
+
+    def on_list_up(self, event=None):
+        """Goes back to the entry from the first suggestion."""
+        if self.listbox.curselection() == (0,):
+            self.entry.focus_set()
+            return "break"
+        return None
+
+    def accept_first(self, event=None):
+        if not self.visible():
+            return None
+        self.accept(self.listbox.get(0))
+        return "break"
+
+    def accept_selection(self, event=None):
+        selection = self.listbox.curselection()
+        if selection:
+            self.accept(self.listbox.get(selection[0]))
+        return "break"
+
+    def accept(self, sensor_id):
+        """Replaces the word being typed with `sensor_id`."""
+        text = self.entry.get()
+        head = text.rsplit(",", 1)[0] + ", " if "," in text else ""
+        self.entry.delete(0, "end")
+        self.entry.insert(0, f"{head}{sensor_id}, ")
+        self.entry.focus_set()
+        self.entry.icursor("end")
+        self.hide()
+        if self.on_accept is not None:
+            self.on_accept()
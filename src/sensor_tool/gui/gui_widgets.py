@@ -15,6 +15,9 @@
 
 import customtkinter as ctk
 
+from sensor_tool.gui.gui_plot_canvas import ComparisonCanvas
+from sensor_tool.gui.gui_sensor_picker import SensorIdCompleter
+
 
 class GUIWidgets:
     def create_widgets(self):
@@ -24,7 +27,10 @@ class GUIWidgets:
 
         # Main frame for layout
         self.main_frame = ctk.CTkFrame(self.root, corner_radius=15)
-        self.main_frame.pack(padx=20, pady=20, fill="both", expand=True)
+        self.main_frame.pack(
+            side="left", padx=(20, 10), pady=20, fill="both", expand=True
+        )
+        self.create_plot_area()
 
         for i in range(15):
             self.main_frame.grid_rowconfigure(i, weight=1)
@@ -59,6 +65,59 @@ class GUIWidgets:
         # Status Labels
         self.status_labels = []
 
+        self.register_scalable_widgets()
+
+    def register_scalable_widgets(self):
+        """
+        Registers the widgets whose font follows the window size.
+        """
+        small_labels = (self.progress_label, self.catalog_status_label)
+        for widget in self.main_frame.winfo_children():
+            if widget in small_labels:
+                self.layout.register(widget, offset=-2)
+            elif isinstance(widget, (ctk.CTkLabel, ctk.CTkCheckBox)):
+                self.layout.register(widget, weight="bold")
+            elif isinstance(widget, ctk.CTkEntry):
+                self.layout.register(widget)
+        for widget in self.export_frame.winfo_children():
+            if isinstance(widget, ctk.CTkCheckBox):
+                self.layout.register(widget, weight="bold")
+
+        self.layout.register(self.compare_button, offset=2, weight="bold")
+        self.layout.register(self.quit_button, offset=2, weight="bold")
+        for button in (
+            self.view_sensors_button,
+            self.view_attributes_button,
+            self.refresh_catalog_button,
+            self.clear_fields_button,
+            self.appearance_mode_switch,
+            self.cancel_button,
+        ):
+            self.layout.register(button)
+
+    def create_plot_area(self):
+        """
+        Creates the comparison plot next to the input form.
+        """
+        self.plot_frame = ctk.CTkFrame(self.root, corner_radius=15)
+        self.plot_frame.pack(
+            side="right", padx=(10, 20), pady=20, fill="both", expand=True
+        )
+        self.plot_canvas = ComparisonCanvas(self.plot_frame)
+        self.plot_canvas.widget.pack(padx=10, pady=10, fill="both", expand=True)
+
+        # Live ranking of the whole catalog for the current inputs
+        ctk.CTkLabel(
+            self.plot_frame,
+            text="Live Ranking",
+            font=("Helvetica", self.base_font_size, "bold"),
+        ).pack(padx=10, anchor="w")
+        self.preview_textbox = ctk.CTkTextbox(
+            self.plot_frame, height=220, font=("Courier", self.base_font_size - 1)
+        )
+        self.preview_textbox.pack(padx=10, pady=(0, 10), fill="x")
+        self.show_score_preview("Enter attributes to rank the catalog.")
+
     def add_label_and_entry(self, label_text, placeholder_text, row, mandatory=False):
         """
         Helper function to add a label and entry field to the main frame.
@@ -83,13 +142,21 @@ class GUIWidgets:
         if row == 0:
             self.sensor_ids_entry = entry
             self.sensor_ids_entry.bind("<KeyRelease>", self.validate_mandatory_fields)
+            self.sensor_id_completer = SensorIdCompleter(
+                entry,
+                self.get_sensor_id_index,
+                on_accept=self.validate_mandatory_fields,
+                font_size=self.base_font_size,
+            )
         elif row == 1:
             self.attributes_entry = entry
             self.attributes_entry.bind("<KeyRelease>", self.validate_mandatory_fields)
         elif row == 2:
             self.weights_entry = entry
+            self.weights_entry.bind("<KeyRelease>", self.schedule_score_preview)
         elif row == 3:
             self.benchmarks_entry = entry
+            self.benchmarks_entry.bind("<KeyRelease>", self.schedule_score_preview)
 
     def create_additional_buttons(self):
         """
@@ -98,7 +165,7 @@ class GUIWidgets:
 
         buttons_frame = ctk.CTkFrame(self.main_frame)
         buttons_frame.grid(row=4, column=1, columnspan=2, pady=5, sticky="we")
-        buttons_frame.grid_columnconfigure((0, 1, 2), weight=1)
+        buttons_frame.grid_columnconfigure((0, 1, 2, 3), weight=1)
 
         self.view_sensors_button = ctk.CTkButton(
             buttons_frame,
@@ -131,6 +198,33 @@ class GUIWidgets:
         )
         self.clear_fields_button.grid(row=0, column=2, padx=10, pady=5, sticky="we")
 
+        self.refresh_catalog_button = ctk.CTkButton(
+            buttons_frame,
+            text="Refresh Catalog",
+            command=self.start_catalog_load,
+            font=("Helvetica", self.base_font_size),
+            corner_radius=10,
+            width=140,
+            height=40,
+        )
+        self.refresh_catalog_button.grid(row=0, column=3, padx=10, pady=5, sticky="we")
+
+        refresh_label = ctk.CTkLabel(
+            buttons_frame,
+            text="Reloads changed sensor files",
+            font=("Helvetica", int(self.base_font_size * 0.8)),
+            text_color="gray",
+        )
+        refresh_label.grid(row=1, column=3, padx=10, pady=0)
+
+        self.catalog_status_label = ctk.CTkLabel(
+            self.main_frame,
+            text="",
+            font=("Helvetica", self.base_font_size),
+            text_color="gray",
+        )
+        self.catalog_status_label.grid(row=4, column=0, padx=20, pady=5, sticky="w")
+
         reset_label = ctk.CTkLabel(
             buttons_frame,
             text="Resets to default values",
@@ -190,6 +284,27 @@ class GUIWidgets:
         self.progress_bar.set(0)
         self.progress_bar.grid_remove()
 
+        self.progress_label = ctk.CTkLabel(
+            self.main_frame,
+            text="",
+            font=("Helvetica", self.base_font_size - 2),
+            text_color="gray",
+        )
+        self.progress_label.grid(row=8, column=0, padx=20, sticky="w")
+        self.progress_label.grid_remove()
+
+        self.cancel_button = ctk.CTkButton(
+            self.main_frame,
+            text="Cancel",
+            command=self.cancel_comparison,
+            font=("Helvetica", self.base_font_size),
+            corner_radius=10,
+            fg_color="#a51f1f",
+            hover_color="#701414",
+        )
+        self.cancel_button.grid(row=8, column=1, padx=20, sticky="e")
+        self.cancel_button.grid_remove()
+
         self.quit_button = ctk.CTkButton(
             self.main_frame,
             text="Quit",
@@ -0,0 +1,316 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import heapq
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Number of partial rigs the beam search keeps per step.
+BEAM_WIDTH = 32
+
+# Search nodes expanded before branch-and-bound gives up on proving optimality.
+MAX_NODES = 1_000_000
+
+# Subtrees handed to each worker process, for a more even load.
+SUBTREES_PER_WORKER = 4
+
+# Bounds within this of the best value cannot improve on it.
+TOLERANCE = 1e-9
+
+# Worker processes publish the value a rig must beat here, see `_init_worker`.
+_shared_threshold = None
+
+
+class Problem:
+    """
+    A 0-1 multi-dimensional knapsack: choose items of maximum total value
+    whose summed costs stay within every budget.
+
+    Items are reordered by value per share of the budgets, so the search
+    tries the most efficient items first. `items` maps the new order back.
+    """
+
+    def __init__(self, values, costs, budgets):
+        values = np.asarray(values, dtype=float)
+        costs = np.asarray(costs, dtype=float).reshape(len(values), -1)
+        budgets = np.asarray(budgets, dtype=float)
+        # Items that are worthless or can never fit are left out
+        useful = (values > 0) & (costs <= budgets).all(axis=1)
+        shares = (costs[useful] / budgets).sum(axis=1)
+        with np.errstate(divide="ignore"):
+            density = values[useful] / shares
+        self.items = np.flatnonzero(useful)[np.argsort(-density, kind="stable")]
+        self.values = values[self.items]
+        self.costs = costs[self.items]
+        self.budgets = budgets
+        # The budgets, plus their sum in shares of each budget, which is a
+        # surrogate constraint that every rig also meets
+        self.bound_costs = np.column_stack([self.costs, (self.costs / budgets).sum(1)])
+        with np.errstate(divide="ignore"):
+            densities = self.values[:, None] / self.bound_costs
+        # Per constraint, items from most to least value per unit of cost
+        self.orders = [
+            np.argsort(-densities[:, d], kind="stable")
+            for d in range(self.bound_costs.shape[1])
+        ]
+
+    def __len__(self):
+        return len(self.values)
+
+    def upper_bound(self, start, value, remaining):
+        """Bounds the value reachable by adding items from `start` on.
+
+        Keeping a single constraint leaves a knapsack whose fractional
+        relaxation is solved greedily by value per cost. Each such bound is
+        admissible, so their minimum is too. Items that no longer fit on
+        their own are skipped.
+        """
+        alive = (self.costs[start:] <= remaining).all(axis=1)
+        limits = np.append(remaining, (remaining / self.budgets).sum())
+        best = np.inf
+        for d, order in enumerate(self.orders):
+            order = order[order >= start]
+            order = order[alive[order - start]]
+            costs = np.cumsum(self.bound_costs[order, d])
+            count = np.searchsorted(costs, limits[d], side="right")
+            bound = self.values[order[:count]].sum()
+            if count < len(order):
+                room = limits[d] - (costs[count - 1] if count else 0.0)
+                item = order[count]
+                bound += self.values[item] * room / self.bound_costs[item, d]
+            best = min(best, bound)
+        return value + best
+
+
+class Rigs:
+    """Keeps the `top` most valuable distinct rigs found so far."""
+
+    def __init__(self, top):
+        self.top = top
+        self.heap = []
+        self.seen = set()
+
+    def add(self, value, chosen):
+        if chosen in self.seen or not chosen:
+            return
+        if len(self.heap) < self.top:
+            heapq.heappush(self.heap, (value, chosen))
+        elif value > self.heap[0][0]:
+            _, dropped = heapq.heapreplace(self.heap, (value, chosen))
+            self.seen.discard(dropped)
+        else:
+            return
+        self.seen.add(chosen)
+
+    def threshold(self):
+        """Value a rig must beat to be kept."""
+        return self.heap[0][0] if len(self.heap) >= self.top else -np.inf
+
+    def best(self):
+        return sorted(self.heap, key=lambda rig: (-rig[0], rig[1]))
+
+
+def beam_search(problem, top, width=BEAM_WIDTH):
+    """Builds rigs one item at a time, keeping the `width` best partial rigs.
+
+    Fast and usually close to optimal, it gives branch-and-bound a good rig
+    to beat from the start and a fallback when the node budget runs out.
+
+    Returns:
+        list: (value, items) pairs of the best rigs seen, items in problem
+        order.
+    """
+    rigs = Rigs(top)
+    positions = np.arange(len(problem))
+    chosen = [()]
+    last = np.array([-1])
+    values = np.zeros(1)
+    remaining = problem.budgets[None, :]
+    while len(chosen):
+        # Extend every partial rig by each later item that still fits
+        fits = (positions > last[:, None]) & (
+            problem.costs[None, :, :] <= remaining[:, None, :]
+        ).all(axis=2)
+        states, items = np.nonzero(fits)
+        extended = values[states] + problem.values[items]
+        keep = np.argsort(-extended, kind="stable")[:width]
+        states, items = states[keep], items[keep]
+        chosen = [chosen[state] + (int(item),) for state, item in zip(states, items)]
+        last = items
+        values = extended[keep]
+        remaining = remaining[states] - problem.costs[items]
+        for value, rig in zip(values, chosen):
+            rigs.add(float(value), rig)
+    return rigs.best()
+
+
+def branch_and_bound(problem, top, start_nodes, known, max_nodes, shared=None):
+    """Depth-first branch-and-bound over the subtrees at `start_nodes`.
+
+    Each node decides whether item `start` joins the rig; including it is
+    tried first. Nodes whose `Problem.upper_bound` cannot beat the `top`-th
+    best rig are pruned.
+
+    Args:
+        problem (Problem): The knapsack to solve.
+        top (int): Number of rigs to keep.
+        start_nodes (list): (start, value, remaining, chosen) subtree roots.
+        known (list): (value, items) rigs already found, e.g. by the beam.
+        max_nodes (int): Nodes to expand before stopping.
+        shared (multiprocessing.RawValue, optional): Threshold shared with
+            the other workers. Any worker's `top`-th best value is a valid
+            threshold for all, so a lost update only weakens pruning.
+
+    Returns:
+        tuple: The best (value, items) rigs, the number of nodes expanded
+        and an upper bound on the value of any rig left unexplored.
+    """
+    rigs = Rigs(top)
+    for value, chosen in known:
+        rigs.add(value, chosen)
+    stack = list(reversed(start_nodes))
+    nodes = 0
+    while stack and nodes < max_nodes:
+        start, value, remaining, chosen = stack.pop()
+        rigs.add(value, chosen)
+        if start >= len(problem):
+            continue
+        threshold = rigs.threshold()
+        if shared is not None:
+            if threshold > shared.value:
+                shared.value = threshold
+            threshold = max(threshold, shared.value)
+        if problem.upper_bound(start, value, remaining) <= threshold + TOLERANCE:
+            continue
+        nodes += 1
+        stack.append((start + 1, value, remaining, chosen))
+        if (problem.costs[start] <= remaining).all():
+            stack.append(
+                (
+                    start + 1,
+                    value + problem.values[start],
+                    remaining - problem.costs[start],
+                    chosen + (start,),
+                )
+            )
+    open_bound = max(
+        (
+            problem.upper_bound(start, value, remaining)
+            for start, value, remaining, _ in stack
+        ),
+        default=-np.inf,
+    )
+    return rigs.best(), nodes, open_bound
+
+
+def _init_worker(threshold):
+    global _shared_threshold
+    _shared_threshold = threshold
+
+
+def _search_subtrees(args):
+    """Process pool entry point for `branch_and_bound`."""
+    return branch_and_bound(*args, shared=_shared_threshold)
+
+
+def split(problem, count):
+    """Expands the root breadth-first into at least `count` subtree roots.
+
+    Returns:
+        tuple: The subtree roots and the (value, items) rigs met on the way.
+    """
+    nodes = [(0, 0.0, problem.budgets, ())]
+    rigs = []
+    while 0 < len(nodes) < count:
+        children = []
+        for start, value, remaining, chosen in nodes:
+            if start >= len(problem):
+                continue
+            children.append((start + 1, value, remaining, chosen))
+            if (problem.costs[start] <= remaining).all():
+                child = (
+                    start + 1,
+                    value + problem.values[start],
+                    remaining - problem.costs[start],
+                    chosen + (start,),
+                )
+                children.append(child)
+                rigs.append((child[1], child[3]))
+        if not children:
+            break
+        nodes = children
+    return nodes, rigs
+
+
+def optimize(values, costs, budgets, top=5, workers=1, max_nodes=MAX_NODES):
+    """Finds the `top` most valuable sets of items within the budgets.
+
+    Runs `beam_search` for a first answer, then `branch_and_bound` to
+    improve it and prove it optimal. With several `workers`, the tree is
+    split into subtrees that a process pool searches, most promising
+    first. Each worker gets an equal share of `max_nodes`.
+
+    Args:
+        values (array): Value of each item.
+        costs (array): (items x budgets) cost of each item.
+        budgets (array): Upper limit on each summed cost.
+        top (int): Number of sets to return.
+        workers (int): Number of processes.
+        max_nodes (int): Total number of search nodes to expand.
+
+    Returns:
+        tuple: (value, item indexes) pairs, best first, and a dict with the
+        number of nodes expanded, the `upper_bound` on the best value and the
+        remaining `gap` to it, 0 when the best set is optimal.
+    """
+    problem = Problem(values, costs, budgets)
+    known = beam_search(problem, top)
+    if workers > 1:
+        roots, prefix_rigs = split(problem, workers * SUBTREES_PER_WORKER)
+        known = known + prefix_rigs
+        roots.sort(key=lambda root: -problem.upper_bound(*root[:3]))
+        groups = [roots[i::workers] for i in range(workers)]
+        groups = [group for group in groups if group]
+        share = max(1, max_nodes // max(1, len(groups)))
+        jobs = [(problem, top, group, known, share) for group in groups]
+        threshold = multiprocessing.RawValue("d", -np.inf)
+        with ProcessPoolExecutor(
+            max_workers=len(jobs) or 1,
+            initializer=_init_worker,
+            initargs=(threshold,),
+        ) as executor:
+            results = list(executor.map(_search_subtrees, jobs))
+    else:
+        root = (0, 0.0, problem.budgets, ())
+        results = [branch_and_bound(problem, top, [root], known, max_nodes)]
+
+    rigs = Rigs(top)
+    for value, chosen in known:
+        rigs.add(value, chosen)
+    for found, _, _ in results:
+        for value, chosen in found:
+            rigs.add(value, chosen)
+    best = rigs.best()
+    best_value = best[0][0] if best else 0.0
+    open_bound = max((bound for _, _, bound in results), default=-np.inf)
+    upper_bound = max(best_value, open_bound)
+    stats = {
+        "nodes": sum(nodes for _, nodes, _ in results),
+        "upper_bound": float(upper_bound),
+        "gap": float(upper_bound - best_value),
+    }
+    return [
+        (float(value), sorted(int(problem.items[i]) for i in chosen))
+        for value, chosen in best
+    ], stats
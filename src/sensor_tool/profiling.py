@@ -0,0 +1,207 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lightweight timing spans and memory tracing for the pipeline stages.
+
+Spans cost a single list check while no hook is registered. To receive
+timings, register a callable that accepts a span record:
+
+    from sensor_tool import profiling
+
+    def forward(record):
+        metrics.timing(record["path"], record["duration_ms"])
+
+    profiling.add_hook(forward)
+
+Each record is a dict with the keys `name`, `path` (the names of the
+enclosing spans joined with '/'), `start` (seconds since the epoch),
+`duration_ms`, `thread` and any extra attributes passed to `span`.
+"""
+
+import gc
+import json
+import logging
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+_hooks = []
+_local = threading.local()
+
+
+def add_hook(callback):
+    """Registers `callback` to be called with every finished span record.
+
+    Returns:
+        callable: The callback, so this can be used as a decorator.
+    """
+    _hooks.append(callback)
+    return callback
+
+
+def remove_hook(callback):
+    """Unregisters a callback added with `add_hook`."""
+    if callback in _hooks:
+        _hooks.remove(callback)
+
+
+@contextmanager
+def span(name, **attributes):
+    """Times the enclosed block as a stage called `name`.
+
+    Spans nest per thread, so a span opened inside another one is reported
+    with the path 'outer/inner'.
+    """
+    if not _hooks:
+        yield
+        return
+
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    stack.append(name)
+    start = time.time()
+    counter = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - counter
+        record = {
+            "name": name,
+            "path": "/".join(stack),
+            "start": start,
+            "duration_ms": duration * 1000,
+            "thread": threading.current_thread().name,
+            **attributes,
+        }
+        stack.pop()
+        for hook in list(_hooks):
+            try:
+                hook(record)
+            except Exception:
+                logging.exception(f"Profiling hook {hook!r} failed")
+
+
+class SpanRecorder:
+    """
+    A hook that keeps every span record for a stage breakdown or JSON dump.
+    """
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    def __call__(self, record):
+        with self._lock:
+            self.records.append(record)
+
+    def __enter__(self):
+        add_hook(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        remove_hook(self)
+
+    def summary(self):
+        """Aggregates the records by span path, in order of first appearance.
+
+        Returns:
+            list: Dicts with `path`, `calls` and `total_ms`.
+        """
+        totals = {}
+        for record in self.records:
+            entry = totals.setdefault(record["path"], [0, 0.0])
+            entry[0] += 1
+            entry[1] += record["duration_ms"]
+        # Parents finish after their children, so sort by start time instead
+        first_start = {}
+        for record in self.records:
+            first_start.setdefault(record["path"], record["start"])
+        return [
+            {"path": path, "calls": calls, "total_ms": total}
+            for path, (calls, total) in sorted(
+                totals.items(), key=lambda item: (first_start[item[0]], item[0])
+            )
+        ]
+
+    def format_report(self):
+        """Returns the stage breakdown as an indented text table."""
+        summary = self.summary()
+        if not summary:
+            return "No profiling spans were recorded."
+        top_level = sum(s["total_ms"] for s in summary if "/" not in s["path"])
+        lines = [f"{'Stage':<44} {'Calls':>6} {'Total ms':>10} {'%':>6}"]
+        for entry in summary:
+            depth = entry["path"].count("/")
+            label = "  " * depth + entry["path"].rsplit("/", 1)[-1]
+            share = entry["total_ms"] / top_level * 100 if top_level else 0.0
+            lines.append(
+                f"{label:<44} {entry['calls']:>6} "
+                f"{entry['total_ms']:>10.1f} {share:>6.1f}"
+            )
+        return "\n".join(lines)
+
+    def dump_json(self, path):
+        """Writes all span records to `path` as a JSON list."""
+        with open(path, "w") as f:
+            json.dump(self.records, f, indent=2)
+
+
+def trace_memory(function, top=10):
+    """Calls `function` with tracemalloc enabled.
+
+    Args:
+        function (callable): Called without arguments. Its return value is
+            kept alive while measuring, so `current_bytes` is what it retains.
+        top (int, optional): Number of largest allocation sites to report.
+
+    Returns:
+        tuple: The return value of `function` and a report dict with
+        `current_bytes`, `peak_bytes` and `top` (a list of dicts with
+        `location`, `size_bytes` and `count`).
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.clear_traces()
+    try:
+        result = function()
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    # Leave out the tracer itself and modules imported during the call
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+    )
+    import_bytes = current - sum(t.size for t in snapshot.traces)
+    statistics = snapshot.statistics("lineno")[:top]
+    report = {
+        "current_bytes": current - import_bytes,
+        "peak_bytes": peak,
+        "top": [
+            {
+                "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                "size_bytes": stat.size,
+                "count": stat.count,
+            }
+            for stat in statistics
+        ],
+    }
+    return result, report
@@ -0,0 +1,338 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from .spatial import extract_image_size
+
+# Usable payload rate of one bus in Mbit/s, below the line rate because of
+# encoding and protocol overhead.
+BUS_CAPACITY_MBPS = {
+    "USB 2.0": 320.0,
+    "USB 3.0": 3200.0,
+    "USB 3.1": 7200.0,
+    "Gigabit Ethernet": 940.0,
+    "Ethernet": 94.0,
+    "Wi-Fi": 100.0,
+    "CAN": 0.5,
+    "GMSL2": 5400.0,
+}
+
+# Bits per pixel of each image stream when sent uncompressed.
+STREAM_BIT_DEPTH = {"rgb": 24, "depth": 16, "ir": 8}
+
+# Rigs are enumerated and evaluated this many at a time.
+CHUNK_SIZE = 100_000
+# Refuse enumerations larger than this.
+MAX_COMBINATIONS = 50_000_000
+
+
+def bus_name(interface):
+    """Maps a `communication_interface` value to a `BUS_CAPACITY_MBPS` key.
+
+    Connector details are ignored, e.g. 'USB 3.0 Type-C' is a 'USB 3.0' bus.
+
+    Returns:
+        str: The bus name, or None if the interface is unknown.
+    """
+    if not isinstance(interface, str):
+        return None
+    interface = interface.strip().lower()
+    # Longest names first, so 'Gigabit Ethernet' is not taken for 'Ethernet'
+    for name in sorted(BUS_CAPACITY_MBPS, key=len, reverse=True):
+        if interface.startswith(name.lower()):
+            return name
+    return None
+
+
+def stream_settings(bit_depth=None, compression=None):
+    """Merges per-stream overrides with the defaults.
+
+    Args:
+        bit_depth (dict, optional): Bits per pixel by stream. 0 turns a
+            stream off.
+        compression (dict, optional): Compression ratio by stream, e.g. 10
+            for a stream sent at a tenth of its raw size. Defaults to 1.
+
+    Raises:
+        ValueError: If a stream is unknown or a value is out of range.
+    """
+    bit_depth = {**STREAM_BIT_DEPTH, **(bit_depth or {})}
+    compression = {
+        **{stream: 1.0 for stream in STREAM_BIT_DEPTH},
+        **(compression or {}),
+    }
+    unknown = (set(bit_depth) | set(compression)) - set(STREAM_BIT_DEPTH)
+    if unknown:
+        raise ValueError(
+            f"Unknown streams: {', '.join(sorted(unknown))}. "
+            f"Choose from {', '.join(STREAM_BIT_DEPTH)}."
+        )
+    if any(value < 0 for value in bit_depth.values()):
+        raise ValueError("Bit depths must not be negative.")
+    if any(value <= 0 for value in compression.values()):
+        raise ValueError("Compression ratios must be positive.")
+    return bit_depth, compression
+
+
+def stream_pixels(resolution, stream):
+    """Returns the pixels per frame of one stream, NaN if it is not known.
+
+    A plain "WxH" resolution string, e.g. "1920x1200 (side-by-side)",
+    describes the colour stream only.
+    """
+    if isinstance(resolution, str) and stream != "rgb":
+        return np.nan
+    width, height = extract_image_size(resolution, stream)
+    return width * height
+
+
+def stream_rates(df, bit_depth=None, compression=None):
+    """Estimates the data rate of each sensor's image streams.
+
+    A stream sends width x height pixels per frame at the sensor's frame
+    rate. The frame rate is the sensor's highest, so rates are upper bounds
+    for sensors that only reach it at a lower resolution.
+
+    Returns:
+        pandas.DataFrame: `sensor_id`, `bus`, one `<stream>_mbps` column per
+        stream and the sum of the known ones `data_rate_mbps`, in Mbit/s.
+        Streams without a resolution, and all streams of sensors without a
+        frame rate, have a NaN rate.
+    """
+    bit_depth, compression = stream_settings(bit_depth, compression)
+    frame_rate = df["frame_rate"].to_numpy(dtype=float)
+    rates = pd.DataFrame(
+        {
+            "sensor_id": df["sensor_id"].to_numpy(),
+            "bus": [bus_name(value) for value in df["communication_interface"]],
+        },
+        index=df.index,
+    )
+    for stream in STREAM_BIT_DEPTH:
+        pixels = np.array(
+            [stream_pixels(value, stream) for value in df["resolution"]],
+            dtype=float,
+        )
+        bits = pixels * bit_depth[stream] / compression[stream]
+        rates[f"{stream}_mbps"] = bits * frame_rate / 1e6
+    streams = [f"{stream}_mbps" for stream in STREAM_BIT_DEPTH]
+    rates["data_rate_mbps"] = rates[streams].sum(axis=1, min_count=1)
+    return rates
+
+
+def bus_capacities(ports=None):
+    """Returns the capacity of each bus type, times its number of ports.
+
+    Args:
+        ports (dict, optional): Number of independent buses of a type on the
+            host, e.g. {"USB 3.0": 2} for two USB 3.0 controllers. Defaults
+            to 1.
+
+    Raises:
+        ValueError: If a bus is unknown or a count is not positive.
+    """
+    ports = dict(ports or {})
+    unknown = set(ports) - set(BUS_CAPACITY_MBPS)
+    if unknown:
+        raise ValueError(
+            f"Unknown buses: {', '.join(sorted(unknown))}. "
+            f"Choose from {', '.join(BUS_CAPACITY_MBPS)}."
+        )
+    if any(count <= 0 for count in ports.values()):
+        raise ValueError("Port counts must be positive.")
+    return {
+        bus: capacity * ports.get(bus, 1) for bus, capacity in BUS_CAPACITY_MBPS.items()
+    }
+
+
+def bus_loads(rates, ports=None, max_utilization=1.0):
+    """Sums the data rates of one rig per bus.
+
+    Cameras are assumed to spread evenly over the ports of a bus type, but
+    a single camera must fit on one port.
+
+    Returns:
+        pandas.DataFrame: `bus`, `sensors`, `data_rate_mbps`, `capacity_mbps`,
+        `utilization` and `oversubscribed`, one row per bus used. Sensors on
+        unknown buses are grouped under a bus of None with NaN capacity.
+    """
+    capacities = bus_capacities(ports)
+    rows = []
+    for bus, group in rates.groupby(rates["bus"].fillna(""), sort=True):
+        bus = bus or None
+        capacity = capacities.get(bus, np.nan)
+        load = group["data_rate_mbps"].sum(min_count=1)
+        utilization = load / capacity
+        too_big = (group["data_rate_mbps"] > BUS_CAPACITY_MBPS.get(bus, np.inf)).any()
+        rows.append(
+            {
+                "bus": bus,
+                "sensors": len(group),
+                "data_rate_mbps": load,
+                "capacity_mbps": capacity,
+                "utilization": utilization,
+                "oversubscribed": bool(utilization > max_utilization or too_big),
+            }
+        )
+    return pd.DataFrame(
+        rows,
+        columns=[
+            "bus",
+            "sensors",
+            "data_rate_mbps",
+            "capacity_mbps",
+            "utilization",
+            "oversubscribed",
+        ],
+    )
+
+
+def count_combinations(n, k, repeat=False):
+    """Returns how many k-sensor rigs can be built from `n` sensors."""
+    return math.comb(n + k - 1, k) if repeat else math.comb(n, k)
+
+
+def combination_chunks(n, k, repeat=False, chunk_size=CHUNK_SIZE):
+    """Yields (rigs x k) arrays of sensor positions covering every rig once.
+
+    Rigs are built with NumPy, a position at a time, for runs of first
+    positions that together give about `chunk_size` rigs.
+    """
+    first = np.arange(n)
+    # Number of rigs that start with each position
+    counts = [count_combinations(n - i - (not repeat), k - 1, repeat) for i in first]
+    start = 0
+    while start < n:
+        stop, size = start + 1, counts[start]
+        while stop < n and size + counts[stop] <= chunk_size:
+            size += counts[stop]
+            stop += 1
+        rigs = first[start:stop, None]
+        for _ in range(k - 1):
+            rigs = _extend(rigs, n, repeat)
+        if len(rigs):
+            yield rigs
+        start = stop
+
+
+def _extend(rigs, n, repeat):
+    """Appends every allowed next position to each partial rig."""
+    low = rigs[:, -1] + (not repeat)
+    counts = np.maximum(n - low, 0)
+    rigs = np.repeat(rigs, counts, axis=0)
+    offsets = np.arange(len(rigs)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.column_stack([rigs, np.repeat(low, counts) + offsets])
+
+
+def evaluate_rigs(
+    rates, k, ports=None, max_utilization=1.0, repeat=False, prices=None, top=20
+):
+    """Evaluates every k-sensor rig and returns the best feasible ones.
+
+    Each sensor's share of every bus is precomputed, so the load of a whole
+    chunk of rigs on a bus is a sum of k fancy-indexed lookups. Sensors
+    without a known rate or bus, or that do not fit on one port, are left
+    out.
+
+    Args:
+        rates (pandas.DataFrame): Output of `stream_rates`.
+        k (int): Number of sensors per rig.
+        ports (dict, optional): See `bus_capacities`.
+        max_utilization (float): Highest allowed load as a share of a bus.
+        repeat (bool): Allow the same sensor more than once in a rig.
+        prices (array, optional): Price of each sensor, to sort rigs by
+            total price. Rigs are sorted by utilization otherwise.
+        top (int): Number of rigs to return.
+
+    Returns:
+        tuple: The best rigs as a DataFrame, the number of feasible rigs and
+        the number of rigs evaluated.
+
+    Raises:
+        ValueError: If there are too many rigs to enumerate.
+    """
+    capacities = bus_capacities(ports)
+    port_capacity = rates["bus"].map(BUS_CAPACITY_MBPS).to_numpy(dtype=float)
+    load = rates["data_rate_mbps"].to_numpy(dtype=float)
+    usable = np.isfinite(load) & (load <= port_capacity)
+    rates = rates[usable]
+    load = load[usable]
+    prices = None if prices is None else np.asarray(prices, dtype=float)[usable]
+
+    n = len(rates)
+    total = count_combinations(n, k, repeat) if k > 0 else 0
+    if total > MAX_COMBINATIONS:
+        raise ValueError(
+            f"{total} rigs of {k} sensors are too many to evaluate. "
+            "Narrow the candidates with filters first."
+        )
+
+    # Share of each used bus that each sensor takes
+    buses = sorted(set(rates["bus"]))
+    shares = np.zeros((len(buses), n))
+    for i, bus in enumerate(buses):
+        on_bus = (rates["bus"] == bus).to_numpy()
+        shares[i, on_bus] = load[on_bus] / capacities[bus]
+
+    feasible = 0
+    rigs = np.empty((0, max(k, 0)), dtype=np.intp)
+    cost = peak = np.empty(0)
+    for chunk in combination_chunks(n, k, repeat) if total else []:
+        columns = chunk.T.copy()
+        chunk_peak = np.zeros(len(chunk))
+        for share in shares:
+            utilization = share[columns[0]]
+            for column in columns[1:]:
+                utilization += share[column]
+            np.maximum(chunk_peak, utilization, out=chunk_peak)
+        keep = chunk_peak <= max_utilization
+        feasible += int(np.count_nonzero(keep))
+        chunk, chunk_peak = chunk[keep], chunk_peak[keep]
+        if prices is not None:
+            chunk_cost = np.nan_to_num(prices[chunk].sum(axis=1), nan=np.inf)
+        else:
+            chunk_cost = np.zeros(len(chunk))
+        # Only rigs that can make the best `top` are kept
+        candidates = _best(chunk_cost, chunk_peak, top)
+        rigs = np.concatenate([rigs, chunk[candidates]])
+        cost = np.concatenate([cost, chunk_cost[candidates]])
+        peak = np.concatenate([peak, chunk_peak[candidates]])
+        order = _best(cost, peak, top)
+        rigs, cost, peak = rigs[order], cost[order], peak[order]
+
+    sensor_ids = rates["sensor_id"].to_numpy()
+    busiest = shares[:, rigs].sum(axis=2).argmax(axis=0) if buses else []
+    best = pd.DataFrame(
+        {
+            "sensors": [list(sensor_ids[rig]) for rig in rigs],
+            "data_rate_mbps": load[rigs].sum(axis=1),
+            "busiest_bus": [buses[i] for i in busiest],
+            "utilization": peak,
+        }
+    )
+    if prices is not None:
+        best["price_avg"] = np.where(np.isinf(cost), np.nan, cost)
+    return best, feasible, total
+
+
+def _best(cost, peak, top):
+    """Returns the positions of the `top` cheapest rigs, then least loaded."""
+    if len(cost) > top > 0:
+        threshold = np.partition(cost, top - 1)[top - 1]
+        positions = np.flatnonzero(cost <= threshold)
+    else:
+        positions = np.arange(len(cost))
+    return positions[np.lexsort((peak[positions], cost[positions]))][:top]
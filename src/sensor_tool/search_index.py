@@ -0,0 +1,251 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from bisect import bisect_left
+from collections import defaultdict
+
+import numpy as np
+
+TOKEN_SEPARATORS = re.compile(r"[\s_\-./()]+")
+
+# Characters that `SensorIdIndex.resolve` treats as interchangeable in IDs.
+ID_SEPARATORS = re.compile(r"[\s_\-]+")
+
+
+def normalize_id(text):
+    """Lowercases a sensor ID and drops spaces, hyphens and underscores."""
+    return ID_SEPARATORS.sub("", text.strip().lower())
+
+
+def trigrams(text):
+    """Returns the set of three-character substrings of `text`."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _members(sorted_rows, rows):
+    """Tests which `rows` are in `sorted_rows`, by binary search.
+
+    Costs O(len(rows) log len(sorted_rows)), so unlike `np.intersect1d` it
+    stays cheap when a few candidates meet a long posting list.
+    """
+    positions = np.searchsorted(sorted_rows, rows)
+    positions[positions == len(sorted_rows)] = 0
+    return sorted_rows[positions] == rows if len(sorted_rows) else rows < 0
+
+
+class TrigramIndex:
+    """
+    Substring search over a fixed list of strings, e.g. one per sensor.
+
+    Queries of three or more characters are answered from trigram posting
+    lists and then verified. Shorter queries match word prefixes through a
+    sorted token list. Each whitespace-separated query word must match.
+    """
+
+    def __init__(self, texts):
+        self.texts = [str(text).lower() for text in texts]
+
+        postings = defaultdict(list)
+        tokens = []
+        gram_counts = []
+        for row, text in enumerate(self.texts):
+            grams = trigrams(text)
+            gram_counts.append(len(grams))
+            for gram in grams:
+                postings[gram].append(row)
+            for token in set(TOKEN_SEPARATORS.split(text)):
+                if token:
+                    tokens.append((token, row))
+        self._postings = {
+            gram: np.array(rows, dtype=np.int32) for gram, rows in postings.items()
+        }
+        tokens.sort()
+        self._tokens = [token for token, _ in tokens]
+        self._token_rows = np.array([row for _, row in tokens], dtype=np.int32)
+        self._gram_counts = np.array(gram_counts, dtype=np.int32)
+
+    def __len__(self):
+        return len(self.texts)
+
+    def search(self, query):
+        """Returns the sorted row numbers whose text matches every query word.
+
+        An empty query matches every row.
+        """
+        rows = None
+        for word in query.lower().split():
+            matches = self._search_word(word)
+            rows = matches if rows is None else rows[_members(matches, rows)]
+            if len(rows) == 0:
+                break
+        return np.arange(len(self.texts), dtype=np.int32) if rows is None else rows
+
+    def similar(self, query, limit=5, min_similarity=0.5):
+        """Ranks rows by the share of the query's trigrams found in their text.
+
+        Unlike `search`, this tolerates typos such as swapped or missing
+        characters. Ties go to the text with the fewest other trigrams, as
+        with the Jaccard index, so the closest string wins.
+
+        Returns:
+            tuple: Up to `limit` row numbers, best first, and their
+            similarity between 0 and 1.
+        """
+        grams = trigrams(query.lower())
+        lists = [self._postings[gram] for gram in grams if gram in self._postings]
+        if not lists:
+            return np.empty(0, dtype=np.int32), np.empty(0)
+        # Shared trigrams per row, counted over the query's posting lists
+        shared = np.bincount(np.concatenate(lists), minlength=len(self.texts))
+        rows = np.flatnonzero((shared > 0) & (shared >= min_similarity * len(grams)))
+        shared = shared[rows]
+        similarity = shared / len(grams)
+        jaccard = shared / (len(grams) + self._gram_counts[rows] - shared)
+        order = np.lexsort((rows, -jaccard, -similarity))[:limit]
+        return rows[order], similarity[order]
+
+    def _search_word(self, word):
+        if len(word) < 3:
+            start = bisect_left(self._tokens, word)
+            end = bisect_left(self._tokens, word + "\uffff")
+            return np.unique(self._token_rows[start:end])
+
+        candidates = None
+        # Intersect the shortest posting lists first
+        for gram in sorted(
+            trigrams(word), key=lambda g: len(self._postings.get(g, ()))
+        ):
+            rows = self._postings.get(gram)
+            if rows is None:
+                return np.empty(0, dtype=np.int32)
+            candidates = (
+                rows if candidates is None else candidates[_members(rows, candidates)]
+            )
+            if len(candidates) == 0:
+                return candidates
+        # Trigrams may match out of order, so verify the whole word
+        return np.array(
+            [row for row in candidates if word in self.texts[row]], dtype=np.int32
+        )
+
+
+class SensorIdIndex:
+    """
+    Resolves typed sensor IDs against a catalog and suggests corrections.
+
+    ID prefixes are completed from a sorted list. Other lookups go through a
+    `TrigramIndex` over each sensor's ID, manufacturer and model, which is
+    only built when first needed.
+    """
+
+    def __init__(self, df):
+        self.sensor_ids = df["sensor_id"].astype(str).tolist()
+        # IDs are also indexed without separators, so "zed2i" finds zed_2i
+        self._texts = [
+            f"{sid} {TOKEN_SEPARATORS.sub('', sid)} {manufacturer} {model}"
+            for sid, manufacturer, model in zip(
+                self.sensor_ids,
+                df["manufacturer"].fillna(""),
+                df["model"].fillna(""),
+            )
+        ]
+        self._index = None
+        self._known = set(self.sensor_ids)
+        normalized = defaultdict(list)
+        for sid in self.sensor_ids:
+            normalized[normalize_id(sid)].append(sid)
+        # IDs that only differ in case or separators are left ambiguous
+        self._normalized = {
+            key: sids[0] for key, sids in normalized.items() if len(sids) == 1
+        }
+        pairs = sorted((sid.lower(), sid) for sid in self.sensor_ids)
+        self._sorted_keys = [key for key, _ in pairs]
+        self._sorted_ids = [sid for _, sid in pairs]
+
+    def __len__(self):
+        return len(self.sensor_ids)
+
+    @property
+    def index(self):
+        """The `TrigramIndex` over ID, manufacturer and model, one row per sensor."""
+        if self._index is None:
+            self._index = TrigramIndex(self._texts)
+        return self._index
+
+    def complete(self, prefix, limit=None):
+        """Returns the sensor IDs starting with `prefix`, ignoring case."""
+        prefix = prefix.lower()
+        start = bisect_left(self._sorted_keys, prefix)
+        end = bisect_left(self._sorted_keys, prefix + "\uffff")
+        if limit is not None:
+            end = min(end, start + limit)
+        return self._sorted_ids[start:end]
+
+    def suggest(self, query, limit=5):
+        """Returns up to `limit` sensor IDs for a possibly misspelled query.
+
+        IDs starting with the query come first, then sensors whose ID,
+        manufacturer or model contain every query word, shortest first, then
+        the closest sensors by `TrigramIndex.similar`.
+        """
+        query = query.strip()
+        if not query or limit <= 0:
+            return []
+        suggestions = dict.fromkeys(self.complete(query, limit))
+        if len(suggestions) < limit:
+            # The shortest texts are the closest, e.g. zed_2 before zed_2i
+            rows = self.index.search(query)
+            rows = sorted(rows, key=lambda row: len(self._texts[row]))
+            for row in rows[:limit]:
+                suggestions.setdefault(self.sensor_ids[row])
+        if len(suggestions) < limit:
+            rows, _ = self.index.similar(query, limit * 2)
+            for row in rows:
+                suggestions.setdefault(self.sensor_ids[row])
+        return list(suggestions)[:limit]
+
+    def resolve(self, query):
+        """Returns the sensor ID that `query` stands for.
+
+        Besides exact IDs, this only accepts an ID written in another case
+        or with other separators, e.g. "Intel-RealSense-D435i". Partial or
+        misspelled IDs are never replaced, since that would silently pick a
+        sensor the user did not ask for.
+
+        Raises:
+            KeyError: If no sensor ID matches, naming the closest ones.
+        """
+        if query in self._known:
+            return query
+        key = normalize_id(query)
+        if key in self._normalized:
+            return self._normalized[key]
+        suggestions = self.suggest(query)
+        hint = f" (did you mean {', '.join(suggestions)}?)" if suggestions else ""
+        raise KeyError(f"{query}{hint}")
+
+    def resolve_all(self, queries):
+        """Resolves each query with `resolve`, in order.
+
+        Raises:
+            KeyError: Naming every query that could not be resolved.
+        """
+        resolved, unknown = [], []
+        for query in queries:
+            try:
+                resolved.append(self.resolve(query))
+            except KeyError as e:
+                unknown.append(e.args[0])
+        if unknown:
+            raise KeyError(f"Unknown sensor IDs: {'; '.join(unknown)}")
+        return resolved
@@ -0,0 +1,190 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import http.client
+import json
+import logging
+import os
+import socket
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from .catalog import QUERY_COMMANDS, SensorCatalog, error_message, run_query
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+class CatalogRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves catalog queries as JSON. All query endpoints accept a JSON body:
+
+        GET  /health                        -> catalog size and version
+        POST /filter  {criteria, columns}   -> matching sensors
+        POST /search  {query, limit}        -> sensors matching a text query
+        POST /score   {sensor_ids, attributes, weights} -> scores out of 10
+        POST /compare {sensor_ids, attributes, weights} -> values and scores
+    """
+
+    catalog = None
+
+    def do_GET(self):
+        if self.path == "/health":
+            self.catalog.refresh_if_stale()
+            snapshot = self.catalog.snapshot
+            self.send_json(
+                200, {"sensors": len(snapshot.df), "version": snapshot.version}
+            )
+        else:
+            self.send_json(404, {"error": f"Unknown endpoint {self.path}"})
+
+    def do_POST(self):
+        command = self.path.lstrip("/")
+        if command not in QUERY_COMMANDS:
+            self.send_json(404, {"error": f"Unknown endpoint {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            self.catalog.refresh_if_stale()
+            self.send_json(200, run_query(self.catalog, command, payload))
+        except (KeyError, ValueError, TypeError) as e:
+            self.send_json(400, {"error": error_message(e)})
+        except Exception as e:
+            logging.exception(f"Error while handling {self.path}")
+            self.send_json(500, {"error": str(e)})
+
+    def send_json(self, status, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self):
+        # Unix socket clients have no (host, port) address
+        if isinstance(self.client_address, tuple):
+            return super().address_string()
+        return "unix"
+
+    def log_message(self, format, *args):
+        logging.debug(f"{self.address_string()} - {format % args}")
+
+
+class ThreadingUnixHTTPServer(
+    socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    daemon_threads = True
+
+    def server_bind(self):
+        socketserver.UnixStreamServer.server_bind(self)
+        self.server_name = "localhost"
+        self.server_port = 0
+
+
+def serve(
+    host=DEFAULT_HOST,
+    port=DEFAULT_PORT,
+    socket_path=None,
+    sensors_directory="sensors",
+    refresh_interval=2.0,
+):
+    """Loads the catalog once and serves queries until interrupted.
+
+    Args:
+        host (str, optional): Address to listen on.
+        port (int, optional): TCP port to listen on.
+        socket_path (str, optional): Listen on this Unix socket instead of TCP.
+        sensors_directory (str, optional): Directory with the sensor YAML files.
+        refresh_interval (float, optional): Minimum seconds between checks for
+            modified sensor files.
+    """
+    catalog = SensorCatalog(sensors_directory, refresh_interval=refresh_interval)
+    catalog.refresh()
+    handler = type(
+        "BoundCatalogRequestHandler", (CatalogRequestHandler,), {"catalog": catalog}
+    )
+
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = ThreadingUnixHTTPServer(socket_path, handler)
+        address = f"unix:{socket_path}"
+    else:
+        server = ThreadingHTTPServer((host, port), handler)
+        address = f"http://{host}:{server.server_port}"
+
+    logging.info(f"Serving {len(catalog.data)} sensors on {address}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path, timeout=30):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def query_server(server, endpoint, payload=None, timeout=30):
+    """Sends a query to a running `serve` daemon.
+
+    Args:
+        server (str): 'http://host:port' or 'unix:/path/to/socket'.
+        endpoint (str): Endpoint name, e.g. 'filter'.
+        payload (dict, optional): JSON body. A GET request is sent if omitted.
+
+    Returns:
+        dict: The decoded JSON response.
+
+    Raises:
+        RuntimeError: If the daemon reports an error.
+    """
+    if server.startswith("unix:"):
+        connection = UnixHTTPConnection(server[len("unix:") :], timeout=timeout)
+    else:
+        url = urlparse(server if "://" in server else f"http://{server}")
+        connection = http.client.HTTPConnection(
+            url.hostname, url.port or DEFAULT_PORT, timeout=timeout
+        )
+
+    try:
+        if payload is None:
+            connection.request("GET", f"/{endpoint}")
+        else:
+            connection.request(
+                "POST",
+                f"/{endpoint}",
+                body=json.dumps(payload),
+                headers={"Content-Type": "application/json"},
+            )
+        response = connection.getresponse()
+        body = json.loads(response.read() or b"{}")
+    finally:
+        connection.close()
+
+    if response.status != 200:
+        raise RuntimeError(body.get("error", f"Server returned {response.status}"))
+    return body
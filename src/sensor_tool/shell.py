@@ -0,0 +1,358 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import cmd
+import inspect
+import shlex
+import time
+
+from .catalog import SensorCatalog, error_message
+from .coverage import load_layout
+from .cli import (
+    FILTER_COLUMNS,
+    add_filter_arguments,
+    add_optimize_arguments,
+    add_rig_arguments,
+    filter_kwargs,
+    optimize_kwargs,
+    print_coverage,
+    print_optimized,
+    print_rig,
+    print_rigs,
+    rig_kwargs,
+)
+
+
+class HelpShown(Exception):
+    """Raised when a shell command printed its usage instead of running."""
+
+
+class ShellArgumentParser(argparse.ArgumentParser):
+    """An argument parser that raises instead of exiting the shell."""
+
+    def error(self, message):
+        raise ValueError(f"{self.prog}: {message}")
+
+    def exit(self, status=0, message=None):
+        if message:
+            print(message, end="")
+        raise HelpShown()
+
+
+def build_shell_parsers():
+    """Builds the argument parsers for the shell commands."""
+    filter_parser = ShellArgumentParser(prog="filter", add_help=True)
+    add_filter_arguments(filter_parser)
+
+    search_parser = ShellArgumentParser(prog="search")
+    search_parser.add_argument("query", nargs="+")
+    search_parser.add_argument("--limit", type=int, default=10)
+
+    compare_parser = ShellArgumentParser(prog="compare")
+    compare_parser.add_argument("sensor_ids", nargs="+")
+    compare_parser.add_argument("--attributes", nargs="+", required=True)
+    compare_parser.add_argument("--weights", nargs="+", type=float)
+
+    rank_parser = ShellArgumentParser(prog="rank")
+    rank_parser.add_argument("--attributes", nargs="+", required=True)
+    rank_parser.add_argument("--weights", nargs="+", type=float)
+    rank_parser.add_argument("--top", type=int, default=10)
+    rank_parser.add_argument("--breakdown", action="store_true")
+    add_filter_arguments(rank_parser)
+
+    pareto_parser = ShellArgumentParser(prog="pareto")
+    pareto_parser.add_argument("--attributes", nargs="+", required=True)
+    pareto_parser.add_argument("--drop_missing", action="store_true")
+    add_filter_arguments(pareto_parser)
+
+    similar_parser = ShellArgumentParser(prog="similar")
+    similar_parser.add_argument("sensor_id")
+    similar_parser.add_argument("--top", type=int, default=5)
+    similar_parser.add_argument("--attributes", nargs="+")
+    similar_parser.add_argument("--weights", nargs="+", type=float)
+    add_filter_arguments(similar_parser)
+
+    rig_parser = ShellArgumentParser(prog="rig")
+    add_rig_arguments(rig_parser)
+
+    optimize_parser = ShellArgumentParser(prog="optimize")
+    add_optimize_arguments(optimize_parser)
+
+    coverage_parser = ShellArgumentParser(prog="coverage")
+    coverage_parser.add_argument("layout")
+    coverage_parser.add_argument("--min_count", type=int, default=1)
+    coverage_parser.add_argument("--top", type=int, default=5)
+
+    return {
+        "filter": filter_parser,
+        "search": search_parser,
+        "compare": compare_parser,
+        "rank": rank_parser,
+        "pareto": pareto_parser,
+        "similar": similar_parser,
+        "rig": rig_parser,
+        "optimize": optimize_parser,
+        "coverage": coverage_parser,
+    }
+
+
+class SensorShell(cmd.Cmd):
+    """
+    Interactive shell that keeps the catalog and its indexes in memory.
+    """
+
+    intro = "Robotics Sensor Compare shell. Type 'help' for commands, 'quit' to exit."
+    prompt = "sensors> "
+
+    def __init__(self, catalog=None):
+        super().__init__()
+        self.catalog = catalog or SensorCatalog()
+        self.parsers = build_shell_parsers()
+        self.show_timing = True
+
+    def preloop(self):
+        start = time.perf_counter()
+        self.catalog.refresh()
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"Loaded {len(self.catalog.data)} sensors in {elapsed:.0f} ms.")
+
+    def onecmd(self, line):
+        start = time.perf_counter()
+        stop = super().onecmd(line)
+        command = line.split()[0] if line.split() else ""
+        if self.show_timing and command in self.parsers:
+            print(f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+        return stop
+
+    def emptyline(self):
+        pass
+
+    def do_help(self, arg):
+        # Long usages are wrapped, so print docstrings without their indentation
+        method = getattr(self, f"do_{arg}", None) if arg else None
+        if method is not None and method.__doc__:
+            print(inspect.getdoc(method))
+        else:
+            super().do_help(arg)
+
+    def run(self, name, line, handler):
+        """Parses `line` with the parser for `name` and calls `handler`."""
+        try:
+            args = self.parsers[name].parse_args(shlex.split(line))
+            self.catalog.refresh_if_stale()
+            handler(args)
+        except HelpShown:
+            pass
+        except (KeyError, ValueError, TypeError) as e:
+            print(f"Error: {error_message(e)}")
+
+    def do_filter(self, line):
+        """filter [--manufacturer NAME] [--min_price USD] ...: Filter sensors."""
+
+        def handler(args):
+            df = self.catalog.filter(**filter_kwargs(args))
+            print(df[FILTER_COLUMNS].to_string(index=False))
+
+        self.run("filter", line, handler)
+
+    def do_search(self, line):
+        """search TEXT [--limit N]: Find sensors by ID, manufacturer or model."""
+
+        def handler(args):
+            query = " ".join(args.query)
+            df = self.catalog.search(query, args.limit)
+            if df.empty:
+                suggestions = self.catalog.suggest(query, args.limit)
+                print("No matching sensors.", end=" " if suggestions else "\n")
+                if suggestions:
+                    print(f"Did you mean: {', '.join(suggestions)}?")
+            else:
+                print(df[["sensor_id", "manufacturer", "model"]].to_string(index=False))
+
+        self.run("search", line, handler)
+
+    def do_compare(self, line):
+        """compare ID ID ... --attributes ATTR ... [--weights W ...]
+
+        Compare sensors.
+        """
+
+        def handler(args):
+            df = self.catalog.compare(args.sensor_ids, args.attributes, args.weights)
+            print(df.to_string(index=False))
+
+        self.run("compare", line, handler)
+
+    def do_rank(self, line):
+        """rank --attributes ATTR ... [--weights W ...] [--top K] [--breakdown]
+        [filters]
+
+        Rank sensors.
+        """
+
+        def handler(args):
+            df = self.catalog.rank(
+                args.attributes,
+                args.weights,
+                args.top,
+                args.breakdown,
+                **filter_kwargs(args),
+            )
+            print(df.to_string(index=False))
+
+        self.run("rank", line, handler)
+
+    def do_pareto(self, line):
+        """pareto --attributes ATTR ... [--drop_missing] [filters]: Pareto front."""
+
+        def handler(args):
+            df = self.catalog.pareto(
+                args.attributes, args.drop_missing, **filter_kwargs(args)
+            )
+            print(df.to_string(index=False))
+
+        self.run("pareto", line, handler)
+
+    def do_similar(self, line):
+        """similar ID [--top K] [--attributes ATTR ...] [--weights W ...] [filters]
+
+        Closest sensors by spec.
+        """
+
+        def handler(args):
+            df = self.catalog.similar(
+                args.sensor_id,
+                args.top,
+                args.attributes,
+                args.weights,
+                **filter_kwargs(args),
+            )
+            if df.empty:
+                print("No similar sensors match the filters.")
+            else:
+                print(df.to_string(index=False))
+
+        self.run("similar", line, handler)
+
+    def do_rig(self, line):
+        """rig ID ... | --combinations K [--repeat] [--top N] [rig options] [filters]
+
+        Plan bus bandwidth.
+        """
+
+        def handler(args):
+            if bool(args.sensor_ids) == (args.combinations is not None):
+                raise ValueError("Give either sensor IDs or --combinations.")
+            if args.sensor_ids:
+                print_rig(*self.catalog.rig(args.sensor_ids, **rig_kwargs(args)))
+            else:
+                print_rigs(
+                    *self.catalog.rigs(
+                        args.combinations,
+                        args.top,
+                        repeat=args.repeat,
+                        **rig_kwargs(args),
+                        **filter_kwargs(args),
+                    )
+                )
+
+        self.run("rig", line, handler)
+
+    def do_optimize(self, line):
+        """optimize --attributes ATTR ... [--budget ATTR=LIMIT ...] [--max_sensors N]
+        [filters]
+
+        Best rigs in budget.
+        """
+
+        def handler(args):
+            print_optimized(*self.catalog.optimize(**optimize_kwargs(args)))
+
+        self.run("optimize", line, handler)
+
+    def do_coverage(self, line):
+        """coverage LAYOUT.yaml [--min_count N] [--top K]
+
+        Simulate workspace coverage.
+        """
+
+        def handler(args):
+            try:
+                sensors, workspace = load_layout(args.layout)
+            except OSError as e:
+                raise ValueError(str(e))
+            print_coverage(
+                *self.catalog.coverage(sensors, workspace, args.min_count, args.top)
+            )
+
+        self.run("coverage", line, handler)
+
+    def do_attributes(self, line):
+        """attributes: List the numeric attributes available for scoring."""
+        print("\n".join(self.catalog.attributes))
+
+    def do_refresh(self, line):
+        """refresh: Reload sensor files that changed on disk."""
+        changed = self.catalog.refresh()
+        print("Catalog updated." if changed else "Catalog is up to date.")
+
+    def do_timing(self, line):
+        """timing on|off: Show or hide how long each command took."""
+        self.show_timing = line.strip().lower() != "off"
+
+    def do_quit(self, line):
+        """quit: Exit the shell."""
+        return True
+
+    do_exit = do_quit
+
+    def do_EOF(self, line):
+        print()
+        return True
+
+    def completedefault(self, text, line, begidx, endidx):
+        """Completes option names, sensor IDs and attributes."""
+        words = line[:begidx].split()
+        command = words[0] if words else ""
+        if text.startswith("-") and command in self.parsers:
+            options = self.parsers[command]._option_string_actions
+            return sorted(option for option in options if option.startswith(text))
+
+        previous_options = [word for word in words if word.startswith("--")]
+        current_option = previous_options[-1] if previous_options else None
+        if current_option == "--attributes":
+            return sorted(c for c in self.catalog.attributes if c.startswith(text))
+        if command in ("compare", "similar", "rig") and current_option is None:
+            # Without an ID prefix match, offer corrections for a typo
+            id_index = self.catalog.id_index
+            return id_index.complete(text) or id_index.suggest(text)
+        return []
+
+    def complete_filter(self, *args):
+        return self.completedefault(*args)
+
+    complete_search = complete_compare = complete_rank = complete_filter
+    complete_pareto = complete_similar = complete_rig = complete_filter
+    complete_optimize = complete_coverage = complete_filter
+
+
+def run_shell():
+    """Starts the interactive shell."""
+    try:
+        import readline
+
+        # Sensor IDs contain hyphens, so only split completion words on spaces
+        readline.set_completer_delims(" \t\n")
+    except ImportError:
+        pass
+    SensorShell().cmdloop()
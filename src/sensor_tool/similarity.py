@@ -0,0 +1,311 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+# Spec columns compared by default when looking for similar sensors.
+SIMILARITY_FEATURES = [
+    "resolution_rgb",
+    "resolution_depth",
+    "field_of_view",
+    "min_range",
+    "max_range",
+    "frame_rate",
+    "latency",
+    "power_consumption",
+    "weight",
+    "price_avg",
+]
+
+# Features that span orders of magnitude are compared on a log scale.
+LOG_FEATURES = {
+    "resolution_rgb",
+    "resolution_depth",
+    "max_range",
+    "power_consumption",
+    "weight",
+    "price_avg",
+}
+
+# Number of nodes followed down the tree for a first set of neighbours.
+PROBE_WIDTH = 8
+
+# Number of leaves scanned together once the tree has been pruned.
+SCAN_LEAVES = 8
+
+# A sensor must share at least this fraction of the query's feature weight.
+MIN_SHARED_WEIGHT = 0.5
+
+
+def feature_matrix(df, features):
+    """Scales each feature of `df` to [0, 1], keeping missing values as NaN.
+
+    Features in `LOG_FEATURES` are log-scaled first, so a 1 MP and a 2 MP
+    camera are as far apart as a 10 MP and a 20 MP one.
+    """
+    values = df[features].to_numpy(dtype=float, copy=True)
+    for j, feature in enumerate(features):
+        if feature in LOG_FEATURES:
+            column = values[:, j]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                values[:, j] = np.where(column > 0, np.log10(column), np.nan)
+    if len(values) == 0:
+        return values
+    missing = np.isnan(values)
+    low = np.where(missing, np.inf, values).min(axis=0)
+    high = np.where(missing, -np.inf, values).max(axis=0)
+    # Constant or empty columns are left unscaled
+    usable = np.isfinite(low) & (high > low)
+    low = np.where(usable, low, 0.0)
+    spread = np.where(usable, high - low, 1.0)
+    return (values - low) / spread
+
+
+def masked_distances(points, query, weights):
+    """Weighted Euclidean distances that skip missing values.
+
+    Only features present in both the query and a point are compared. The
+    squared distance is scaled up by the share of the query's weight that
+    was compared, and points sharing less than `MIN_SHARED_WEIGHT` of it
+    are infinitely far away.
+    """
+    query_present = ~np.isnan(query)
+    weights = np.where(query_present, weights, 0.0)
+    query_weight = weights.sum()
+    differences = points - np.where(query_present, query, 0.0)
+    shared = ~np.isnan(differences)
+    shared_weight = shared @ weights
+    squared = np.where(shared, differences, 0.0) ** 2 @ weights
+    with np.errstate(invalid="ignore", divide="ignore"):
+        distances = np.sqrt(squared * query_weight / shared_weight)
+    distances[~(shared_weight >= MIN_SHARED_WEIGHT * query_weight)] = np.inf
+    return distances
+
+
+class KDTree:
+    """
+    A k-d tree over points that may contain NaN.
+
+    Points are split at the median of their widest dimension, with points
+    missing that value sent to the smaller side, down to leaves of at most
+    `leaf_size` points. Each node keeps the bounding box of its points and
+    which dimensions all or none of them have, which bounds
+    `masked_distances` from below. Nodes are stored as arrays, so a query
+    can bound a whole level of the tree at once.
+    """
+
+    def __init__(self, points, leaf_size=256):
+        points = np.asarray(points, dtype=float)
+        self.leaf_size = leaf_size
+        self.order = np.arange(len(points))
+        nodes = []
+        if len(points):
+            self._build(points, 0, len(points), nodes)
+        # Points of each leaf are contiguous in tree order
+        self.points = points[self.order]
+
+        self.start = np.array([node[0] for node in nodes], dtype=np.intp)
+        self.end = np.array([node[1] for node in nodes], dtype=np.intp)
+        self.children = np.array([node[2] for node in nodes], dtype=np.intp)
+        self.children = self.children.reshape(-1, 2)
+        dims = points.shape[1]
+        self.low = np.array([node[3] for node in nodes]).reshape(-1, dims)
+        self.high = np.array([node[4] for node in nodes]).reshape(-1, dims)
+        self.complete = np.array([node[5] for node in nodes]).reshape(-1, dims)
+        self.empty = np.array([node[6] for node in nodes]).reshape(-1, dims)
+
+    def _build(self, points, start, end, nodes):
+        rows = self.order[start:end]
+        block = points[rows]
+        missing = np.isnan(block)
+        missing_count = missing.sum(axis=0)
+        low = np.where(missing, np.inf, block).min(axis=0)
+        high = np.where(missing, -np.inf, block).max(axis=0)
+        complete, empty = missing_count == 0, missing_count == len(rows)
+        node = [start, end, (-1, -1), low, high, complete, empty]
+        nodes.append(node)
+        if end - start <= self.leaf_size:
+            return len(nodes) - 1
+
+        # Prefer wide dimensions that few points are missing
+        present = 1.0 - missing_count / len(rows)
+        spread = np.where(high > low, high - low, 0.0) * present
+        axis = int(np.argmax(spread))
+        if spread[axis] <= 0:
+            return len(nodes) - 1
+        known = np.flatnonzero(~missing[:, axis])
+        unknown = np.flatnonzero(missing[:, axis])
+        half = len(known) // 2
+        split = known[np.argpartition(block[known, axis], half)]
+        left, right = split[:half], split[half:]
+        # Points without a value go to the smaller side
+        if len(left) <= len(right):
+            left = np.concatenate([left, unknown])
+        else:
+            right = np.concatenate([right, unknown])
+        order = np.concatenate([left, right])
+        middle = start + len(left)
+        self.order[start:end] = rows[order]
+        node_id = len(nodes) - 1
+        node[2] = (
+            self._build(points, start, middle, nodes),
+            self._build(points, middle, end, nodes),
+        )
+        return node_id
+
+    def lower_bounds(self, nodes, query, weights):
+        """Returns a lower bound on the distances to the points of each node.
+
+        A squared distance is the query weight times the weighted mean of
+        the squared gaps over the shared dimensions, which must cover
+        `MIN_SHARED_WEIGHT` of the query weight. Dimensions present in the
+        whole node are always shared; the mean is then minimized over the
+        others, smallest gap first and allowing fractions of a dimension,
+        which can only undershoot.
+        """
+        present = ~np.isnan(query)
+        query_weight = weights[present].sum()
+        if query_weight <= 0 or not len(nodes):
+            return np.zeros(len(nodes))
+        with np.errstate(invalid="ignore"):
+            gaps = np.maximum(self.low[nodes] - query, query - self.high[nodes])
+        gaps = np.maximum(gaps, 0.0) ** 2
+        complete = self.complete[nodes]
+        forced = complete & present
+        usable = forced | (present & ~complete & ~self.empty[nodes])
+
+        # Forced dimensions first, then the others by increasing gap
+        key = np.where(forced, -1.0, np.where(usable, gaps, np.inf))
+        ranking = np.argsort(key, axis=1)
+        rows = np.arange(len(nodes))[:, None]
+        sorted_weights = np.where(usable, weights, 0.0)[rows, ranking]
+        sorted_gaps = np.where(usable, gaps, 0.0)[rows, ranking]
+        # Shared weight and weighted gap sum up to and before each dimension
+        shared = np.cumsum(sorted_weights, axis=1)
+        total = np.cumsum(sorted_weights * sorted_gaps, axis=1)
+        shared_before = np.zeros_like(shared)
+        shared_before[:, 1:] = shared[:, :-1]
+        total_before = np.zeros_like(total)
+        total_before[:, 1:] = total[:, :-1]
+
+        forced_count = forced.sum(axis=1)[:, None]
+        position = np.arange(len(query))
+        # Allow for rounding in the shared weight of `masked_distances`
+        needed = MIN_SHARED_WEIGHT * query_weight * (1 - 1e-9)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.where(
+                (position >= forced_count - 1) & (shared >= needed),
+                total / shared,
+                np.inf,
+            )
+            # Means where the shared weight reaches `needed` within a dimension
+            partial = np.where(
+                (position >= forced_count)
+                & (shared_before < needed)
+                & (shared >= needed),
+                (total_before + (needed - shared_before) * sorted_gaps) / needed,
+                np.inf,
+            )
+        best = np.minimum(means.min(axis=1), partial.min(axis=1))
+        return np.sqrt(query_weight * best)
+
+    def query(self, query, k=5, weights=None, allowed=None):
+        """Returns the `k` nearest points as (rows, distances), nearest first.
+
+        Follows the `PROBE_WIDTH` most promising nodes down to the leaves
+        first to get a distance to beat, then prunes the tree level by level
+        against it and scans the remaining leaves nearest first.
+
+        Args:
+            query (array): Point to search around, NaN for missing values.
+            k (int): Number of neighbours.
+            weights (array, optional): Weight of each dimension.
+            allowed (array, optional): Boolean mask of rows that may be
+                returned, e.g. from hard filters.
+        """
+        query = np.asarray(query, dtype=float)
+        if weights is None:
+            weights = np.ones(len(query))
+        weights = np.asarray(weights, dtype=float)
+        if allowed is not None:
+            allowed = np.asarray(allowed, dtype=bool)[self.order]
+        best_rows = np.empty(0, dtype=np.intp)
+        best_distances = np.empty(0)
+        if k <= 0 or not len(self.start):
+            return best_rows, best_distances
+
+        # Follow the most promising nodes down first for a distance to beat
+        probe = np.array([0])
+        while True:
+            inner = self.children[probe, 0] >= 0
+            if not inner.any():
+                break
+            probe = np.concatenate(
+                [probe[~inner], self.children[probe[inner]].reshape(-1)]
+            )
+            probe_bounds = self.lower_bounds(probe, query, weights)
+            probe = probe[np.argsort(probe_bounds, kind="stable")[:PROBE_WIDTH]]
+        best_rows, best_distances = self._scan(
+            probe, query, weights, allowed, k, best_rows, best_distances
+        )
+
+        # Leaves at exactly the k-th distance may still hold ties
+        worst = best_distances[-1] if len(best_distances) == k else np.inf
+        nodes = np.array([0])
+        node_bounds = self.lower_bounds(nodes, query, weights)
+        leaves, leaf_bounds = [], []
+        while len(nodes):
+            keep = (node_bounds <= worst) & (node_bounds < np.inf)
+            nodes, node_bounds = nodes[keep], node_bounds[keep]
+            is_leaf = self.children[nodes, 0] < 0
+            leaves.append(nodes[is_leaf])
+            leaf_bounds.append(node_bounds[is_leaf])
+            nodes = self.children[nodes[~is_leaf]].reshape(-1)
+            node_bounds = self.lower_bounds(nodes, query, weights)
+
+        leaves = np.concatenate(leaves)
+        leaf_bounds = np.concatenate(leaf_bounds)
+        ranking = np.argsort(leaf_bounds, kind="stable")
+        ranking = ranking[~np.isin(leaves[ranking], probe)]
+        leaves, leaf_bounds = leaves[ranking], leaf_bounds[ranking]
+        position = 0
+        while position < len(leaves):
+            worst = best_distances[-1] if len(best_distances) == k else np.inf
+            stop = np.searchsorted(leaf_bounds, worst, side="right")
+            stop = min(stop, position + SCAN_LEAVES)
+            if stop <= position:
+                break
+            best_rows, best_distances = self._scan(
+                leaves[position:stop],
+                query,
+                weights,
+                allowed,
+                k,
+                best_rows,
+                best_distances,
+            )
+            position = stop
+        return self.order[best_rows], best_distances
+
+    def _scan(self, leaves, query, weights, allowed, k, best_rows, best_distances):
+        """Merges the points of `leaves` into the `k` best found so far."""
+        rows = np.concatenate(
+            [np.arange(self.start[leaf], self.end[leaf]) for leaf in leaves]
+        )
+        if allowed is not None:
+            rows = rows[allowed[rows]]
+        distances = masked_distances(self.points[rows], query, weights)
+        finite = np.isfinite(distances)
+        rows = np.concatenate([best_rows, rows[finite]])
+        distances = np.concatenate([best_distances, distances[finite]])
+        keep = np.lexsort((self.order[rows], distances))[:k]
+        return rows[keep], distances[keep]
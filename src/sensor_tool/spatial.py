@@ -0,0 +1,114 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+
+import numpy as np
+
+# Derived attributes describing how finely a sensor samples the scene.
+SPATIAL_ATTRIBUTES = [
+    "pixels_per_degree",
+    "mm_per_pixel_at_min_range",
+    "mm_per_pixel_at_max_range",
+    "points_per_m2_at_min_range",
+    "points_per_m2_at_max_range",
+]
+
+
+def extract_image_size(resolution, modality):
+    """Returns the (width, height) in pixels of a modality's images.
+
+    Accepts {"width": W, "height": H} entries as well as "WxH" strings,
+    e.g. "1920x1200 (side-by-side)".
+    """
+    if isinstance(resolution, dict):
+        resolution = resolution.get(modality)
+    if isinstance(resolution, dict):
+        width, height = resolution.get("width"), resolution.get("height")
+        if isinstance(width, (int, float)) and isinstance(height, (int, float)):
+            return float(width), float(height)
+    elif isinstance(resolution, str):
+        match = re.search(r"(\d+)\s*[x×]\s*(\d+)", resolution)
+        if match:
+            return float(match.group(1)), float(match.group(2))
+    return np.nan, np.nan
+
+
+def image_sizes(resolutions):
+    """Returns the image width and height of each sensor as two arrays.
+
+    The depth stream is used where a sensor has one, since it is what the
+    point density depends on, and the RGB stream otherwise. A plain string
+    resolution counts for both.
+    """
+    sizes = np.full((len(resolutions), 2), np.nan)
+    for i, resolution in enumerate(resolutions):
+        for modality in ["depth", "rgb"]:
+            size = extract_image_size(resolution, modality)
+            if not np.isnan(size[0]):
+                sizes[i] = size
+                break
+    return sizes[:, 0], sizes[:, 1]
+
+
+def range_grid(min_range, max_range, steps=10):
+    """Returns `steps` evenly spaced distances per sensor, in metres.
+
+    Returns:
+        numpy.ndarray: A (sensors x steps) matrix, NaN where a range is missing.
+    """
+    min_range = np.asarray(min_range, dtype=float)
+    max_range = np.asarray(max_range, dtype=float)
+    fractions = np.linspace(0.0, 1.0, steps)
+    return min_range[:, None] + (max_range - min_range)[:, None] * fractions
+
+
+def spatial_resolution(width, height, horizontal_fov, vertical_fov, distances):
+    """Computes pixel density metrics on a flat target facing the sensor.
+
+    At distance d, a pinhole sensor sees a 2 d tan(fov / 2) wide patch. A
+    missing vertical field of view is derived from the horizontal one and
+    the aspect ratio, assuming square pixels. Fields of view of 180° or
+    more have no flat footprint, so only their pixels per degree is set.
+
+    Args:
+        width, height (array): Image size of each sensor in pixels.
+        horizontal_fov, vertical_fov (array): Fields of view in degrees.
+        distances (array): Distances in metres, one row per sensor, e.g.
+            from `range_grid`, or a single column.
+
+    Returns:
+        dict: `pixels_per_degree` per sensor, and `mm_per_pixel` and
+        `points_per_m2` with the shape of `distances`.
+    """
+    width, height = np.asarray(width, float), np.asarray(height, float)
+    horizontal_fov = np.asarray(horizontal_fov, float)
+    horizontal = np.radians(horizontal_fov)
+    vertical = np.radians(np.asarray(vertical_fov, float))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        pixels_per_degree = width / horizontal_fov
+        horizontal = np.where(horizontal < np.pi, horizontal, np.nan)
+        half_width = np.tan(horizontal / 2)
+        half_height = np.where(
+            np.isnan(vertical),
+            half_width * height / width,
+            np.tan(np.where(vertical < np.pi, vertical, np.nan) / 2),
+        )
+        distances = np.asarray(distances, float).reshape(len(width), -1)
+        distances = np.where(distances > 0, distances, np.nan)
+        patch_width = 2 * distances * half_width[:, None]
+        patch_height = 2 * distances * half_height[:, None]
+        return {
+            "pixels_per_degree": pixels_per_degree,
+            "mm_per_pixel": 1000 * patch_width / width[:, None],
+            "points_per_m2": (width * height)[:, None] / (patch_width * patch_height),
+        }
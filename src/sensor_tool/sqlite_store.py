@@ -0,0 +1,310 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+# List fields of the schema, stored one value per row as (table, value column).
+LIST_TABLES = {
+    "ros_compatibility": ("ros_compatibility", "version"),
+    "tags": ("tags", "tag"),
+    "use_cases": ("use_cases", "use_case"),
+    "supported_platforms": ("platforms", "platform"),
+    "key_features": ("key_features", "feature"),
+}
+
+RESOLUTION_MODALITIES = ["rgb", "depth", "ir"]
+
+# Columns `apply_filters` compares, which get an index each.
+INDEXED_COLUMNS = [
+    "sensor_type",
+    "manufacturer",
+    "resolution_rgb",
+    "frame_rate",
+    "price_avg",
+    "field_of_view",
+    "pixels_per_degree",
+    "mm_per_pixel_at_max_range",
+]
+
+SQL_TYPES = {"float": "REAL", "integer": "INTEGER"}
+
+# Sensor IDs bound per query when reading list fields, below SQLite's limit.
+LOOKUP_BATCH = 500
+
+
+def sensor_columns(column_types):
+    """Maps the export columns kept in the `sensors` table to SQL types.
+
+    Resolutions and lists get their own tables. Nested fields are joined
+    with underscores, e.g. `price_range_min_price`.
+    """
+    return {
+        column.replace(".", "_"): SQL_TYPES.get(column_type, "TEXT")
+        for column, column_type in column_types.items()
+        if column_type != "list" and not column.startswith("resolution.")
+    }
+
+
+def create_tables(connection, column_types):
+    """Creates the empty tables of a catalog database."""
+    columns = sensor_columns(column_types)
+    definitions = ", ".join(
+        f"{column} {sql_type}" + (" PRIMARY KEY" if column == "sensor_id" else "")
+        for column, sql_type in columns.items()
+    )
+    connection.execute(f"CREATE TABLE sensors ({definitions})")
+    connection.execute(
+        "CREATE TABLE resolutions (sensor_id TEXT NOT NULL, modality TEXT NOT NULL, "
+        "width INTEGER, height INTEGER, PRIMARY KEY (sensor_id, modality))"
+    )
+    for table, value in LIST_TABLES.values():
+        connection.execute(
+            f"CREATE TABLE {table} (sensor_id TEXT NOT NULL, {value} TEXT NOT NULL)"
+        )
+
+
+def create_indexes(connection):
+    """Indexes the filter columns and the list tables, once the data is in."""
+    for column in INDEXED_COLUMNS:
+        connection.execute(f"CREATE INDEX sensors_{column} ON sensors ({column})")
+    # Both orders, for reading a sensor's values and for membership tests
+    for table, value in LIST_TABLES.values():
+        connection.execute(
+            f"CREATE INDEX {table}_sensor ON {table} (sensor_id, {value})"
+        )
+        connection.execute(
+            f"CREATE INDEX {table}_{value} ON {table} ({value}, sensor_id)"
+        )
+    # Statistics let the query planner pick the most selective index
+    connection.execute("ANALYZE")
+
+
+def _sql_value(value):
+    """Converts NaN, NA and NumPy scalars to what sqlite3 can bind."""
+    if value is None or (not isinstance(value, (list, dict)) and pd.isna(value)):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def insert_chunk(connection, chunk, column_types):
+    """Writes a chunk from `export_sensors.iter_export_chunks` to the tables."""
+    columns = [column for column in column_types if column_types[column] != "list"]
+    columns = [column for column in columns if not column.startswith("resolution.")]
+    names = [column.replace(".", "_") for column in columns]
+    rows = chunk[columns].astype(object).itertuples(index=False, name=None)
+    connection.executemany(
+        f"INSERT INTO sensors ({', '.join(names)}) "
+        f"VALUES ({', '.join('?' * len(names))})",
+        ([_sql_value(value) for value in row] for row in rows),
+    )
+
+    sensor_ids = chunk["sensor_id"].tolist()
+    resolutions = []
+    for modality in RESOLUTION_MODALITIES:
+        widths = chunk[f"resolution.{modality}.width"].tolist()
+        heights = chunk[f"resolution.{modality}.height"].tolist()
+        for sensor_id, width, height in zip(sensor_ids, widths, heights):
+            if _sql_value(width) is not None or _sql_value(height) is not None:
+                resolutions.append(
+                    (sensor_id, modality, _sql_value(width), _sql_value(height))
+                )
+    connection.executemany("INSERT INTO resolutions VALUES (?, ?, ?, ?)", resolutions)
+
+    for field, (table, _) in LIST_TABLES.items():
+        connection.executemany(
+            f"INSERT INTO {table} VALUES (?, ?)",
+            (
+                (sensor_id, str(value))
+                for sensor_id, values in zip(sensor_ids, chunk[field])
+                if isinstance(values, list)
+                for value in values
+            ),
+        )
+
+
+def export_sqlite(output_path, chunks, column_types):
+    """Writes catalog chunks to a new SQLite database at `output_path`.
+
+    Indexes are built after the rows are in, which is faster than updating
+    them on every insert.
+
+    Returns:
+        int: The number of exported sensors.
+    """
+    if os.path.exists(output_path):
+        os.remove(output_path)
+    connection = sqlite3.connect(output_path)
+    row_count = 0
+    try:
+        with connection:
+            create_tables(connection, column_types)
+            for chunk in chunks:
+                insert_chunk(connection, chunk, column_types)
+                row_count += len(chunk)
+            create_indexes(connection)
+    finally:
+        connection.close()
+    return row_count
+
+
+def _like_pattern(text):
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def filter_clause(
+    sensor_type=None,
+    manufacturer=None,
+    ros_compatibility=None,
+    min_resolution=None,
+    max_resolution=None,
+    min_frame_rate=None,
+    max_frame_rate=None,
+    min_price=None,
+    max_price=None,
+    min_fov=None,
+    max_fov=None,
+    min_pixels_per_degree=None,
+    max_mm_per_pixel=None,
+):
+    """Translates the `apply_filters` criteria to an SQL WHERE clause.
+
+    Text criteria match case-insensitive substrings with LIKE, so unlike
+    `apply_filters` they are not regular expressions.
+
+    Returns:
+        tuple: The clause, empty if there are no criteria, and its parameters.
+    """
+    conditions, params = [], []
+    for column, text in [("sensor_type", sensor_type), ("manufacturer", manufacturer)]:
+        if text:
+            conditions.append(f"{column} LIKE ? ESCAPE '\\'")
+            params.append(_like_pattern(text))
+    bounds = [
+        ("resolution_rgb", min_resolution, max_resolution),
+        ("frame_rate", min_frame_rate, max_frame_rate),
+        ("price_avg", min_price, max_price),
+        ("field_of_view", min_fov, max_fov),
+        ("pixels_per_degree", min_pixels_per_degree, None),
+        ("mm_per_pixel_at_max_range", None, max_mm_per_pixel),
+    ]
+    for column, low, high in bounds:
+        if low:
+            conditions.append(f"{column} >= ?")
+            params.append(low)
+        if high:
+            conditions.append(f"{column} <= ?")
+            params.append(high)
+    if ros_compatibility:
+        # Correlated, so it is only checked for rows the other criteria keep
+        conditions.append(
+            "EXISTS (SELECT 1 FROM ros_compatibility AS r "
+            "WHERE r.sensor_id = sensors.sensor_id AND r.version = ?)"
+        )
+        params.append(ros_compatibility)
+    clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return clause, params
+
+
+class SQLiteCatalog:
+    """
+    Queries a database written by `export_sqlite` without loading it.
+
+    Filter criteria run as SQL on the indexed columns, and only the
+    matching sensors are read into pandas, with their list fields.
+    """
+
+    def __init__(self, path):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"SQLite catalog '{path}' not found.")
+        self.path = path
+
+    def connect(self):
+        """Opens the database read-only."""
+        return sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+
+    def count(self, **criteria):
+        """Returns the number of sensors matching the `apply_filters` criteria."""
+        clause, params = filter_clause(**criteria)
+        connection = self.connect()
+        try:
+            query = f"SELECT COUNT(*) FROM sensors {clause}"
+            return connection.execute(query, params).fetchone()[0]
+        finally:
+            connection.close()
+
+    def filter(self, columns=None, **criteria):
+        """Returns the sensors matching the `apply_filters` criteria.
+
+        Args:
+            columns (list, optional): Columns of the `sensors` table and list
+                fields to return. Defaults to all of them.
+        """
+        clause, params = filter_clause(**criteria)
+        connection = self.connect()
+        try:
+            types = {
+                row[1]: row[2]
+                for row in connection.execute("PRAGMA table_info(sensors)")
+            }
+            available = list(types)
+            columns = list(columns or available + list(LIST_TABLES))
+            unknown = [
+                column
+                for column in columns
+                if column not in available and column not in LIST_TABLES
+            ]
+            if unknown:
+                raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+            selected = [column for column in columns if column in available]
+            if "sensor_id" not in selected:
+                selected.insert(0, "sensor_id")
+            df = pd.read_sql_query(
+                f"SELECT {', '.join(selected)} FROM sensors {clause} ORDER BY rowid",
+                connection,
+                params=params,
+            )
+            # Columns that are all NULL would otherwise come back as objects
+            for column in selected:
+                if types[column] == "REAL":
+                    df[column] = df[column].astype(float)
+                elif types[column] == "INTEGER":
+                    df[column] = df[column].astype("Int64")
+            for field in columns:
+                if field in LIST_TABLES:
+                    df[field] = self._list_values(connection, field, df["sensor_id"])
+        finally:
+            connection.close()
+        return df[columns]
+
+    @staticmethod
+    def _list_values(connection, field, sensor_ids):
+        """Reads a list field for the given sensors, `LOOKUP_BATCH` at a time."""
+        table, value = LIST_TABLES[field]
+        sensor_ids = sensor_ids.tolist()
+        values = {}
+        for start in range(0, len(sensor_ids), LOOKUP_BATCH):
+            batch = sensor_ids[start : start + LOOKUP_BATCH]
+            rows = connection.execute(
+                f"SELECT sensor_id, {value} FROM {table} "
+                f"WHERE sensor_id IN ({', '.join('?' * len(batch))}) ORDER BY rowid",
+                batch,
+            )
+            for sensor_id, item in rows:
+                values.setdefault(sensor_id, []).append(item)
+        return [values.get(sensor_id, []) for sensor_id in sensor_ids]
@@ -0,0 +1,201 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+import yaml
+
+# Per quantity, how many canonical units one unit is worth. Currency rates
+# are USD per unit and only a fallback for `config/unit_conversions.yaml`.
+DEFAULT_CONVERSIONS = {
+    "power": {"W": 1.0, "mW": 0.001},
+    "mass": {"g": 1.0, "kg": 1000.0},
+    "length": {"mm": 1.0, "cm": 10.0, "m": 1000.0},
+    "currency": {"USD": 1.0, "EUR": 1.08, "GBP": 1.27, "SGD": 0.74, "INR": 0.012},
+}
+
+# Sensor dimensions, read from the `size` field.
+SIZE_ATTRIBUTES = ["size_length", "size_width", "size_height"]
+
+# Attributes stored in canonical units, mapped to (quantity, unit).
+CANONICAL_UNITS = {
+    "power_consumption": ("power", "W"),
+    "weight": ("mass", "g"),
+    "price_avg": ("currency", "USD"),
+    **{attr: ("length", "mm") for attr in SIZE_ATTRIBUTES},
+}
+
+# Top-level fields holding the unit of an attribute.
+UNIT_COLUMNS = {"power_consumption": "power_consumption_unit", "weight": "weight_unit"}
+
+# Columns keeping the value and unit of an attribute as given in the files.
+ORIGINAL_COLUMNS = {
+    attr: (f"{attr}_original", f"{attr}_original_unit")
+    for attr in CANONICAL_UNITS
+    if attr not in SIZE_ATTRIBUTES
+}
+
+_conversions = None
+
+
+def get_conversions_path():
+    """Returns the path to the unit conversion tables."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = os.path.abspath(os.path.join(script_dir, "..", ".."))
+    return os.path.join(repo_root, "config", "unit_conversions.yaml")
+
+
+def load_conversions(path=None):
+    """Reads conversion tables, falling back to `DEFAULT_CONVERSIONS`.
+
+    The file maps quantities to {unit: factor} tables like the defaults.
+    Its units are added to the default tables, or replace them.
+
+    Raises:
+        ValueError: If a table is not a mapping of units to numbers.
+    """
+    path = path or get_conversions_path()
+    conversions = {
+        quantity: dict(table) for quantity, table in DEFAULT_CONVERSIONS.items()
+    }
+    if not os.path.exists(path):
+        return conversions
+    with open(path, "r") as file:
+        overrides = yaml.safe_load(file) or {}
+    for quantity, table in overrides.items():
+        if not isinstance(table, dict) or not all(
+            isinstance(factor, (int, float)) and factor > 0 for factor in table.values()
+        ):
+            raise ValueError(
+                f"{path}: '{quantity}' must map units to positive numbers."
+            )
+        conversions.setdefault(quantity, {}).update(
+            {str(unit): float(factor) for unit, factor in table.items()}
+        )
+    return conversions
+
+
+def get_conversions():
+    """Returns the conversion tables, loading them on first use."""
+    global _conversions
+    if _conversions is None:
+        _conversions = load_conversions()
+    return _conversions
+
+
+def _fields(df, column, keys):
+    """Unpacks the given keys of a column of dicts into a DataFrame."""
+    values = df[column] if column in df.columns else [None] * len(df)
+    return pd.DataFrame(
+        [x if isinstance(x, dict) else {} for x in values],
+        index=df.index,
+        columns=keys,
+    )
+
+
+def split_quantity(values):
+    """Splits values such as "30 W" into their first number and its unit.
+
+    Numbers are returned as they are, without a unit. Only strings are
+    parsed, with the number pattern of `utils.extract_numeric`.
+
+    Returns:
+        tuple: The numbers as a float Series and the units as objects.
+    """
+    values = pd.Series(values, dtype=object)
+    numbers = pd.to_numeric(values, errors="coerce").astype(float)
+    units = pd.Series(None, index=values.index, dtype=object)
+    text = values[numbers.isna() & values.notna()].astype(str)
+    if len(text):
+        parts = text.str.extract(r"([-+]?\d*\.\d+|\d+)\s*([^\W\d_]+)?")
+        numbers[text.index] = parts[0].astype(float)
+        units[text.index] = parts[1].where(parts[1].notna(), None)
+    return numbers, units
+
+
+def to_canonical(values, units, table, canonical):
+    """Converts values given in `units` with a conversion table.
+
+    Units are factorized, so each distinct unit is looked up once. A missing
+    unit is taken to be `canonical`, and unknown units give NaN.
+
+    Returns:
+        numpy.ndarray: The converted values as floats.
+    """
+    values = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype=float)
+    units = pd.Series(units, dtype=object).fillna(canonical).astype(str)
+    codes, uniques = pd.factorize(units)
+    factors = np.array([table.get(unit, np.nan) for unit in uniques])[codes]
+    return values * factors
+
+
+def original_labels(df, attribute):
+    """Returns how each value of `attribute` was given, e.g. "500 mW".
+
+    Labels are empty for values given in the canonical unit, and for
+    attributes without `ORIGINAL_COLUMNS` in `df`.
+    """
+    columns = ORIGINAL_COLUMNS.get(attribute)
+    if columns is None or not set(columns) <= set(df.columns):
+        return [""] * len(df)
+    canonical = CANONICAL_UNITS[attribute][1]
+    return [
+        f"{value:g} {unit}" if pd.notna(value) and unit not in (None, canonical) else ""
+        for value, unit in zip(df[columns[0]], df[columns[1]])
+    ]
+
+
+def normalize_units(df, attributes, conversions=None):
+    """Converts the given `CANONICAL_UNITS` attributes of a sensor DataFrame.
+
+    `power_consumption` and `weight` may be numbers or strings such as
+    "30 W", where the unit in the string wins over the unit field, and
+    `price_avg` must already be numeric. Their values as given and their
+    units are kept in the `ORIGINAL_COLUMNS`, and the unit fields are set
+    to the canonical unit. Values without a unit
+    are taken to be in the canonical unit already, and values in unknown
+    units are dropped with a warning. Size attributes are read from the
+    `size` field, which is left as it is.
+    """
+    conversions = conversions or get_conversions()
+    size = None
+    for attr in attributes:
+        quantity, canonical = CANONICAL_UNITS[attr]
+        if attr in SIZE_ATTRIBUTES:
+            if size is None:
+                size = _fields(df, "size", ["length", "width", "height", "unit"])
+            values, units = size[attr[len("size_") :]], size["unit"]
+        else:
+            if attr == "price_avg":
+                values = df[attr]
+                units = _fields(df, "price_range", ["currency"])["currency"]
+            else:
+                values, units = split_quantity(df[attr])
+                column = df.get(UNIT_COLUMNS[attr], pd.Series(None, index=df.index))
+                units = units.fillna(column.astype(object).where(column.notna()))
+            units = units.fillna(canonical).where(values.notna(), None)
+            value_column, unit_column = ORIGINAL_COLUMNS[attr]
+            df[value_column] = values
+            df[unit_column] = units
+        df[attr] = to_canonical(values, units, conversions[quantity], canonical)
+        unknown = df[attr].isna() & values.notna()
+        if unknown.any():
+            logging.warning(
+                f"Unknown {attr} units {sorted(set(units[unknown].astype(str)))}, "
+                "values left out."
+            )
+        if attr in UNIT_COLUMNS:
+            df[UNIT_COLUMNS[attr]] = np.where(df[attr].isna(), None, canonical)
+    return df
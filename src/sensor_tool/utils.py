@@ -16,6 +16,9 @@ import numpy as np
 import re
 import logging
 
+from .spatial import SPATIAL_ATTRIBUTES, image_sizes, spatial_resolution
+from .units import CANONICAL_UNITS, SIZE_ATTRIBUTES, normalize_units
+
 
 def format_label(label):
     """Formats a label by capitalizing words and handling special cases like 'RGB' and 'ROS'."""
@@ -40,8 +43,18 @@ def get_unit(attribute, sensor_data=None):
         "resolution_rgb": "pixels",
         "resolution_depth": "pixels",
         "field_of_view": "°",
+        "horizontal_fov": "°",
+        "vertical_fov": "°",
+        "pixels_per_degree": "px/°",
+        "mm_per_pixel_at_min_range": "mm",
+        "mm_per_pixel_at_max_range": "mm",
+        "points_per_m2_at_min_range": "pts/m²",
+        "points_per_m2_at_max_range": "pts/m²",
         "power_consumption": "W",
         "weight": "g",
+        "size_length": "mm",
+        "size_width": "mm",
+        "size_height": "mm",
         "ros_compatibility_score": "",
         "price_avg": "USD",
     }
@@ -63,13 +76,23 @@ def is_higher_better(attribute):
         "resolution_rgb",
         "resolution_depth",
         "field_of_view",
+        "horizontal_fov",
+        "vertical_fov",
+        "pixels_per_degree",
+        "points_per_m2_at_min_range",
+        "points_per_m2_at_max_range",
         "ros_compatibility_score",
     ]
     lower_is_better = [
         "min_range",
+        "mm_per_pixel_at_min_range",
+        "mm_per_pixel_at_max_range",
         "latency",
         "power_consumption",
         "weight",
+        "size_length",
+        "size_width",
+        "size_height",
         "price_avg",
     ]
     if attribute in higher_is_better:
@@ -85,7 +108,7 @@ def extract_fov(value):
     if isinstance(value, dict):
         if "diagonal" in value and pd.notna(value["diagonal"]):
             return value["diagonal"]
-        elif "horizontal" in value and "vertical" in value:
+        elif pd.notna(value.get("horizontal")) and pd.notna(value.get("vertical")):
             horizontal = value["horizontal"]
             vertical = value["vertical"]
             diagonal_fov = (horizontal**2 + vertical**2) ** 0.5
@@ -93,6 +116,23 @@ def extract_fov(value):
     return np.nan
 
 
+def extract_fov_component(value, component):
+    """Extracts the 'horizontal' or 'vertical' field of view in degrees.
+
+    Accepts the schema's dictionary as well as strings such as
+    "110° horizontal x 80° vertical".
+    """
+    if isinstance(value, dict):
+        component_value = value.get(component)
+        if isinstance(component_value, (int, float)) and pd.notna(component_value):
+            return float(component_value)
+    elif isinstance(value, str):
+        match = re.search(rf"(\d+(?:\.\d+)?)\s*°?\s*{component}", value, re.IGNORECASE)
+        if match:
+            return float(match.group(1))
+    return np.nan
+
+
 def extract_resolution(resolution_dict, modality):
     """Extracts the resolution for a given modality (e.g., 'rgb', 'depth')."""
     if isinstance(resolution_dict, dict) and modality in resolution_dict:
@@ -105,6 +145,36 @@ def extract_resolution(resolution_dict, modality):
     return np.nan
 
 
+def extract_spatial_attributes(df):
+    """Computes the `SPATIAL_ATTRIBUTES` of each sensor from its raw fields.
+
+    Pixel density is evaluated at the sensor's minimum and maximum range,
+    see `spatial.spatial_resolution`.
+
+    Returns:
+        DataFrame: One column per spatial attribute, aligned with `df`.
+    """
+    width, height = image_sizes(df["resolution"].tolist())
+    fov = {
+        component: df["field_of_view"]
+        .apply(lambda x: extract_fov_component(x, component))
+        .to_numpy(dtype=float)
+        for component in ["horizontal", "vertical"]
+    }
+    ranges = [
+        df[column].apply(extract_numeric).to_numpy(dtype=float)
+        for column in ["min_range", "max_range"]
+    ]
+    metrics = spatial_resolution(
+        width, height, fov["horizontal"], fov["vertical"], np.column_stack(ranges)
+    )
+    columns = {"pixels_per_degree": metrics["pixels_per_degree"]}
+    for j, bound in enumerate(["min_range", "max_range"]):
+        columns[f"mm_per_pixel_at_{bound}"] = metrics["mm_per_pixel"][:, j]
+        columns[f"points_per_m2_at_{bound}"] = metrics["points_per_m2"][:, j]
+    return pd.DataFrame(columns, index=df.index)[SPATIAL_ATTRIBUTES]
+
+
 def extract_ros_compatibility(value):
     """Calculates the ROS compatibility score based on the supported ROS versions."""
     if not value:
@@ -163,6 +233,185 @@ def extract_price_avg(price_dict):
     return np.nan
 
 
+# Schema fields that are stored as plain numbers or numeric strings.
+NUMERIC_ATTRIBUTES = [
+    "min_range",
+    "max_range",
+    "frame_rate",
+    "latency",
+    "power_consumption",
+    "weight",
+]
+
+COMPUTED_ATTRIBUTES = (
+    [
+        "ros_compatibility_score",
+        "ros_total_score",
+        "additional_ros_score",
+        "resolution_rgb",
+        "resolution_depth",
+        "field_of_view",
+        "horizontal_fov",
+        "vertical_fov",
+        "price_avg",
+    ]
+    + SPATIAL_ATTRIBUTES
+    + SIZE_ATTRIBUTES
+)
+
+
+def preprocess_attributes(df, attributes, conversions=None):
+    """Adds numeric columns for the given attributes to a loaded sensor DataFrame.
+
+    Power, weight, size and price are converted to the units reported by
+    `get_unit`, see `units.normalize_units`.
+
+    Args:
+        conversions (dict, optional): Unit conversion tables. Defaults to
+            those of `config/unit_conversions.yaml`.
+
+    Raises:
+        KeyError: If an attribute is neither computed nor present in the data.
+    """
+    df["ros_compatibility_score"] = df["ros_compatibility"].apply(
+        extract_ros_compatibility
+    )
+    df["additional_ros_score"] = df.apply(extract_additional_ros_factors, axis=1)
+    df["ros_total_score"] = df["ros_compatibility_score"] + df["additional_ros_score"]
+
+    # Read from the raw resolution, which may be a "WxH" string
+    spatial = [attr for attr in attributes if attr in SPATIAL_ATTRIBUTES]
+    if spatial:
+        df[spatial] = extract_spatial_attributes(df)[spatial]
+
+    # "WxH" strings are kept for `rig.stream_rates`
+    df["resolution"] = df["resolution"].apply(
+        lambda x: x if isinstance(x, (dict, str)) else {}
+    )
+    if "resolution_rgb" in attributes:
+        df["resolution_rgb"] = df["resolution"].apply(
+            lambda x: extract_resolution(x, "rgb")
+        )
+    if "resolution_depth" in attributes:
+        df["resolution_depth"] = df["resolution"].apply(
+            lambda x: extract_resolution(x, "depth")
+        )
+
+    # The components are read from the raw values, before they are replaced
+    for component in ["horizontal", "vertical"]:
+        if f"{component}_fov" in attributes:
+            df[f"{component}_fov"] = df["field_of_view"].apply(
+                lambda x: extract_fov_component(x, component)
+            )
+    if "field_of_view" in attributes:
+        df["field_of_view"] = df["field_of_view"].apply(extract_fov)
+
+    if "price_avg" in attributes:
+        df["price_avg"] = df["price_range"].apply(extract_price_avg)
+
+    # Before the numbers are extracted, so units such as "30 W" are read
+    converted = [
+        attr
+        for attr in attributes
+        if attr in CANONICAL_UNITS
+        and (attr in COMPUTED_ATTRIBUTES or attr in df.columns)
+    ]
+    if converted:
+        df = normalize_units(df, converted, conversions)
+
+    for attr in attributes:
+        if attr in COMPUTED_ATTRIBUTES:
+            continue
+        if attr not in df.columns:
+            raise KeyError(f"Attribute {attr} not found in data.")
+        df[attr] = df[attr].apply(extract_numeric)
+    return df
+
+
+def normalize_attributes(df, attributes):
+    """Scales each attribute column to [0, 1] where 1 is the best value.
+
+    Uses the same rules as `calculate_score`: attributes without a known
+    direction or without spread map to 0.5, and missing values stay NaN.
+
+    Returns:
+        numpy.ndarray: A (sensors x attributes) float matrix.
+    """
+    values = df[attributes].astype(float).to_numpy()
+    if values.size == 0:
+        return values
+    missing = np.isnan(values)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        min_vals = np.where(missing, np.inf, values).min(axis=0)
+        max_vals = np.where(missing, -np.inf, values).max(axis=0)
+        spread = max_vals - min_vals
+        normalized = (values - min_vals) / spread
+    for j, attr in enumerate(attributes):
+        higher_better = is_higher_better(attr)
+        if higher_better is None or not np.isfinite(spread[j]) or spread[j] == 0:
+            normalized[:, j] = 0.5
+        elif higher_better is False:
+            normalized[:, j] = 1.0 - normalized[:, j]
+    normalized[missing] = np.nan
+    return normalized
+
+
+def calculate_scores_vectorized(normalized, weights):
+    """Computes `calculate_score` style 0-10 scores from a normalized matrix."""
+    weights = np.asarray(weights, dtype=float)
+    present = ~np.isnan(normalized)
+    total_weight = present.astype(float) @ weights
+    weighted = np.where(present, normalized, 0.0) @ weights
+    scores = np.zeros(len(normalized))
+    np.divide(weighted * 10, total_weight, out=scores, where=total_weight > 0)
+    return scores
+
+
+def score_contributions(normalized, weights):
+    """Splits `calculate_scores_vectorized` scores into per-attribute parts.
+
+    Returns:
+        numpy.ndarray: A (sensors x attributes) matrix whose rows sum to the
+        sensors' 0-10 scores. Missing values contribute 0.
+    """
+    weights = np.asarray(weights, dtype=float)
+    present = ~np.isnan(normalized)
+    total_weight = present.astype(float) @ weights
+    contributions = np.where(present, normalized, 0.0) * weights * 10
+    return np.divide(
+        contributions,
+        total_weight[:, None],
+        out=np.zeros_like(contributions),
+        where=total_weight[:, None] > 0,
+    )
+
+
+def top_k_indices(scores, k):
+    """Returns the positions of the `k` highest scores, best first.
+
+    Selects with `np.partition` instead of sorting every score. Ties keep
+    their original order, as with a stable descending sort, and NaN scores
+    come last.
+    """
+    scores = np.asarray(scores, dtype=float)
+    k = max(0, min(k, len(scores)))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    missing = np.isnan(scores)
+    if missing.any():
+        present = np.flatnonzero(~missing)
+        best = present[top_k_indices(scores[present], k)]
+        return np.concatenate([best, np.flatnonzero(missing)[: k - len(best)]])
+    if k < len(scores):
+        threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+        better = np.flatnonzero(scores > threshold)
+        ties = np.flatnonzero(scores == threshold)[: k - len(better)]
+        positions = np.concatenate([better, ties])
+    else:
+        positions = np.arange(len(scores))
+    return positions[np.lexsort((positions, -scores[positions]))]
+
+
 def calculate_score(selected_sensors, attributes, weights):
     """Calculates a normalized score for each sensor based on attributes and weights."""
     scores = {}
@@ -205,7 +454,11 @@ def calculate_score(selected_sensors, attributes, weights):
 def add_benchmark_line(
     ax, attribute, max_value, user_benchmark=None, user_benchmark_label=None
 ):
-    """Adds a benchmark line to a plot."""
+    """Adds a benchmark line to a plot.
+
+    Returns:
+        list: The added line and label artists, empty if there is no benchmark.
+    """
     color = "brown"
     if user_benchmark is not None:
         benchmark_value = user_benchmark
@@ -232,7 +485,9 @@ def add_benchmark_line(
         label = label_map.get(
             attribute, f"Recommended {format_label(attribute)}: {label_text}"
         )
-        ax.axhline(y=benchmark_value, color=color, linestyle="--", linewidth=1)
-        ax.text(
+        line = ax.axhline(y=benchmark_value, color=color, linestyle="--", linewidth=1)
+        text = ax.text(
             0, benchmark_value + (max_value * 0.02), label, color=color, fontsize=10
         )
+        return [line, text]
+    return []
@@ -15,6 +15,8 @@ import sys
 import logging
 import yamale
 
+from .profiling import span
+
 
 def get_schema_path():
     """Returns the path to the sensor schema file."""
@@ -31,6 +33,7 @@ def get_schema_path():
         return None
 
 
+@span("validate_sensor")
 def validate_sensor(file_path, schema):
     """Validates a sensor YAML file against the schema."""
     try:
@@ -49,6 +52,7 @@ def validate_sensor(file_path, schema):
         return False
 
 
+@span("validate_sensors_main")
 def validate_sensors_main(files=[]):
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
     schema_path = get_schema_path()
@@ -56,7 +60,8 @@ def validate_sensors_main(files=[]):
         sys.exit(1)
 
     try:
-        schema = yamale.make_schema(schema_path)
+        with span("load_schema"):
+            schema = yamale.make_schema(schema_path)
     except Exception as e:
         logging.error(f"Failed to load schema from {schema_path}: {e}")
         sys.exit(1)
@@ -15,11 +15,76 @@ import pandas as pd
 import numpy as np
 import logging
 import sys
+from matplotlib.collections import LineCollection
 from matplotlib.patches import Patch
 from .data_loader import DataLoader
+from .profiling import span
+from .search_index import SensorIdIndex
+from .units import original_labels
 from . import utils
 
+DARK_BLUE = "#00008B"
 
+
+def comparison_colors(values, higher_better):
+    """Colours the bars of one attribute: best green, worst red, others blue.
+
+    Missing values, attributes without a known direction in two-sensor
+    comparisons, and attributes where all sensors are equal are gray.
+
+    Args:
+        values (Series): The attribute values of the compared sensors.
+        higher_better (bool or None): Output of `utils.is_higher_better`.
+
+    Returns:
+        list: One matplotlib colour per value.
+    """
+    max_value = values.max()
+    min_value = values.min()
+    if values.isnull().all() or len(values.dropna().unique()) == 1:
+        return ["gray"] * len(values)
+
+    colors = []
+    for value in values:
+        if pd.isna(value):
+            colors.append("gray")
+        elif len(values) == 2:
+            if higher_better is True:
+                colors.append("green" if value == max_value else "red")
+            elif higher_better is False:
+                colors.append("green" if value == min_value else "red")
+            else:
+                colors.append("gray")
+        elif higher_better is True and value == max_value:
+            colors.append("green")
+        elif higher_better is True and value == min_value:
+            colors.append("red")
+        elif higher_better is False and value == min_value:
+            colors.append("green")
+        elif higher_better is False and value == max_value:
+            colors.append("red")
+        else:
+            colors.append(DARK_BLUE)
+    return colors
+
+
+def comparison_legend(dark_blue_used):
+    """Returns the legend handles explaining the `comparison_colors`."""
+    legend_elements = [
+        Patch(facecolor="green", edgecolor="black", label="Higher Performance"),
+        Patch(facecolor="red", edgecolor="black", label="Lower Performance"),
+    ]
+    if dark_blue_used:
+        legend_elements.append(
+            Patch(facecolor=DARK_BLUE, edgecolor="black", label="Average Performance")
+        )
+    legend_elements.append(
+        Patch(facecolor="gray", edgecolor="black", label="Data Not Available")
+    )
+    return legend_elements
+
+
+@span("visualize_comparison")
 def visualize_comparison(
     sensor_ids,
     attributes,
@@ -31,6 +96,7 @@ def visualize_comparison(
     export_excel=False,
     export_csv_path=None,
     export_excel_path=None,
+    catalog=None,
 ):
     """Visualizes and compares sensor attributes.
 
@@ -45,53 +111,33 @@ def visualize_comparison(
         export_excel (bool, optional): Whether to export data to Excel.
         export_csv_path (str, optional): Path to save CSV file.
         export_excel_path (str, optional): Path to save Excel file.
+        catalog (SensorCatalog, optional): An already loaded catalog to take
+            the preprocessed sensor data from instead of reading the files.
 
     Returns:
         None
     """
-    data_loader = DataLoader()
-    df = data_loader.load_sensor_data()
-
-    # Preprocess data
-    df["ros_compatibility_score"] = df["ros_compatibility"].apply(
-        utils.extract_ros_compatibility
-    )
-    df["additional_ros_score"] = df.apply(utils.extract_additional_ros_factors, axis=1)
-    df["ros_total_score"] = df["ros_compatibility_score"] + df["additional_ros_score"]
-
-    df["resolution"] = df["resolution"].apply(
-        lambda x: x if isinstance(x, dict) else {}
-    )
-    if "resolution_rgb" in attributes:
-        df["resolution_rgb"] = df["resolution"].apply(
-            lambda x: utils.extract_resolution(x, "rgb")
-        )
-    if "resolution_depth" in attributes:
-        df["resolution_depth"] = df["resolution"].apply(
-            lambda x: utils.extract_resolution(x, "depth")
-        )
-
-    if "field_of_view" in attributes:
-        df["field_of_view"] = df["field_of_view"].apply(utils.extract_fov)
-
-    if "price_avg" in attributes:
-        df["price_avg"] = df["price_range"].apply(utils.extract_price_avg)
-
-    for attr in attributes:
-        if attr in [
-            "ros_compatibility_score",
-            "ros_total_score",
-            "additional_ros_score",
-            "resolution_rgb",
-            "resolution_depth",
-            "field_of_view",
-            "price_avg",
-        ]:
-            continue
-        if attr not in df.columns:
-            logging.error(f"Attribute {attr} not found in data.")
+    if catalog is not None and set(attributes) <= set(catalog.attributes):
+        df = catalog.data
+        id_index = catalog.id_index
+    else:
+        data_loader = DataLoader()
+        df = data_loader.load_sensor_data()
+
+        # Preprocess data
+        try:
+            with span("preprocess"):
+                df = utils.preprocess_attributes(df, attributes)
+        except KeyError as e:
+            logging.error(e.args[0])
             sys.exit(1)
-        df[attr] = df[attr].apply(utils.extract_numeric)
+        id_index = SensorIdIndex(df)
+
+    try:
+        sensor_ids = id_index.resolve_all(sensor_ids)
+    except KeyError as e:
+        logging.error(e.args[0])
+        sys.exit(1)
 
     selected_sensors = df[df["sensor_id"].isin(sensor_ids)]
     selected_sensors = selected_sensors.reset_index(drop=True)
@@ -111,6 +157,55 @@ def visualize_comparison(
         logging.error("Number of weights must match the number of attributes.")
         sys.exit(1)
 
+    plot_comparison_bars(selected_sensors, attributes, benchmarks, benchmark_labels)
+
+    with span("score"):
+        scores = utils.calculate_score(selected_sensors, attributes, weights)
+    print("\nSensor Scores (Higher is better overall):")
+    for sensor_id in selected_sensors["sensor_id"]:
+        score = scores.get(sensor_id, "N/A")
+        if score != "N/A":
+            print(f"{sensor_id}: {score:.2f}/10")
+        else:
+            print(f"{sensor_id}: Score not available (missing data)")
+
+    with span("tight_layout"):
+        plt.tight_layout()
+
+    if save_plot:
+        with span("savefig"):
+            plt.savefig(save_plot)
+        logging.info(f"Plot saved to '{save_plot}'")
+    else:
+        with span("show"):
+            plt.show()
+
+    if export_csv and export_csv_path:
+        selected_data = selected_sensors[["sensor_id"] + attributes]
+        selected_data.to_csv(export_csv_path, index=False)
+        logging.info(f"Comparison data exported to {export_csv_path}")
+
+    if export_excel and export_excel_path:
+        selected_data = selected_sensors[["sensor_id"] + attributes]
+        selected_data.to_excel(export_excel_path, index=False)
+        logging.info(f"Comparison data exported to {export_excel_path}")
+
+
+@span("plot_bars")
+def plot_comparison_bars(
+    selected_sensors, attributes, benchmarks=None, benchmark_labels=None
+):
+    """Draws one bar chart per attribute for the selected sensors.
+
+    Args:
+        selected_sensors (DataFrame): The sensors to compare, one row each.
+        attributes (list): Attributes to plot.
+        benchmarks (list, optional): Benchmark values for each attribute.
+        benchmark_labels (list, optional): Labels for benchmark values.
+
+    Returns:
+        Figure: The figure holding the charts.
+    """
     num_attributes = len(attributes)
     cols = 2
     rows = (num_attributes + cols - 1) // cols
@@ -128,52 +223,12 @@ def visualize_comparison(
         values = selected_sensors[attribute]
 
         max_value = values.max()
-        min_value = values.min()
         y_max = max_value * 1.2 if pd.notna(max_value) else 1
         ax.set_ylim(0, y_max)
 
-        colors = []
-
-        if values.isnull().all():
-            colors = ["gray"] * len(values)
-        elif len(values.dropna().unique()) == 1:
-            colors = ["gray"] * len(values)
-        elif len(values) == 2:
-            for value in values:
-                if pd.isna(value):
-                    colors.append("gray")
-                else:
-                    if higher_better is True:
-                        colors.append("green" if value == max_value else "red")
-                    elif higher_better is False:
-                        colors.append("green" if value == min_value else "red")
-                    else:
-                        colors.append("gray")
-            dark_blue_used = False
-        else:
-            for value in values:
-                if pd.isna(value):
-                    colors.append("gray")
-                else:
-                    if higher_better is True:
-                        if value == max_value:
-                            colors.append("green")
-                        elif value == min_value:
-                            colors.append("red")
-                        else:
-                            colors.append("#00008B")
-                            dark_blue_used = True
-                    elif higher_better is False:
-                        if value == min_value:
-                            colors.append("green")
-                        elif value == max_value:
-                            colors.append("red")
-                        else:
-                            colors.append("#00008B")
-                            dark_blue_used = True
-                    else:
-                        colors.append("#00008B")
-                        dark_blue_used = True
+        colors = comparison_colors(values, higher_better)
+        if DARK_BLUE in colors:
+            dark_blue_used = True
 
         bar_width = 0.4
         x_positions = np.arange(len(selected_sensors))
@@ -186,12 +241,13 @@ def visualize_comparison(
             width=bar_width,
         )
 
-        for bar, value in zip(bars, values):
+        notes = original_labels(selected_sensors, attribute)
+        for bar, value, note in zip(bars, values, notes):
             if pd.notna(value):
                 ax.text(
                     bar.get_x() + bar.get_width() / 2,
                     value + (y_max * 0.02),
-                    f"{value:.2f}",
+                    f"{value:.2f}\n({note})" if note else f"{value:.2f}",
                     ha="center",
                     va="bottom",
                     fontsize=10,
@@ -241,45 +297,216 @@ def visualize_comparison(
     for j in range(num_attributes, len(axes)):
         fig.delaxes(axes[j])
 
-    legend_elements = [
-        Patch(facecolor="green", edgecolor="black", label="Higher Performance"),
-        Patch(facecolor="red", edgecolor="black", label="Lower Performance"),
-    ]
+    axes[0].legend(handles=comparison_legend(dark_blue_used), loc="upper right")
 
-    if dark_blue_used:
-        legend_elements.append(
-            Patch(facecolor="#00008B", edgecolor="black", label="Average Performance")
-        )
+    return fig
 
-    legend_elements.append(
-        Patch(facecolor="gray", edgecolor="black", label="Data Not Available")
+
+# Above this many sensors the per-sensor tick labels are dropped so that the
+# number of artists stays constant regardless of catalog size.
+MAX_SENSOR_LABELS = 40
+
+LARGE_VIEWS = ["heatmap", "parallel", "strip"]
+
+
+def plot_heatmap(ax, sensor_names, attributes, normalized):
+    """Draws a (sensors x attributes) normalized matrix as a single image.
+
+    Args:
+        ax (Axes): The axes to draw on.
+        sensor_names (list): Row labels, in the order of `normalized`.
+        attributes (list): Column labels.
+        normalized (ndarray): Output of `utils.normalize_attributes`.
+
+    Returns:
+        AxesImage: The image artist.
+    """
+    cmap = plt.get_cmap("RdYlGn").copy()
+    cmap.set_bad("gray")
+    image = ax.imshow(
+        np.ma.masked_invalid(normalized),
+        aspect="auto",
+        cmap=cmap,
+        vmin=0.0,
+        vmax=1.0,
+        interpolation="nearest",
     )
+    ax.set_xticks(np.arange(len(attributes)))
+    ax.set_xticklabels(
+        [utils.format_label(attr) for attr in attributes], rotation=45, ha="right"
+    )
+    if len(sensor_names) <= MAX_SENSOR_LABELS:
+        ax.set_yticks(np.arange(len(sensor_names)))
+        ax.set_yticklabels(sensor_names)
+    else:
+        ax.set_yticks([])
+        ax.set_ylabel(f"{len(sensor_names)} sensors (ranked by score)")
+    ax.set_title("Normalized Attribute Heatmap (1 = best)", fontsize=14)
+    return image
 
-    axes[0].legend(handles=legend_elements, loc="upper right")
 
-    scores = utils.calculate_score(selected_sensors, attributes, weights)
-    print("\nSensor Scores (Higher is better overall):")
-    for sensor_id in selected_sensors["sensor_id"]:
-        score = scores.get(sensor_id, "N/A")
-        if score != "N/A":
-            print(f"{sensor_id}: {score:.2f}/10")
+def plot_parallel_coordinates(ax, attributes, normalized, scores):
+    """Draws one polyline per sensor as a single LineCollection.
+
+    Args:
+        ax (Axes): The axes to draw on.
+        attributes (list): Axis labels.
+        normalized (ndarray): Output of `utils.normalize_attributes`.
+        scores (ndarray): Per-sensor scores used to colour the lines.
+
+    Returns:
+        LineCollection: The line collection artist.
+    """
+    num_sensors, num_attributes = normalized.shape
+    x_positions = np.broadcast_to(
+        np.arange(num_attributes, dtype=float), normalized.shape
+    )
+    segments = np.stack([x_positions, normalized], axis=-1)
+    # Fade lines as the sensor count grows so dense regions stay readable
+    alpha = max(0.05, min(0.8, 40 / max(num_sensors, 1)))
+    lines = LineCollection(segments, cmap="viridis", linewidths=1.0, alpha=alpha)
+    lines.set_array(np.asarray(scores, dtype=float))
+    lines.set_clim(0, 10)
+    ax.add_collection(lines)
+    ax.set_xlim(-0.2, num_attributes - 0.8)
+    ax.set_ylim(-0.05, 1.05)
+    ax.set_xticks(np.arange(num_attributes))
+    ax.set_xticklabels(
+        [utils.format_label(attr) for attr in attributes], rotation=45, ha="right"
+    )
+    ax.set_ylabel("Normalized Value (1 = best)", fontsize=12)
+    ax.grid(axis="x", linestyle="--", alpha=0.7)
+    ax.set_title(f"Parallel Coordinates ({num_sensors} sensors)", fontsize=14)
+    return lines
+
+
+def plot_ranked_strip(ax, sensor_names, scores, top_n=10):
+    """Draws sensor scores sorted in descending order as a single filled curve.
+
+    Only the `top_n` best sensors are labelled.
+
+    Args:
+        ax (Axes): The axes to draw on.
+        sensor_names (list): Sensor labels, in the order of `scores`.
+        scores (ndarray): Per-sensor scores.
+        top_n (int, optional): Number of leading sensors to label.
+
+    Returns:
+        PolyCollection: The filled area artist.
+    """
+    order = np.argsort(-np.asarray(scores, dtype=float), kind="stable")
+    ranked_scores = np.asarray(scores, dtype=float)[order]
+    ranks = np.arange(1, len(ranked_scores) + 1)
+    area = ax.fill_between(ranks, ranked_scores, step="mid", color="#1f6aa5", alpha=0.7)
+    ax.set_xlim(0.5, len(ranks) + 0.5)
+    ax.set_ylim(0, 10.5)
+    ax.set_xlabel("Rank", fontsize=12)
+    ax.set_ylabel("Score (0-10)", fontsize=12)
+    ax.grid(axis="y", linestyle="--", alpha=0.7)
+    ax.set_title("Ranked Sensor Scores", fontsize=14)
+    top_labels = "\n".join(
+        f"{rank}. {sensor_names[i]} ({ranked_scores[rank - 1]:.2f})"
+        for rank, i in enumerate(order[:top_n], start=1)
+    )
+    ax.text(
+        0.98,
+        0.97,
+        top_labels,
+        transform=ax.transAxes,
+        ha="right",
+        va="top",
+        fontsize=9,
+        family="monospace",
+    )
+    return area
+
+
+@span("visualize_large_comparison")
+def visualize_large_comparison(
+    attributes,
+    sensor_ids=None,
+    view="heatmap",
+    weights=None,
+    save_plot=None,
+):
+    """Compares many sensors at once using a constant number of plot artists.
+
+    Args:
+        attributes (list): Attributes to compare.
+        sensor_ids (list, optional): Sensor IDs to compare. Defaults to the
+            whole catalog.
+        view (str, optional): One of 'heatmap', 'parallel' or 'strip'.
+        weights (list, optional): Weights for each attribute.
+        save_plot (str, optional): Path to save the plot.
+
+    Returns:
+        None
+    """
+    if view not in LARGE_VIEWS:
+        logging.error(f"Unknown view '{view}'. Choose from {', '.join(LARGE_VIEWS)}.")
+        sys.exit(1)
+
+    data_loader = DataLoader()
+    df = data_loader.load_sensor_data()
+
+    try:
+        with span("preprocess"):
+            df = utils.preprocess_attributes(df, attributes)
+    except KeyError as e:
+        logging.error(e.args[0])
+        sys.exit(1)
+
+    if sensor_ids:
+        try:
+            sensor_ids = SensorIdIndex(df).resolve_all(sensor_ids)
+        except KeyError as e:
+            logging.error(e.args[0])
+            sys.exit(1)
+        df = df[df["sensor_id"].isin(sensor_ids)]
+    selected_sensors = df.reset_index(drop=True)
+
+    if selected_sensors.empty:
+        logging.error("No matching sensors found in the database.")
+        return
+
+    if weights is None:
+        weights = [1.0] * len(attributes)
+
+    if len(weights) != len(attributes):
+        logging.error("Number of weights must match the number of attributes.")
+        sys.exit(1)
+
+    with span("score"):
+        normalized = utils.normalize_attributes(selected_sensors, attributes)
+        scores = utils.calculate_scores_vectorized(normalized, weights)
+
+    # Rank rows so the best sensors are at the top of the heatmap
+    order = np.argsort(-scores, kind="stable")
+    normalized = normalized[order]
+    scores = scores[order]
+    sensor_names = selected_sensors["sensor_id"].to_numpy()[order].tolist()
+
+    with span(f"plot_{view}"):
+        height = 8 if view != "heatmap" else min(20, 4 + 0.25 * len(sensor_names))
+        fig, ax = plt.subplots(figsize=(14, height))
+        fig.canvas.manager.set_window_title("Sensor Comparison Results")
+
+        if view == "heatmap":
+            image = plot_heatmap(ax, sensor_names, attributes, normalized)
+            fig.colorbar(image, ax=ax, label="Normalized Value")
+        elif view == "parallel":
+            lines = plot_parallel_coordinates(ax, attributes, normalized, scores)
+            fig.colorbar(lines, ax=ax, label="Score (0-10)")
         else:
-            print(f"{sensor_id}: Score not available (missing data)")
+            plot_ranked_strip(ax, sensor_names, scores)
 
-    plt.tight_layout()
+    with span("tight_layout"):
+        plt.tight_layout()
 
     if save_plot:
-        plt.savefig(save_plot)
+        with span("savefig"):
+            plt.savefig(save_plot)
         logging.info(f"Plot saved to '{save_plot}'")
     else:
-        plt.show()
-
-    if export_csv and export_csv_path:
-        selected_data = selected_sensors[["sensor_id"] + attributes]
-        selected_data.to_csv(export_csv_path, index=False)
-        logging.info(f"Comparison data exported to {export_csv_path}")
-
-    if export_excel and export_excel_path:
-        selected_data = selected_sensors[["sensor_id"] + attributes]
-        selected_data.to_excel(export_excel_path, index=False)
-        logging.info(f"Comparison data exported to {export_excel_path}")
+        with span("show"):
+            plt.show()
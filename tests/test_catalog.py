@@ -0,0 +1,74 @@
+# tests/test_catalog.py
+
+import os
+import shutil
+import sys
+import threading
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+
+from sensor_tool import catalog as catalog_module  # noqa: E402
+from sensor_tool.catalog import SensorCatalog  # noqa: E402
+from sensor_tool.similarity import feature_matrix  # noqa: E402
+
+
+def query_answers(catalog, sensor_ids):
+    # Distances rather than IDs, since ties may be broken by row order
+    return {
+        sensor_id: (
+            tuple(catalog.search(sensor_id)['sensor_id']),
+            tuple(catalog.select([sensor_id])['sensor_id']),
+            tuple(catalog.similar(sensor_id, k=3)['distance'].round(9)),
+        )
+        for sensor_id in sensor_ids
+    }
+
+
+def test_queries_see_one_version_during_refresh(tmp_path, monkeypatch):
+    sensors_directory = tmp_path / 'sensors'
+    shutil.copytree(os.path.join(REPO_ROOT, 'sensors'), sensors_directory)
+    catalog = SensorCatalog(str(sensors_directory))
+    sensor_ids = catalog.sensor_ids
+    expected = query_answers(catalog, sensor_ids)
+
+    # A renamed file is loaded last, so renaming the first one shifts the
+    # rows of every other sensor while the answers stay the same
+    def rotate_files():
+        path = next(iter(catalog._records))
+        os.rename(path, f'{path[:-len(".yaml")]}_.yaml')
+
+    # A slow index build leaves time for refreshes in the middle of a query
+    def slow_feature_matrix(*args):
+        time.sleep(0.05)
+        return feature_matrix(*args)
+
+    monkeypatch.setattr(catalog_module, 'feature_matrix', slow_feature_matrix)
+    stop = threading.Event()
+    errors = []
+
+    def refresher():
+        while not stop.is_set():
+            rotate_files()
+            catalog.refresh()
+
+    def querier():
+        try:
+            while not stop.is_set():
+                assert query_answers(catalog, sensor_ids) == expected
+        except Exception as e:
+            errors.append(e)
+            stop.set()
+
+    threads = [threading.Thread(target=refresher)]
+    threads += [threading.Thread(target=querier) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(2.0)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert catalog.version > 2
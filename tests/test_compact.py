@@ -0,0 +1,79 @@
+# tests/test_compact.py
+
+import os
+import sys
+
+import numpy as np
+import pytest
+import yaml
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+
+from sensor_tool.catalog import SensorCatalog  # noqa: E402
+from sensor_tool.compact import CompactCatalog  # noqa: E402
+
+SENSOR_PATH = os.path.join(
+    REPO_ROOT, 'sensors', 'cameras', 'intel', 'realsense_d435i.yaml'
+)
+
+# Filter options and the column each one compares against
+THRESHOLDS = [
+    ('min_resolution', 'max_resolution', 'resolution_rgb'),
+    ('min_frame_rate', 'max_frame_rate', 'frame_rate'),
+    ('min_price', 'max_price', 'price_avg'),
+    ('min_fov', 'max_fov', 'field_of_view'),
+    ('min_pixels_per_degree', None, 'pixels_per_degree'),
+    (None, 'max_mm_per_pixel', 'mm_per_pixel_at_max_range'),
+]
+
+
+@pytest.fixture(scope='module')
+def sensors_directory(tmp_path_factory):
+    """Sensors whose values are not exactly representable as float32."""
+    with open(SENSOR_PATH) as f:
+        sensor = yaml.safe_load(f)
+    directory = tmp_path_factory.mktemp('sensors')
+    rng = np.random.default_rng(0)
+    for i in range(40):
+        price = round(float(rng.uniform(100, 3000)), 2)
+        width = int(rng.integers(320, 4000))
+        variant = {
+            **sensor,
+            'sensor_id': f'sensor_{i}',
+            'frame_rate': round(float(rng.uniform(5, 120)), 2),
+            'price_range': f'${price} - ${price}',
+            'resolution': {'rgb': {'width': width, 'height': 3 * width // 4}},
+            'field_of_view': {
+                'horizontal': round(float(rng.uniform(30, 120)), 1),
+                'vertical': round(float(rng.uniform(20, 90)), 1),
+                'diagonal': round(float(rng.uniform(40, 130)), 1),
+            },
+            'max_range': round(float(rng.uniform(1, 20)), 3),
+        }
+        with open(directory / f'sensor_{i}.yaml', 'w') as f:
+            yaml.safe_dump(variant, f)
+    return str(directory)
+
+
+def test_compact_filters_match_at_boundaries(sensors_directory):
+    standard = SensorCatalog(sensors_directory)
+    compact = CompactCatalog(sensors_directory, chunk_size=7).load()
+    assert len(compact) == len(standard.data) == 40
+    for low, high, column in THRESHOLDS:
+        values = standard.data[column].dropna().unique()
+        # Every value and its float64 neighbours, too close to tell apart
+        # in float32, as both lower and upper bounds
+        thresholds = np.concatenate([
+            values,
+            np.nextafter(values, np.inf),
+            np.nextafter(values, -np.inf),
+        ])
+        for threshold in thresholds:
+            for option in (low, high):
+                if option is None:
+                    continue
+                criteria = {option: float(threshold)}
+                expected = sorted(standard.filter(**criteria)['sensor_id'])
+                found = sorted(compact.filter(**criteria)['sensor_id'])
+                assert found == expected, criteria
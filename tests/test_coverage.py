@@ -0,0 +1,160 @@
+# tests/test_coverage.py
+
+import math
+import os
+import sys
+from collections import deque
+
+import numpy as np
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+
+from sensor_tool import coverage  # noqa: E402
+from sensor_tool.coverage import (  # noqa: E402
+    blind_spots,
+    grid_axes,
+    label_regions,
+    rotation_matrix,
+    visibility_counts,
+    visible,
+)
+
+
+def brute_force_visible(center, position, rotation, hfov, vfov, min_range, max_range):
+    forward, left, up = rotation.T @ (np.asarray(center) - position)
+    distance = math.sqrt(forward**2 + left**2 + up**2)
+    if distance > max_range or (min_range > 0 and distance < min_range):
+        return False
+    azimuth = math.degrees(math.atan2(left, forward))
+    if hfov < 180 and vfov < 180:
+        elevation = math.degrees(math.atan2(up, forward))
+        return forward > 0 and abs(azimuth) <= hfov / 2 and abs(elevation) <= vfov / 2
+    elevation = math.degrees(math.atan2(up, math.hypot(forward, left)))
+    return (hfov >= 360 or abs(azimuth) <= hfov / 2) and (
+        vfov >= 180 or abs(elevation) <= vfov / 2
+    )
+
+
+def brute_force_regions(blind):
+    """Labels face-connected regions by flood fill, with their smallest index."""
+    labels = np.full(blind.shape, -1)
+    for start in zip(*np.nonzero(blind)):
+        if labels[start] >= 0:
+            continue
+        region, queue = [start], deque([start])
+        labels[start] = 0
+        while queue:
+            voxel = queue.popleft()
+            for axis in range(blind.ndim):
+                for step in (-1, 1):
+                    neighbour = list(voxel)
+                    neighbour[axis] += step
+                    neighbour = tuple(neighbour)
+                    if (
+                        0 <= neighbour[axis] < blind.shape[axis]
+                        and blind[neighbour]
+                        and labels[neighbour] < 0
+                    ):
+                        labels[neighbour] = 0
+                        region.append(neighbour)
+                        queue.append(neighbour)
+        smallest = min(np.ravel_multi_index(voxel, blind.shape) for voxel in region)
+        for voxel in region:
+            labels[voxel] = smallest
+    return labels
+
+
+def random_sensors(rng, count):
+    sensors = []
+    for _ in range(count):
+        # Some sensors are wide, like spinning lidars
+        wide = rng.random() < 0.3
+        horizontal_fov = rng.choice([270.0, 360.0]) if wide else rng.uniform(30, 120)
+        sensors.append({
+            'position': rng.uniform(-1, 3, 3),
+            'rotation': rotation_matrix(*rng.uniform(-180, 180, 3)),
+            'horizontal_fov': horizontal_fov,
+            'vertical_fov': rng.uniform(20, 90),
+            'min_range': rng.choice([0.0, rng.uniform(0.1, 0.5)]),
+            'max_range': rng.uniform(1, 4),
+        })
+    return sensors
+
+
+def test_rotation_matrix_composes_roll_pitch_yaw():
+    roll, pitch, yaw = np.radians([10.0, 20.0, 30.0])
+    rx = np.array([
+        [1, 0, 0],
+        [0, np.cos(roll), -np.sin(roll)],
+        [0, np.sin(roll), np.cos(roll)],
+    ])
+    ry = np.array([
+        [np.cos(pitch), 0, np.sin(pitch)],
+        [0, 1, 0],
+        [-np.sin(pitch), 0, np.cos(pitch)],
+    ])
+    rz = np.array([
+        [np.cos(yaw), -np.sin(yaw), 0],
+        [np.sin(yaw), np.cos(yaw), 0],
+        [0, 0, 1],
+    ])
+    np.testing.assert_allclose(rotation_matrix(10, 20, 30), rz @ ry @ rx)
+    # A positive pitch tilts the sensor down
+    forward = rotation_matrix(pitch=90) @ [1, 0, 0]
+    np.testing.assert_allclose(forward, [0, 0, -1], atol=1e-12)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_visible_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    axes = grid_axes([-1, -1, -1], [3, 3, 2], 0.25)
+    centers = np.stack(np.meshgrid(*axes, indexing='ij'), axis=-1)
+    for sensor in random_sensors(rng, 8):
+        specs = [sensor[key] for key in coverage.SPEC_KEYS]
+        mask = visible(axes, sensor['position'], sensor['rotation'], *specs)
+        expected = np.array([
+            brute_force_visible(center, sensor['position'], sensor['rotation'], *specs)
+            for center in centers.reshape(-1, 3)
+        ]).reshape(mask.shape)
+        np.testing.assert_array_equal(mask, expected)
+
+
+def test_visibility_counts_match_per_sensor_masks(monkeypatch):
+    # Chunks of a few x slices, so counts are accumulated across chunks
+    monkeypatch.setattr(coverage, 'CHUNK_VOXELS', 300)
+    rng = np.random.default_rng(7)
+    axes = grid_axes([-1, -1, -1], [3, 3, 2], 0.2)
+    sensors = random_sensors(rng, 5)
+    counts, seen, alone = visibility_counts(axes, sensors)
+    masks = np.array([
+        visible(axes, s['position'], s['rotation'], *(s[k] for k in coverage.SPEC_KEYS))
+        for s in sensors
+    ])
+    np.testing.assert_array_equal(counts, masks.sum(axis=0))
+    np.testing.assert_array_equal(seen, masks.sum(axis=(1, 2, 3)))
+    single = masks.sum(axis=0) == 1
+    np.testing.assert_array_equal(alone, (masks & single).sum(axis=(1, 2, 3)))
+
+
+@pytest.mark.parametrize('seed', range(6))
+@pytest.mark.parametrize('shape', [(12, 9, 7), (1, 20, 15), (30, 1, 1)])
+def test_label_regions_matches_flood_fill(seed, shape):
+    rng = np.random.default_rng(seed)
+    # Densities around the percolation threshold give long, winding regions
+    blind = rng.random(shape) < rng.uniform(0.3, 0.7)
+    np.testing.assert_array_equal(label_regions(blind), brute_force_regions(blind))
+
+
+def test_blind_spots_describe_the_largest_regions():
+    counts = np.ones((6, 5, 4), dtype=np.uint16)
+    counts[0:2, 0:2, 0:2] = 0
+    counts[4:6, 1:5, 3] = 0
+    counts[3, 4, 0] = 0
+    axes = grid_axes([0, 0, 0], [3, 2.5, 2], 0.5)
+    spots = blind_spots(counts, axes, 0.5, top=2)
+    assert spots['voxels'].tolist() == [8, 8]
+    assert spots['min'].tolist() == [[0.0, 0.0, 0.0], [2.0, 0.5, 1.5]]
+    assert spots['max'].tolist() == [[1.0, 1.0, 1.0], [3.0, 2.5, 2.0]]
+    assert spots['volume_m3'].tolist() == pytest.approx([1.0, 1.0])
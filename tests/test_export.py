@@ -0,0 +1,113 @@
+# tests/test_export.py
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+
+from sensor_tool.data_loader import DataLoader  # noqa: E402
+from sensor_tool.export_sensors import (  # noqa: E402
+    export_sensors,
+    get_export_columns,
+    normalize_chunk,
+)
+from sensor_tool.filter_sensors import apply_filters  # noqa: E402
+
+FORMATS = ['csv', 'jsonl', 'parquet']
+COLUMNS = ['sensor_id', 'manufacturer', 'frame_rate', 'price_avg', 'resolution_rgb']
+
+
+def read_export(path, export_format):
+    # Text such as '1.0' or 'None' must not be read back as a number or NaN
+    if export_format == 'csv':
+        text = [
+            column for column, column_type in get_export_columns().items()
+            if column_type != 'float'
+        ]
+        return pd.read_csv(
+            path,
+            dtype=dict.fromkeys(text, str),
+            keep_default_na=False,
+            na_values=[''],
+        )
+    if export_format == 'jsonl':
+        if not os.path.getsize(path):
+            return None
+        return pd.read_json(path, lines=True, dtype=False, convert_dates=False)
+    return pd.read_parquet(path)
+
+
+@pytest.fixture
+def catalog(monkeypatch):
+    """The whole catalog normalized in one chunk, as exports should write it."""
+    monkeypatch.chdir(REPO_ROOT)
+    column_types = get_export_columns()
+    return normalize_chunk(DataLoader().load_sensor_data(), column_types)
+
+
+def check_rows(exported, expected, columns):
+    exported = exported.sort_values('sensor_id').reset_index(drop=True)
+    expected = expected.sort_values('sensor_id').reset_index(drop=True)
+    assert list(exported.columns) == columns
+    assert exported['sensor_id'].tolist() == expected['sensor_id'].tolist()
+    column_types = get_export_columns()
+    for column in columns:
+        if column_types[column] == 'float':
+            np.testing.assert_allclose(
+                exported[column].astype(float), expected[column].astype(float)
+            )
+        elif column_types[column] == 'string':
+            assert exported[column].fillna('').tolist() == (
+                expected[column].fillna('').tolist()
+            )
+
+
+@pytest.mark.parametrize('export_format', FORMATS)
+def test_export_round_trip(export_format, catalog, tmp_path):
+    path = str(tmp_path / f'sensors.{export_format}')
+    # Smaller chunks than the catalog, so several chunks are appended
+    count = export_sensors(path, chunk_size=4)
+    assert count == len(catalog) > 4
+    exported = read_export(path, export_format)
+    assert len(exported) == count
+    check_rows(exported, catalog, list(get_export_columns()))
+
+
+@pytest.mark.parametrize('export_format', FORMATS)
+def test_export_filtered_columns(export_format, catalog, tmp_path):
+    path = str(tmp_path / f'sensors.{export_format}')
+    count = export_sensors(
+        path, columns=COLUMNS, chunk_size=3, manufacturer='Intel'
+    )
+    expected = apply_filters(catalog, manufacturer='Intel')
+    assert count == len(expected) > 0
+    check_rows(read_export(path, export_format), expected, COLUMNS)
+
+
+@pytest.mark.parametrize('export_format', FORMATS)
+def test_export_without_matches(export_format, catalog, tmp_path):
+    path = tmp_path / f'sensors.{export_format}'
+    # Old contents are replaced even when nothing is written
+    path.write_text('stale\n')
+    count = export_sensors(
+        str(path), columns=COLUMNS, chunk_size=4, manufacturer='No Such Maker'
+    )
+    assert count == 0
+    exported = read_export(str(path), export_format)
+    if export_format == 'jsonl':
+        assert exported is None
+    else:
+        assert exported.empty
+        assert list(exported.columns) == COLUMNS
+
+
+def test_export_rejects_unknown_formats_and_columns(tmp_path):
+    with pytest.raises(ValueError):
+        export_sensors(str(tmp_path / 'sensors.xlsx'))
+    with pytest.raises(ValueError):
+        export_sensors(str(tmp_path / 'sensors.csv'), columns=['no_such_column'])
@@ -0,0 +1,92 @@
+# tests/test_optimizer.py
+
+import itertools
+import os
+import sys
+
+import numpy as np
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+
+from sensor_tool.optimizer import Problem, beam_search, optimize  # noqa: E402
+
+
+def brute_force(values, costs, budgets, top):
+    rigs = []
+    for size in range(1, len(values) + 1):
+        for rig in itertools.combinations(range(len(values)), size):
+            rig = list(rig)
+            if (costs[rig].sum(axis=0) <= budgets).all():
+                rigs.append((values[rig].sum(), rig))
+    rigs.sort(key=lambda rig: -rig[0])
+    return rigs[:top]
+
+
+def random_problem(rng, items, dims):
+    values = rng.uniform(0.5, 10, items)
+    costs = rng.uniform(1, 100, (items, dims))
+    # Budgets that fit about a third of the items
+    budgets = costs.sum(axis=0) * rng.uniform(0.2, 0.45, dims)
+    return values, costs, budgets
+
+
+@pytest.mark.parametrize('seed', range(6))
+@pytest.mark.parametrize('workers', [1, 3])
+def test_optimize_matches_brute_force(seed, workers):
+    rng = np.random.default_rng(seed)
+    values, costs, budgets = random_problem(rng, 14, 1 + seed % 3)
+    top = 5
+    rigs, stats = optimize(values, costs, budgets, top=top, workers=workers)
+    expected = brute_force(values, costs, budgets, top)
+    np.testing.assert_allclose([value for value, _ in rigs], [v for v, _ in expected])
+    for value, items in rigs:
+        assert (costs[items].sum(axis=0) <= budgets).all()
+        assert value == pytest.approx(values[items].sum())
+    assert stats['gap'] == pytest.approx(0.0)
+    assert stats['upper_bound'] == pytest.approx(expected[0][0])
+
+
+def test_optimize_reports_gap_when_the_node_budget_runs_out():
+    rng = np.random.default_rng(0)
+    values, costs, budgets = random_problem(rng, 40, 2)
+    rigs, stats = optimize(values, costs, budgets, top=3, max_nodes=5)
+    best = rigs[0][0]
+    assert stats['upper_bound'] >= best - 1e-9
+    assert stats['gap'] == pytest.approx(stats['upper_bound'] - best)
+    for _, items in rigs:
+        assert (costs[items].sum(axis=0) <= budgets).all()
+
+
+@pytest.mark.parametrize('seed', range(6))
+def test_upper_bound_is_admissible(seed):
+    rng = np.random.default_rng(seed)
+    values, costs, budgets = random_problem(rng, 12, 2)
+    problem = Problem(values, costs, budgets)
+    # The bound from the root covers every feasible rig
+    best = brute_force(problem.values, problem.costs, budgets, 1)[0][0]
+    assert problem.upper_bound(0, 0.0, budgets) >= best - 1e-9
+    # And from any prefix decision, every completion of it
+    for start in range(1, len(problem)):
+        for chosen in itertools.combinations(range(start), 2):
+            chosen = list(chosen)
+            remaining = budgets - problem.costs[chosen].sum(axis=0)
+            if (remaining < 0).any():
+                continue
+            value = problem.values[chosen].sum()
+            rest = brute_force(
+                problem.values[start:], problem.costs[start:], remaining, 1
+            )
+            completion = value + (rest[0][0] if rest else 0.0)
+            assert problem.upper_bound(start, value, remaining) >= completion - 1e-9
+
+
+def test_beam_search_finds_feasible_rigs():
+    rng = np.random.default_rng(3)
+    values, costs, budgets = random_problem(rng, 20, 3)
+    problem = Problem(values, costs, budgets)
+    for value, items in beam_search(problem, 5):
+        items = list(items)
+        assert (problem.costs[items].sum(axis=0) <= budgets).all()
+        assert value == pytest.approx(problem.values[items].sum())
@@ -0,0 +1,88 @@
+# tests/test_rank.py
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+
+from sensor_tool.catalog import SensorCatalog  # noqa: E402
+from sensor_tool.utils import (  # noqa: E402
+    calculate_score,
+    calculate_scores_vectorized,
+    normalize_attributes,
+    score_contributions,
+    top_k_indices,
+)
+
+ATTRIBUTES = ['frame_rate', 'latency', 'price_avg', 'resolution_rgb']
+
+
+def brute_force_top_k(scores, k):
+    """A full stable sort, best first, with NaN scores last."""
+    order = sorted(
+        range(len(scores)),
+        key=lambda i: (np.isnan(scores[i]), -np.nan_to_num(scores[i]), i),
+    )
+    return order[:k]
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_top_k_indices_matches_a_full_sort(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 60))
+    # Few distinct values give many ties, also at the k-th place
+    scores = rng.integers(0, 5, n).astype(float)
+    scores[rng.random(n) < 0.2] = np.nan
+    for k in [0, 1, 2, n // 2, n - 1, n, n + 3]:
+        assert top_k_indices(scores, k).tolist() == brute_force_top_k(scores, k)
+
+
+def random_sensors(rng, count):
+    df = pd.DataFrame({
+        'sensor_id': [f'sensor_{i}' for i in range(count)],
+        'frame_rate': rng.choice([15.0, 30.0, 60.0, 90.0], count),
+        'latency': rng.uniform(5, 100, count),
+        'price_avg': rng.choice([199.0, 249.0, 799.0], count),
+        # Every sensor has the same resolution, so it scores 0.5
+        'resolution_rgb': np.full(count, 2073600.0),
+    })
+    return df.mask(rng.random(df.shape) < 0.25).assign(sensor_id=df['sensor_id'])
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_scores_and_contributions_match_calculate_score(seed):
+    rng = np.random.default_rng(seed)
+    df = random_sensors(rng, 30)
+    weights = rng.uniform(0.5, 3, len(ATTRIBUTES))
+    normalized = normalize_attributes(df, ATTRIBUTES)
+    scores = calculate_scores_vectorized(normalized, weights)
+    expected = calculate_score(df, ATTRIBUTES, weights)
+    np.testing.assert_allclose(scores, [expected[s] for s in df['sensor_id']])
+
+    contributions = score_contributions(normalized, weights)
+    np.testing.assert_allclose(contributions.sum(axis=1), scores)
+    # Missing values contribute nothing
+    assert (contributions[np.isnan(normalized)] == 0).all()
+
+
+def test_catalog_rank_breakdown():
+    catalog = SensorCatalog(os.path.join(REPO_ROOT, 'sensors'))
+    weights = [2.0, 1.0, 1.0, 0.5]
+    ranked = catalog.rank(ATTRIBUTES, weights, top=8, breakdown=True)
+    candidates = catalog.filter()
+    expected = calculate_score(candidates, ATTRIBUTES, weights)
+    order = sorted(
+        range(len(candidates)),
+        key=lambda i: (-expected[candidates['sensor_id'].iloc[i]], i),
+    )[:8]
+    assert ranked['sensor_id'].tolist() == candidates['sensor_id'].iloc[order].tolist()
+    np.testing.assert_allclose(
+        ranked['score'], [expected[s] for s in ranked['sensor_id']]
+    )
+    columns = [f'{attr}_contribution' for attr in ATTRIBUTES]
+    np.testing.assert_allclose(ranked[columns].sum(axis=1), ranked['score'])
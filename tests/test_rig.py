@@ -0,0 +1,135 @@
+# tests/test_rig.py
+
+import itertools
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+
+from sensor_tool import rig as rig_module  # noqa: E402
+from sensor_tool.catalog import SensorCatalog  # noqa: E402
+from sensor_tool.rig import (  # noqa: E402
+    BUS_CAPACITY_MBPS,
+    bus_capacities,
+    combination_chunks,
+    count_combinations,
+    evaluate_rigs,
+    stream_rates,
+)
+
+BUSES = ['USB 2.0', 'USB 3.0', 'Gigabit Ethernet', None]
+
+
+def brute_force(rates, k, ports, max_utilization, repeat, prices):
+    capacities = bus_capacities(ports)
+    usable = [
+        i for i, (bus, load) in enumerate(zip(rates['bus'], rates['data_rate_mbps']))
+        if bus is not None and np.isfinite(load) and load <= BUS_CAPACITY_MBPS[bus]
+    ]
+    enumerate_rigs = (
+        itertools.combinations_with_replacement if repeat else itertools.combinations
+    )
+    rigs = []
+    for rig in enumerate_rigs(usable, k):
+        loads = {}
+        for i in rig:
+            bus = rates['bus'][i]
+            loads[bus] = loads.get(bus, 0.0) + rates['data_rate_mbps'][i]
+        peak = max(load / capacities[bus] for bus, load in loads.items())
+        if peak <= max_utilization:
+            cost = sum(prices[i] for i in rig)
+            rigs.append((np.inf if np.isnan(cost) else cost, peak))
+    total = len(list(enumerate_rigs(usable, k)))
+    return sorted(rigs), total
+
+
+@pytest.mark.parametrize('n, k', [(1, 1), (5, 2), (7, 3), (6, 6), (9, 4)])
+@pytest.mark.parametrize('repeat', [False, True])
+def test_combination_chunks_cover_every_rig_once(n, k, repeat):
+    chunks = list(combination_chunks(n, k, repeat, chunk_size=7))
+    rigs = [tuple(rig) for chunk in chunks for rig in chunk.tolist()]
+    enumerate_rigs = (
+        itertools.combinations_with_replacement if repeat else itertools.combinations
+    )
+    assert sorted(rigs) == list(enumerate_rigs(range(n), k))
+    assert len(rigs) == count_combinations(n, k, repeat)
+
+
+@pytest.mark.parametrize('seed', range(4))
+@pytest.mark.parametrize('repeat', [False, True])
+def test_evaluate_rigs_matches_brute_force(seed, repeat, monkeypatch):
+    # Small chunks make the best rigs carry over between chunks
+    monkeypatch.setattr(
+        rig_module,
+        'combination_chunks',
+        lambda n, k, repeat: combination_chunks(n, k, repeat, chunk_size=13),
+    )
+    rng = np.random.default_rng(seed)
+    n = 12
+    rates = pd.DataFrame({
+        'sensor_id': [f'sensor_{i}' for i in range(n)],
+        'bus': [BUSES[i] for i in rng.integers(0, len(BUSES), n)],
+        'data_rate_mbps': rng.uniform(10, 1500, n),
+    })
+    rates.loc[rng.random(n) < 0.1, 'data_rate_mbps'] = np.nan
+    prices = rng.integers(50, 500, n).astype(float)
+    prices[rng.random(n) < 0.2] = np.nan
+    ports = {'USB 3.0': 2}
+    max_utilization = 0.8
+    top = 10
+    for k in [1, 2, 3]:
+        best, feasible, total = evaluate_rigs(
+            rates, k, ports, max_utilization, repeat, prices, top
+        )
+        expected, expected_total = brute_force(
+            rates, k, ports, max_utilization, repeat, prices
+        )
+        assert total == expected_total
+        assert feasible == len(expected)
+        found = sorted(
+            zip(np.nan_to_num(best['price_avg'], nan=np.inf), best['utilization'])
+        )
+        np.testing.assert_allclose(found, expected[:top])
+        # Each row describes its own sensors
+        for row in best.itertuples():
+            rows = [int(sid.split('_')[1]) for sid in row.sensors]
+            rate = rates['data_rate_mbps'].to_numpy()[rows].sum()
+            assert row.data_rate_mbps == pytest.approx(rate)
+
+
+def test_stream_rates_read_resolution_strings():
+    df = pd.DataFrame({
+        'sensor_id': ['dict', 'string', 'none', 'no_frame_rate'],
+        'communication_interface': ['USB 3.0', 'GMSL2', 'USB 3.0', 'USB 3.0'],
+        'frame_rate': [30.0, 10.0, 30.0, np.nan],
+        'resolution': [
+            {'rgb': {'width': 100, 'height': 10}, 'depth': '20x5 (binned)'},
+            '1920x1200 (side-by-side)',
+            {},
+            {'rgb': {'width': 100, 'height': 10}},
+        ],
+    })
+    rates = stream_rates(df, compression={'rgb': 2})
+    rgb = [100 * 10 * 12 * 30 / 1e6, 1920 * 1200 * 12 * 10 / 1e6]
+    depth = 20 * 5 * 16 * 30 / 1e6
+    # Streams of unknown size are NaN rather than 0
+    np.testing.assert_allclose(rates['rgb_mbps'], rgb + [np.nan, np.nan])
+    np.testing.assert_allclose(rates['depth_mbps'], [depth] + [np.nan] * 3)
+    assert rates['ir_mbps'].isna().all()
+    np.testing.assert_allclose(
+        rates['data_rate_mbps'], [rgb[0] + depth, rgb[1], np.nan, np.nan]
+    )
+
+
+def test_catalog_rigs_include_sensors_with_resolution_strings():
+    catalog = SensorCatalog(os.path.join(REPO_ROOT, 'sensors'))
+    rates, _ = catalog.rig(['stereolabs_zed_x', 'stereolabs_zed_mini'])
+    assert (rates['data_rate_mbps'] > 0).all()
+    best, _, _ = catalog.rigs(1, top=100, compression={'rgb': 10})
+    sensors = [sensor for rig in best['sensors'] for sensor in rig]
+    assert {'stereolabs_zed_x', 'stereolabs_zed_mini'} <= set(sensors)
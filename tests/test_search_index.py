@@ -0,0 +1,88 @@
+# tests/test_search_index.py
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+
+from sensor_tool.catalog import SensorCatalog  # noqa: E402
+from sensor_tool.search_index import SensorIdIndex  # noqa: E402
+
+SENSORS = pd.DataFrame({
+    'sensor_id': [
+        'intel_realsense_d435i',
+        'stereolabs_zed_2',
+        'stereolabs_zed_2i',
+        'stereolabs_zed_mini',
+    ],
+    'manufacturer': ['Intel', 'Stereolabs', 'Stereolabs', 'Stereolabs'],
+    'model': ['RealSense D435i', 'ZED 2', 'ZED 2i', 'ZED Mini'],
+})
+
+
+@pytest.fixture
+def id_index():
+    return SensorIdIndex(SENSORS)
+
+
+@pytest.mark.parametrize('query, sensor_id', [
+    ('stereolabs_zed_2', 'stereolabs_zed_2'),
+    ('Stereolabs_ZED_2i', 'stereolabs_zed_2i'),
+    ('Intel-RealSense-D435i', 'intel_realsense_d435i'),
+    (' stereolabs zed mini ', 'stereolabs_zed_mini'),
+])
+def test_resolve_accepts_ids_up_to_case_and_separators(id_index, query, sensor_id):
+    assert id_index.resolve(query) == sensor_id
+
+
+@pytest.mark.parametrize('query, suggestion', [
+    ('stereolabs_zed_2j', 'stereolabs_zed_2'),  # typo
+    ('intel_realsense_d435', 'intel_realsense_d435i'),  # prefix of an ID
+    ('d435i', 'intel_realsense_d435i'),  # part matching a single sensor
+    ('intel', 'intel_realsense_d435i'),  # manufacturer of a single sensor
+    ('zed', 'stereolabs_zed_2'),  # ambiguous
+])
+def test_resolve_rejects_inexact_ids_with_suggestions(id_index, query, suggestion):
+    with pytest.raises(KeyError) as error:
+        id_index.resolve(query)
+    message = error.value.args[0]
+    assert message.startswith(f'{query} (did you mean ')
+    assert suggestion in message
+
+
+def test_resolve_all_names_every_unknown_id(id_index):
+    with pytest.raises(KeyError) as error:
+        id_index.resolve_all(['stereolabs_zed_2', 'zed', 'd435'])
+    message = error.value.args[0]
+    assert message.startswith('Unknown sensor IDs: zed (')
+    assert '; d435 (did you mean intel_realsense_d435i' in message
+
+
+def test_ids_differing_only_in_separators_stay_ambiguous():
+    df = pd.DataFrame({
+        'sensor_id': ['zed_2i', 'zed2i'],
+        'manufacturer': ['Stereolabs'] * 2,
+        'model': ['ZED 2i'] * 2,
+    })
+    id_index = SensorIdIndex(df)
+    assert id_index.resolve('zed2i') == 'zed2i'
+    with pytest.raises(KeyError):
+        id_index.resolve('ZED-2i')
+
+
+def test_suggest_puts_prefix_matches_first(id_index):
+    suggestions = id_index.suggest('stereolabs_zed_', 3)
+    assert suggestions == id_index.complete('stereolabs_zed_', 3)
+    assert id_index.suggest('stereolabs_zed_2j', 1) == ['stereolabs_zed_2']
+
+
+def test_catalog_select_does_not_substitute_partial_ids():
+    catalog = SensorCatalog(os.path.join(REPO_ROOT, 'sensors'))
+    selected = catalog.select(['Intel-RealSense-D435i'])
+    assert selected['sensor_id'].tolist() == ['intel_realsense_d435i']
+    with pytest.raises(KeyError, match='d435i'):
+        catalog.select(['d435i'])
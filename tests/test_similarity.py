@@ -0,0 +1,74 @@
+# tests/test_similarity.py
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+
+from sensor_tool.similarity import (  # noqa: E402
+    KDTree,
+    feature_matrix,
+    masked_distances,
+)
+
+
+def brute_force(points, query, k, weights, allowed):
+    distances = masked_distances(points, query, weights)
+    rows = np.flatnonzero(np.isfinite(distances) & allowed)
+    rows = rows[np.lexsort((rows, distances[rows]))][:k]
+    return rows, distances[rows]
+
+
+def random_points(rng, count, dims, missing, integer=False):
+    points = rng.integers(0, 4, (count, dims)) if integer else rng.random((count, dims))
+    points = points.astype(float)
+    points[rng.random((count, dims)) < missing] = np.nan
+    return points
+
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('integer', [False, True])
+def test_kdtree_matches_brute_force(seed, integer):
+    # Integer points give many exact ties, which must be broken by row
+    rng = np.random.default_rng(seed)
+    points = random_points(rng, 2000, 6, missing=0.2, integer=integer)
+    tree = KDTree(points, leaf_size=16)
+    for _ in range(20):
+        query = random_points(rng, 1, 6, missing=0.2, integer=integer)[0]
+        weights = rng.random(6) + 0.1
+        allowed = rng.random(len(points)) < 0.7
+        k = int(rng.integers(1, 12))
+        rows, distances = tree.query(query, k, weights, allowed)
+        expected_rows, expected_distances = brute_force(
+            points, query, k, weights, allowed
+        )
+        np.testing.assert_allclose(distances, expected_distances)
+        np.testing.assert_array_equal(rows, expected_rows)
+
+
+def test_kdtree_without_filters_or_shared_values():
+    points = np.array([[0.0, np.nan], [1.0, np.nan], [np.nan, 2.0]])
+    tree = KDTree(points, leaf_size=1)
+    rows, distances = tree.query([np.nan, 0.0], k=3)
+    np.testing.assert_array_equal(rows, [2])
+    np.testing.assert_allclose(distances, [2.0])
+    rows, _ = tree.query([0.2, np.nan], k=5)
+    np.testing.assert_array_equal(rows, [0, 1])
+
+
+def test_feature_matrix_scales_to_unit_range():
+    df = pd.DataFrame({
+        'frame_rate': [30.0, 60.0, np.nan, 90.0],
+        'price_avg': [10.0, 100.0, 1000.0, np.nan],
+        'latency': [5.0, 5.0, 5.0, 5.0],
+    })
+    points = feature_matrix(df, ['frame_rate', 'price_avg', 'latency'])
+    np.testing.assert_allclose(points[:, 0], [0.0, 0.5, np.nan, 1.0])
+    # Prices are log-scaled, and constant columns are left as they are
+    np.testing.assert_allclose(points[:, 1], [0.0, 0.5, 1.0, np.nan])
+    np.testing.assert_allclose(points[:, 2], [5.0] * 4)
@@ -0,0 +1,97 @@
+# tests/test_skyline.py
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+
+from sensor_tool import skyline as skyline_module  # noqa: E402
+from sensor_tool.skyline import pareto_front, skyline  # noqa: E402
+
+ATTRIBUTES = ['frame_rate', 'max_range', 'latency', 'price_avg', 'weight']
+
+
+def brute_force(costs):
+    """Marks rows that no other row is <= everywhere and < somewhere."""
+    mask = np.ones(len(costs), dtype=bool)
+    for i in range(len(costs)):
+        for j in range(len(costs)):
+            if (costs[j] <= costs[i]).all() and (costs[j] < costs[i]).any():
+                mask[i] = False
+                break
+    return mask
+
+
+def random_costs(rng, count, dims, levels=None):
+    # Few levels give many ties and duplicate rows
+    if levels:
+        return rng.integers(0, levels, (count, dims)).astype(float)
+    return rng.random((count, dims))
+
+
+@pytest.mark.parametrize('seed', range(4))
+@pytest.mark.parametrize('dims', [1, 2, 4, 7])
+@pytest.mark.parametrize('levels', [None, 3, 6])
+def test_skyline_matches_brute_force(seed, dims, levels, monkeypatch):
+    # Small blocks and chunks exercise the front carried between blocks
+    monkeypatch.setattr(skyline_module, 'BLOCK_SIZE', 16)
+    monkeypatch.setattr(skyline_module, 'FIRST_CHUNK', 2)
+    rng = np.random.default_rng(seed)
+    costs = random_costs(rng, 300, dims, levels)
+    np.testing.assert_array_equal(skyline(costs), brute_force(costs))
+
+
+def test_skyline_edge_cases():
+    assert skyline(np.zeros((0, 3))).tolist() == []
+    # Identical rows share their result
+    costs = np.array([[1.0, 2.0], [1.0, 2.0], [2.0, 1.0], [2.0, 2.0]])
+    assert skyline(costs).tolist() == [True, True, True, False]
+    # Missing values were mapped to infinity and only lose to present ones
+    costs = np.array([[np.inf, 1.0], [np.inf, 1.0], [np.inf, 2.0], [5.0, np.inf]])
+    assert skyline(costs).tolist() == [True, True, False, True]
+
+
+def random_sensors(rng, count):
+    df = pd.DataFrame(
+        rng.integers(0, 5, (count, len(ATTRIBUTES))).astype(float), columns=ATTRIBUTES
+    )
+    df = df.mask(rng.random(df.shape) < 0.15)
+    # A column with no values at all
+    df['weight'] = np.nan
+    return df
+
+
+def directed_costs(df):
+    costs = df[ATTRIBUTES].to_numpy(dtype=float, copy=True)
+    costs[:, :2] = -costs[:, :2]
+    return np.where(np.isnan(costs), np.inf, costs)
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_pareto_front_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    df = random_sensors(rng, 200)
+    costs = directed_costs(df)
+    np.testing.assert_array_equal(pareto_front(df, ATTRIBUTES), brute_force(costs))
+
+    present = ~df[ATTRIBUTES[:4]].isna().any(axis=1).to_numpy()
+    expected = np.zeros(len(df), dtype=bool)
+    expected[present] = brute_force(costs[present, :4])
+    np.testing.assert_array_equal(
+        pareto_front(df, ATTRIBUTES[:4], drop_missing=True), expected
+    )
+    # Every sensor misses its weight
+    assert not pareto_front(df, ATTRIBUTES, drop_missing=True).any()
+
+
+def test_pareto_front_rejects_unknown_attributes():
+    df = pd.DataFrame({'frame_rate': [1.0], 'sensor_type': ['lidar']})
+    with pytest.raises(KeyError):
+        pareto_front(df, ['frame_rate', 'latency'])
+    with pytest.raises(ValueError):
+        pareto_front(df, ['frame_rate', 'sensor_type'])
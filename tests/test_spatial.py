@@ -0,0 +1,149 @@
+# tests/test_spatial.py
+
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+
+from sensor_tool.catalog import SensorCatalog  # noqa: E402
+from sensor_tool.spatial import (  # noqa: E402
+    extract_image_size,
+    image_sizes,
+    range_grid,
+    spatial_resolution,
+)
+
+
+@pytest.fixture(scope='module')
+def catalog():
+    return SensorCatalog(os.path.join(REPO_ROOT, 'sensors'))
+
+
+@pytest.mark.parametrize('resolution, modality, expected', [
+    ({'rgb': {'width': 1920, 'height': 1080}}, 'rgb', (1920, 1080)),
+    ({'rgb': {'width': 1920, 'height': 1080}}, 'depth', (np.nan, np.nan)),
+    ({'depth': '1280x720 (binned)'}, 'depth', (1280, 720)),
+    ('1920x1200 (side-by-side)', 'depth', (1920, 1200)),
+    ('2208x1242 (max)', 'rgb', (2208, 1242)),
+    ('640 × 480', 'rgb', (640, 480)),
+    ({'rgb': {'width': 'n/a', 'height': 1080}}, 'rgb', (np.nan, np.nan)),
+    ('VGA', 'rgb', (np.nan, np.nan)),
+    (None, 'rgb', (np.nan, np.nan)),
+])
+def test_extract_image_size(resolution, modality, expected):
+    np.testing.assert_array_equal(extract_image_size(resolution, modality), expected)
+
+
+def test_image_sizes_prefer_the_depth_stream():
+    width, height = image_sizes([
+        {
+            'rgb': {'width': 1920, 'height': 1080},
+            'depth': {'width': 640, 'height': 480},
+        },
+        {'rgb': {'width': 1920, 'height': 1080}},
+        '2208x1242 (max)',
+        {},
+    ])
+    np.testing.assert_array_equal(width, [640, 1920, 2208, np.nan])
+    np.testing.assert_array_equal(height, [480, 1080, 1242, np.nan])
+
+
+def test_range_grid():
+    grid = range_grid([0.5, 1.0, np.nan], [2.5, 1.0, 3.0], steps=3)
+    np.testing.assert_allclose(grid[0], [0.5, 1.5, 2.5])
+    np.testing.assert_allclose(grid[1], [1.0, 1.0, 1.0])
+    assert np.isnan(grid[2]).all()
+
+
+def pinhole(width, height, horizontal_fov, vertical_fov, distance):
+    patch_width = 2 * distance * math.tan(math.radians(horizontal_fov) / 2)
+    patch_height = 2 * distance * math.tan(math.radians(vertical_fov) / 2)
+    return 1000 * patch_width / width, width * height / (patch_width * patch_height)
+
+
+def test_spatial_resolution_matches_a_pinhole_model():
+    width = [1280.0, 1920.0, 1024.0, 640.0]
+    height = [720.0, 1080.0, 64.0, 480.0]
+    horizontal = [87.0, 90.0, 360.0, 60.0]
+    # The last vertical field of view follows from the aspect ratio
+    vertical = [58.0, 60.0, 45.0, np.nan]
+    distances = [[0.5, 2.0], [1.0, 3.0], [1.0, 2.0], [0.0, 2.0]]
+    metrics = spatial_resolution(width, height, horizontal, vertical, distances)
+
+    np.testing.assert_allclose(
+        metrics['pixels_per_degree'], np.divide(width, horizontal)
+    )
+    for i in range(2):
+        for j, distance in enumerate(distances[i]):
+            mm, points = pinhole(
+                width[i], height[i], horizontal[i], vertical[i], distance
+            )
+            assert metrics['mm_per_pixel'][i, j] == pytest.approx(mm)
+            assert metrics['points_per_m2'][i, j] == pytest.approx(points)
+    # A spinning lidar has no flat footprint
+    assert np.isnan(metrics['mm_per_pixel'][2]).all()
+    # Square pixels: a 4:3 image with 60 degrees across
+    derived = math.degrees(2 * math.atan(math.tan(math.radians(30)) * 480 / 640))
+    mm, points = pinhole(640, 480, 60, derived, 2.0)
+    assert np.isnan(metrics['mm_per_pixel'][3, 0])
+    assert metrics['mm_per_pixel'][3, 1] == pytest.approx(mm)
+    assert metrics['points_per_m2'][3, 1] == pytest.approx(points)
+
+
+def test_catalog_parses_resolution_strings(catalog):
+    # ZED cameras give their resolution as a "WxH (note)" string
+    data = catalog.data.set_index('sensor_id')
+    for sensor_id, (width, height) in [
+        ('stereolabs_zed_x', (1920, 1200)),
+        ('stereolabs_zed_mini', (2208, 1242)),
+    ]:
+        sensor = data.loc[sensor_id]
+        mm, points = pinhole(
+            width, height, sensor['horizontal_fov'], sensor['vertical_fov'],
+            sensor['max_range'],
+        )
+        assert sensor['pixels_per_degree'] == pytest.approx(
+            width / sensor['horizontal_fov']
+        )
+        assert sensor['mm_per_pixel_at_max_range'] == pytest.approx(mm)
+        assert sensor['points_per_m2_at_max_range'] == pytest.approx(points)
+
+
+def test_catalog_spatial_spans_the_range(catalog):
+    sensor_ids = ['intel_realsense_d435i', 'stereolabs_zed_x']
+    metrics = catalog.spatial(sensor_ids, steps=4)
+    assert metrics['sensor_id'].tolist() == [sensor_ids[0]] * 4 + [sensor_ids[1]] * 4
+    assert metrics['in_range'].all()
+    data = catalog.data.set_index('sensor_id')
+    for sensor_id, rows in metrics.groupby('sensor_id'):
+        sensor = data.loc[sensor_id]
+        assert rows['distance_m'].iloc[0] == pytest.approx(sensor['min_range'])
+        assert rows['distance_m'].iloc[-1] == pytest.approx(sensor['max_range'])
+        # The grid ends are the precomputed attributes
+        for bound, row in [('min_range', 0), ('max_range', -1)]:
+            assert rows['mm_per_pixel'].iloc[row] == pytest.approx(
+                sensor[f'mm_per_pixel_at_{bound}']
+            )
+            assert rows['points_per_m2'].iloc[row] == pytest.approx(
+                sensor[f'points_per_m2_at_{bound}']
+            )
+        # Pixels grow linearly with distance
+        assert np.all(np.diff(rows['mm_per_pixel']) > 0)
+
+
+def test_catalog_spatial_at_given_distances(catalog):
+    metrics = catalog.spatial(['stereolabs_zed_mini'], distances=[0.05, 2.0, 30.0])
+    assert metrics['in_range'].tolist() == [False, True, False]
+    mm, _ = pinhole(2208, 1242, 102, 57, 2.0)
+    assert metrics['mm_per_pixel'][1] == pytest.approx(mm)
+    with pytest.raises(ValueError):
+        catalog.spatial(['stereolabs_zed_mini'], distances=[0.0])
+    with pytest.raises(ValueError):
+        catalog.spatial(['stereolabs_zed_mini'], steps=1)
+    with pytest.raises(KeyError):
+        catalog.spatial(['zed_3'])
@@ -0,0 +1,112 @@
+# tests/test_sqlite_store.py
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+
+from sensor_tool.data_loader import DataLoader  # noqa: E402
+from sensor_tool.export_sensors import get_export_columns, normalize_chunk  # noqa: E402
+from sensor_tool.filter_sensors import apply_filters  # noqa: E402
+from sensor_tool.sqlite_store import (  # noqa: E402
+    LIST_TABLES,
+    SQLiteCatalog,
+    export_sqlite,
+    filter_clause,
+)
+
+# Manufacturers with LIKE wildcards, and ones those wildcards would match
+EXTRA_MANUFACTURERS = ['100%_Vision', '1000 Vision', 'A_B Optics', 'AxB Optics']
+
+CRITERIA = [
+    {},
+    {'sensor_type': 'stereo'},
+    {'sensor_type': 'Camera', 'manufacturer': 'mech'},
+    {'manufacturer': 'intel', 'min_frame_rate': 30},
+    {'min_frame_rate': 1.25, 'max_frame_rate': 100},
+    {'min_price': 799, 'max_price': 9999},
+    {'min_fov': 61.400326, 'max_fov': 91.2},
+    {'min_resolution': 2304000},
+    {'min_pixels_per_degree': 27.5, 'max_mm_per_pixel': 15},
+    {'ros_compatibility': 'ROS1'},
+    {'ros_compatibility': 'ROS2', 'manufacturer': 'vision'},
+    {'sensor_type': 'structured light', 'max_price': 12000, 'min_frame_rate': 12},
+]
+
+
+@pytest.fixture(scope='module')
+def catalog(tmp_path_factory):
+    """The repository's sensors plus a few with wildcard characters."""
+    column_types = get_export_columns()
+    raw = DataLoader(os.path.join(REPO_ROOT, 'sensors')).load_sensor_data()
+    flat = normalize_chunk(raw, column_types)
+    extra = pd.concat([flat.iloc[[0]]] * len(EXTRA_MANUFACTURERS), ignore_index=True)
+    extra['sensor_id'] = [f'extra_{i}' for i in range(len(extra))]
+    extra['manufacturer'] = EXTRA_MANUFACTURERS
+    extra['ros_compatibility'] = [['ROS2']] * len(extra)
+    flat = pd.concat([flat, extra], ignore_index=True)
+
+    path = str(tmp_path_factory.mktemp('sqlite') / 'sensors.db')
+    # Several chunks, as `export_sensors` writes them
+    chunks = (flat.iloc[start : start + 4] for start in range(0, len(flat), 4))
+    assert export_sqlite(path, chunks, column_types) == len(flat)
+    return flat, SQLiteCatalog(path)
+
+
+@pytest.mark.parametrize('criteria', CRITERIA)
+def test_sql_filters_match_apply_filters(criteria, catalog):
+    flat, sqlite_catalog = catalog
+    expected = apply_filters(flat, **criteria)['sensor_id'].tolist()
+    found = sqlite_catalog.filter(['sensor_id'], **criteria)['sensor_id'].tolist()
+    assert sorted(found) == sorted(expected)
+    assert sqlite_catalog.count(**criteria) == len(expected)
+
+
+@pytest.mark.parametrize('manufacturer, expected', [
+    ('%', ['100%_Vision']),
+    ('_', ['100%_Vision', 'A_B Optics']),
+    ('0%_v', ['100%_Vision']),
+    ('a_b', ['A_B Optics']),
+    ('\\', []),
+])
+def test_like_wildcards_are_literal(manufacturer, expected, catalog):
+    _, sqlite_catalog = catalog
+    found = sqlite_catalog.filter(['manufacturer'], manufacturer=manufacturer)
+    assert sorted(found['manufacturer']) == expected
+
+
+def test_no_matches_give_an_empty_frame(catalog):
+    _, sqlite_catalog = catalog
+    df = sqlite_catalog.filter(['sensor_id', 'price_avg', 'tags'], max_price=1)
+    assert df.empty
+    assert list(df.columns) == ['sensor_id', 'price_avg', 'tags']
+    assert df['price_avg'].dtype == float
+    assert sqlite_catalog.count(manufacturer='No Such Maker') == 0
+
+
+def test_round_trip_keeps_values_and_lists(catalog):
+    flat, sqlite_catalog = catalog
+    df = sqlite_catalog.filter()
+    assert df['sensor_id'].tolist() == flat['sensor_id'].tolist()
+    np.testing.assert_allclose(df['price_avg'], flat['price_avg'])
+    np.testing.assert_allclose(df['pixels_per_degree'], flat['pixels_per_degree'])
+    for field in LIST_TABLES:
+        expected = [x if isinstance(x, list) else [] for x in flat[field]]
+        assert df[field].tolist() == [[str(v) for v in x] for x in expected]
+    with pytest.raises(ValueError):
+        sqlite_catalog.filter(['no_such_column'])
+
+
+def test_filter_clause():
+    assert filter_clause() == ('', [])
+    clause, params = filter_clause(manufacturer='50%', min_price=10, max_fov=90)
+    assert clause == (
+        "WHERE manufacturer LIKE ? ESCAPE '\\' AND price_avg >= ? "
+        "AND field_of_view <= ?"
+    )
+    assert params == ['%50\\%%', 10, 90]
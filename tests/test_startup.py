@@ -0,0 +1,88 @@
+# tests/test_startup.py
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+HEAVY_MODULES = ('matplotlib', 'tkinter', '_tkinter', 'customtkinter')
+
+RUN_COMMAND = '''
+import json, sys, time
+start = time.perf_counter()
+sys.argv = ['sensor-tool-cli'] + {argv!r}
+from sensor_tool.cli import main
+try:
+    main()
+except SystemExit:
+    pass
+elapsed = time.perf_counter() - start
+heavy = sorted(m for m in sys.modules if m.split('.')[0] in {heavy!r})
+print(json.dumps({{'elapsed': elapsed, 'heavy': heavy}}))
+'''
+
+
+def run_cli(argv):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [os.path.join(REPO_ROOT, 'src'), env.get('PYTHONPATH', '')]
+    )
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-c', RUN_COMMAND.format(argv=argv, heavy=HEAVY_MODULES)],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True,
+    )
+    wall_time = time.perf_counter() - start
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    report['wall_time'] = wall_time
+    return report
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('argv', [
+    ['validate'],
+    ['filter', '--manufacturer', 'Intel'],
+])
+def test_light_commands_skip_plotting_and_gui(argv):
+    report = run_cli(argv)
+    print(f"{' '.join(argv)}: {report['elapsed'] * 1000:.0f} ms in main, "
+          f"{report['wall_time'] * 1000:.0f} ms wall")
+    assert report['heavy'] == [], \
+        f"'{argv[0]}' imported {', '.join(report['heavy'])}"
+
+
+@pytest.mark.benchmark
+def test_package_import_is_lazy():
+    report = run_cli([])
+    assert report['heavy'] == [], \
+        f"'import sensor_tool' imported {', '.join(report['heavy'])}"
+
+
+@pytest.mark.parametrize('first_import', [
+    'sensor_tool.catalog',
+    'sensor_tool.compact',
+    'sensor_tool.export_sensors',
+])
+def test_package_functions_survive_submodule_imports(first_import):
+    # Run in a fresh interpreter, so no other test has imported the package
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [os.path.join(REPO_ROOT, 'src'), env.get('PYTHONPATH', '')]
+    )
+    code = (
+        f'import {first_import}\n'
+        'import sensor_tool\n'
+        'from sensor_tool import export_sensors, filter_sensors\n'
+        'assert callable(sensor_tool.filter_sensors), sensor_tool.filter_sensors\n'
+        'assert callable(sensor_tool.export_sensors), sensor_tool.export_sensors\n'
+        'assert callable(filter_sensors) and callable(export_sensors)\n'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
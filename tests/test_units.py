@@ -0,0 +1,109 @@
+# tests/test_units.py
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+
+from sensor_tool.export_sensors import get_export_columns, normalize_chunk  # noqa: E402
+from sensor_tool.units import (  # noqa: E402
+    DEFAULT_CONVERSIONS,
+    normalize_units,
+    original_labels,
+)
+
+SENSOR_PATH = os.path.join(
+    REPO_ROOT, 'sensors', 'cameras', 'intel', 'realsense_d435i.yaml'
+)
+
+# (power, power unit, weight, weight unit, price, currency)
+MIXED_INPUTS = [
+    (1.5, 'W', 72.0, 'g', 249.0, 'USD'),
+    (500.0, 'mW', 0.25, 'kg', 100.0, 'EUR'),
+    ('750 mW', 'W', 1.2, 'kg', 300.0, 'USD'),
+]
+
+# (power in W, weight in g, price in USD)
+CANONICAL = [(1.5, 72.0, 249.0), (0.5, 250.0, 108.0), (0.75, 1200.0, 300.0)]
+
+# (power, power unit, weight, weight unit, price, currency) as given
+ORIGINAL = [
+    (1.5, 'W', 72.0, 'g', 249.0, 'USD'),
+    (500.0, 'mW', 0.25, 'kg', 100.0, 'EUR'),
+    (750.0, 'mW', 1.2, 'kg', 300.0, 'USD'),
+]
+
+
+def mixed_sensors():
+    with open(SENSOR_PATH) as f:
+        sensor = yaml.safe_load(f)
+    sensors = []
+    for i, (power, power_unit, weight, weight_unit, price, currency) in enumerate(
+        MIXED_INPUTS
+    ):
+        sensors.append({
+            **sensor,
+            'sensor_id': f'sensor_{i}',
+            'power_consumption': power,
+            'power_consumption_unit': power_unit,
+            'weight': weight,
+            'weight_unit': weight_unit,
+            'price_avg': price,
+            'price_range': {
+                'min_price': price, 'max_price': price, 'currency': currency
+            },
+        })
+    return pd.DataFrame(sensors)
+
+
+def check_units(df):
+    canonical = df[['power_consumption', 'weight', 'price_avg']].to_numpy(float)
+    np.testing.assert_allclose(canonical, CANONICAL)
+    assert df['power_consumption_unit'].tolist() == ['W'] * 3
+    assert df['weight_unit'].tolist() == ['g'] * 3
+    original = df[[
+        'power_consumption_original',
+        'power_consumption_original_unit',
+        'weight_original',
+        'weight_original_unit',
+        'price_avg_original',
+        'price_avg_original_unit',
+    ]]
+    assert [tuple(row) for row in original.itertuples(index=False)] == ORIGINAL
+
+
+def test_normalize_units_keeps_original_values():
+    df = normalize_units(
+        mixed_sensors(),
+        ['power_consumption', 'weight', 'price_avg'],
+        DEFAULT_CONVERSIONS,
+    )
+    check_units(df)
+    assert original_labels(df, 'power_consumption') == ['', '500 mW', '750 mW']
+    assert original_labels(df, 'price_avg') == ['', '100 EUR', '']
+    assert original_labels(df, 'latency') == ['', '', '']
+
+
+def test_export_keeps_original_values():
+    column_types = get_export_columns()
+    assert column_types['weight_original'] == 'float'
+    assert column_types['weight_original_unit'] == 'string'
+    raw = mixed_sensors().drop(columns='price_avg')
+    check_units(normalize_chunk(raw, column_types))
+
+
+def test_unknown_units_are_left_out():
+    df = pd.DataFrame({
+        'power_consumption': [2.0, 3.0],
+        'power_consumption_unit': ['W', 'hp'],
+    })
+    df = normalize_units(df, ['power_consumption'], DEFAULT_CONVERSIONS)
+    assert df['power_consumption'].tolist()[0] == pytest.approx(2.0)
+    assert np.isnan(df['power_consumption'].tolist()[1])
+    assert df['power_consumption_original_unit'].tolist() == ['W', 'hp']